@@ -0,0 +1,234 @@
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional, TextIO
+
+import pandas as pd
+
+from config.logging_config import setup_logging
+from config.settings import settings, expected_columns
+from core.filters import FilterEngine
+from core.search import SearchEngine, SearchResult
+from data.data_loader import load_database
+
+logger = logging.getLogger(__name__)
+
+CSV_FIELDS = [
+    "query_index", "query", "column", "match_type", "rank", "score",
+    "reporter_citation", "citation", "case_name", "date", "file_path", "duration_ms",
+]
+
+
+@dataclass
+class BatchQuery:
+    index: int
+    column: str
+    query: str
+
+
+def read_queries(path: Path, default_column: str) -> List[BatchQuery]:
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            reader = csv.DictReader(f)
+            if not reader.fieldnames or "query" not in reader.fieldnames:
+                raise ValueError(f"CSV query file '{path}' needs a 'query' column")
+            rows = [(r.get("column") or default_column, r["query"]) for r in reader]
+        else:
+            rows = [(default_column, line) for line in f.read().splitlines()]
+
+    queries = []
+    for column, query in rows:
+        query = (query or "").strip()
+        if query and not query.startswith("#"):
+            queries.append(BatchQuery(index=len(queries), column=column.strip(), query=query))
+    return queries
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected a YYYY-MM-DD date, got '{value}'")
+
+
+def _matches(result: SearchResult, max_matches: int, include_fuzzy: bool) -> Iterator[Dict]:
+    positions = result.total_positions if include_fuzzy else result.exact_positions
+    scores = result.scores
+    data = result.source
+    columns = [c for c in expected_columns() if c in data.columns]
+    for rank, (position, score) in enumerate(zip(positions[:max_matches], scores[:max_matches]), start=1):
+        row = data.iloc[position]
+        match = {
+            "match_type": "exact" if rank <= result.exact_count else "fuzzy",
+            "rank": rank,
+            "score": int(score),
+        }
+        for column in columns:
+            value = row[column]
+            match[column] = "" if pd.isna(value) else str(value)
+        yield match
+
+
+class BatchWriter:
+    def __init__(self, out: TextIO, fmt: str, max_matches: int, include_fuzzy: bool):
+        self.out = out
+        self.fmt = fmt
+        self.max_matches = max_matches
+        self.include_fuzzy = include_fuzzy
+        self._csv = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            self._csv.writeheader()
+
+    def write(self, query: BatchQuery, result: SearchResult) -> None:
+        duration_ms = round(result.duration * 1000, 3)
+        matches = list(_matches(result, self.max_matches, self.include_fuzzy)) if result.success else []
+
+        if self.fmt == "jsonl":
+            record = {
+                "query_index": query.index,
+                "query": query.query,
+                "column": query.column,
+                "success": result.success,
+                "message": result.message,
+                "exact_count": result.exact_count,
+                "fuzzy_count": result.fuzzy_count,
+                "duration_ms": duration_ms,
+                "timings_ms": {k: round(v * 1000, 3) for k, v in result.timings.items()},
+                "counts": result.counts,
+                "matches": matches,
+            }
+            self.out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            base = {"query_index": query.index, "query": query.query, "column": query.column,
+                    "duration_ms": duration_ms}
+            if not matches:
+                self._csv.writerow({**base, "match_type": "none" if result.success else "error",
+                                    "citation": "" if result.success else result.message})
+            for match in matches:
+                self._csv.writerow({**base, **match})
+        self.out.flush()
+
+
+def run_batch(
+    data,
+    queries: List[BatchQuery],
+    writer: BatchWriter,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    workers: int = 1,
+    fuzzy_workers: int = 0,
+) -> Dict[str, float]:
+    engine = SearchEngine(
+        fuzzy_threshold=settings.fuzzy_search_threshold,
+        fuzzy_limit=settings.fuzzy_search_limit,
+        fuzzy_workers=fuzzy_workers,
+    )
+    filters = FilterEngine()
+    filters.set_source_data(data)
+    rows = filters.date_window(from_date, to_date)
+    if rows is not None:
+        logger.info(f"Date bounds keep {rows.count()} of {len(data)} rows")
+
+    for column in sorted({q.column for q in queries}):
+        if column in data.columns:
+            engine.warm(data, column)
+
+    def search(query: BatchQuery) -> SearchResult:
+        start = perf_counter()
+        result = engine.search(
+            data,
+            query.column,
+            query.query,
+            min_query_length=settings.min_query_length_for_fuzzy,
+            max_exact_before_fuzzy=settings.max_exact_matches_before_fuzzy,
+            rows=rows,
+        )
+        result.duration = perf_counter() - start
+        return result
+
+    start = perf_counter()
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for query, result in zip(queries, executor.map(search, queries)):
+            failed += not result.success
+            writer.write(query, result)
+    elapsed = perf_counter() - start
+
+    engine.set_fuzzy_workers(0)
+    return {
+        "queries": len(queries),
+        "failed": failed,
+        "elapsed_s": elapsed,
+        "queries_per_s": len(queries) / elapsed if elapsed else 0.0,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run a file of queries against the case database without the GUI")
+    parser.add_argument("queries", type=Path, help="Text file with one query per line, or CSV with 'query' and optional 'column'")
+    parser.add_argument("--database", default=settings.database_path, help="Excel database (defaults to the configured one)")
+    parser.add_argument("--column", default="citation", choices=expected_columns(), help="Column searched when the query file does not name one")
+    parser.add_argument("--from-date", type=_parse_date, default=None, help="Only search cases decided on or after YYYY-MM-DD")
+    parser.add_argument("--to-date", type=_parse_date, default=None, help="Only search cases decided on or before YYYY-MM-DD")
+    parser.add_argument("--output", type=Path, default=None, help="Results file (stdout if omitted)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="Defaults to the output file extension, else csv")
+    parser.add_argument("--max-matches", type=int, default=25, help="Matches written per query")
+    parser.add_argument("--exact-only", action="store_true", help="Leave fuzzy matches out of the output")
+    parser.add_argument("--workers", type=int, default=1, help="Queries searched concurrently")
+    parser.add_argument("--fuzzy-workers", type=int, default=settings.fuzzy_workers, help="Processes used for fuzzy scoring (0 = in-process)")
+    parser.add_argument("--log-level", default="WARNING", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    args = parser.parse_args(argv)
+
+    setup_logging(log_file="batch_search.log", log_level=args.log_level)
+
+    fmt = args.format or ("jsonl" if args.output and args.output.suffix.lower() in (".jsonl", ".json") else "csv")
+    try:
+        queries = read_queries(args.queries, args.column)
+    except (OSError, ValueError) as e:
+        print(f"Could not read queries: {e}", file=sys.stderr)
+        return 2
+
+    load_start = perf_counter()
+    try:
+        data = load_database(args.database)
+    except Exception as e:
+        print(f"Could not load database: {e}", file=sys.stderr)
+        return 2
+    print(f"Loaded {len(data):,} cases in {perf_counter() - load_start:.1f}s; running {len(queries)} queries", file=sys.stderr)
+
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        writer = BatchWriter(out, fmt, max_matches=args.max_matches, include_fuzzy=not args.exact_only)
+        summary = run_batch(
+            data,
+            queries,
+            writer,
+            from_date=args.from_date,
+            to_date=args.to_date,
+            workers=args.workers,
+            fuzzy_workers=args.fuzzy_workers,
+        )
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(
+        f"{summary['queries']} queries in {summary['elapsed_s']:.2f}s "
+        f"({summary['queries_per_s']:.1f}/s), {summary['failed']} failed",
+        file=sys.stderr,
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
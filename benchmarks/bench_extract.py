@@ -0,0 +1,141 @@
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SURNAMES
+from core.charset import read_html
+from core.extractors import EXTRACTORS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOCUMENTS = 200
+DEFAULT_REPEAT = 3
+REFERENCE = "bs4"
+
+SENTENCES = [
+    "The trial court did not err in denying the motion to suppress.",
+    "We review the grant of summary judgment de novo, viewing the evidence in the light most favorable to the nonmovant.",
+    "Because the appellant failed to preserve this enumeration for appellate review, we do not reach it.",
+    "The judgment is affirmed in part and reversed in part, and the case is remanded with direction.",
+    "Under OCGA § 9-11-56 (c), summary judgment is proper when there is no genuine issue of material fact.",
+    "The evidence was sufficient to authorize a rational trier of fact to find the defendant guilty beyond a reasonable doubt.",
+    "This enumeration is without merit.",
+    "See id. at 412 (2); compare Brown v. State, 290 Ga. 865, 868 (725 SE2d 320) (2012).",
+]
+
+
+def _paragraph(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(3, 9)):
+        sentence = rng.choice(SENTENCES)
+        roll = rng.random()
+        if roll < 0.1:
+            sentence = f"<i>{rng.choice(SURNAMES)} v. {rng.choice(SURNAMES)}</i>, {sentence}"
+        elif roll < 0.15:
+            sentence = sentence.replace("§", "&#167;").replace(" v. ", "&nbsp;v.&nbsp;")
+        elif roll < 0.2:
+            sentence += f"<sup><a href=\"#fn{rng.randint(1, 40)}\">{rng.randint(1, 40)}</a></sup>"
+        parts.append(sentence)
+    return "<p>" + "  ".join(parts) + "</p>"
+
+
+def synthetic_opinion(rng: random.Random, paragraphs: int) -> str:
+    plaintiff, defendant = rng.choice(SURNAMES), rng.choice(SURNAMES)
+    body = "\n".join(_paragraph(rng) for _ in range(paragraphs))
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+        f"<title>{plaintiff} v. {defendant}</title>"
+        "<style>body { font-family: serif; } .fn { font-size: 80%; }</style>"
+        "<script>window.dataLayer = window.dataLayer || [];</script></head>\n<body>\n"
+        f"<h1>{plaintiff} v. {defendant}</h1>\n<center>Court of Appeals of Georgia</center><br>\n"
+        "<!-- headnotes omitted -->\n"
+        f"<div class=\"opinion\">\n{body}\n</div>\n"
+        "<pre>  Judgment affirmed.\n  All the Judges concur.</pre>\n"
+        "</body></html>"
+    )
+
+
+def load_corpus(corpus_dir: Optional[Path], documents: int, seed: int) -> List[Tuple[str, str]]:
+    if corpus_dir is not None:
+        paths = sorted(p for p in corpus_dir.rglob("*") if p.suffix.lower() in (".html", ".htm"))
+        if not paths:
+            raise SystemExit(f"No .html files under {corpus_dir}")
+        paths = random.Random(seed).sample(paths, min(documents, len(paths)))
+        return [(p.name, read_html(p)) for p in paths]
+    rng = random.Random(seed)
+    return [(f"synthetic-{i}", synthetic_opinion(rng, rng.randint(5, 120))) for i in range(documents)]
+
+
+def check_parity(corpus: List[Tuple[str, str]]) -> Dict[str, List[str]]:
+    mismatches: Dict[str, List[str]] = {}
+    for name, raw in corpus:
+        expected = EXTRACTORS[REFERENCE](raw)
+        for backend, extract in EXTRACTORS.items():
+            if backend != REFERENCE and extract(raw) != expected:
+                mismatches.setdefault(backend, []).append(name)
+    return mismatches
+
+
+def _time(extract: Callable[[str], str], corpus: List[Tuple[str, str]], repeat: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _, raw in corpus:
+            extract(raw)
+        samples.append(perf_counter() - start)
+    total = statistics.median(samples)
+    return {"total_s": total, "ms_per_doc": total / len(corpus) * 1000}
+
+
+def run(corpus: List[Tuple[str, str]], repeat: int) -> List[Dict]:
+    size_mb = sum(len(raw) for _, raw in corpus) / 1e6
+    print(f"{len(corpus)} documents, {size_mb:.1f}M chars", flush=True)
+    results: List[Dict] = []
+    for backend, extract in EXTRACTORS.items():
+        row = {"backend": backend, **_time(extract, corpus, repeat)}
+        row["mb_per_s"] = size_mb / row["total_s"]
+        results.append(row)
+        print(f"{backend:<8} {row['ms_per_doc']:8.2f}ms/doc  {row['mb_per_s']:6.2f}M chars/s", flush=True)
+    reference = next(r for r in results if r["backend"] == REFERENCE)
+    for row in results:
+        row["speedup"] = reference["total_s"] / row["total_s"]
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="HTML-to-text extractor parity check and benchmark")
+    parser.add_argument("--corpus", type=Path, default=None, help="Directory of case .html files (synthetic opinions if omitted)")
+    parser.add_argument("--documents", type=int, default=DEFAULT_DOCUMENTS)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    corpus = load_corpus(args.corpus, args.documents, args.seed)
+
+    mismatches = check_parity(corpus)
+    for backend, names in mismatches.items():
+        logger.error(f"{backend} differs from {REFERENCE} on {len(names)} documents, e.g. {names[:5]}")
+    if not mismatches:
+        print(f"Parity: all backends match {REFERENCE} on every document", flush=True)
+
+    results = run(corpus, args.repeat)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"results": results, "mismatches": mismatches}, f, indent=2)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
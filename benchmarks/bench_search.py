@@ -0,0 +1,314 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import load_or_generate
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [10_000, 100_000, 500_000]
+DEFAULT_REPEAT = 5
+REGRESSION_THRESHOLD = 0.20
+
+EXACT_QUERIES = [("case_name", "Smith"), ("citation", "Ga. App."), ("reporter_citation", "312 Ga. 4")]
+FUZZY_QUERIES = [("case_name", "Mcfaden v. Deprtment of Human Servces"), ("case_name", "Robinsn v. Citty of Atlanta")]
+SORT_COLUMNS = ["date", "case_name", "reporter_citation"]
+APPLY_MAX_ROWS = 100_000
+DATE_WINDOWS = [(date(1990, 1, 1), date(1999, 12, 31)), (date(2015, 6, 1), None), (None, date(1900, 1, 1))]
+
+
+def _time(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    start = perf_counter()
+    fn()
+    cold = perf_counter() - start
+
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        samples.append(perf_counter() - start)
+
+    samples.sort()
+    return {
+        "cold_s": cold,
+        "min_s": samples[0],
+        "median_s": statistics.median(samples),
+        "mean_s": statistics.fmean(samples),
+        "p95_s": samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))],
+        "repeat": repeat,
+    }
+
+
+def _bench_engine(data: pd.DataFrame, repeat: int) -> List[Dict]:
+    from core.search import SearchEngine
+    from config.settings import settings
+
+    rows: List[Dict] = []
+    for column, query in EXACT_QUERIES:
+        engine = SearchEngine(settings.fuzzy_search_threshold, settings.fuzzy_search_limit)
+        result = engine.search(data, column, query, max_exact_before_fuzzy=0)
+        timing = _time(lambda: engine.search(data, column, query, max_exact_before_fuzzy=0), repeat)
+        rows.append({"case": "exact", "column": column, "query": query,
+                     "matches": len(result.exact_positions), **timing})
+
+    for column, query in FUZZY_QUERIES:
+        engine = SearchEngine(settings.fuzzy_search_threshold, settings.fuzzy_search_limit)
+        result = engine.search(data, column, query, max_exact_before_fuzzy=10 ** 9)
+        timing = _time(lambda: engine.search(data, column, query, max_exact_before_fuzzy=10 ** 9), repeat)
+        rows.append({"case": "fuzzy", "column": column, "query": query,
+                     "matches": result.fuzzy_count, **timing})
+    return rows
+
+
+# The row-by-row date filter the interval index replaced, kept as the reference it is checked against.
+def _compute_case_date_range(year, month, day) -> Tuple[Optional[date], Optional[date], bool]:
+    try:
+        if pd.isna(year):
+            return (None, None, True)
+
+        year = int(year)
+
+        if pd.isna(month):
+            return (date(year, 1, 1), date(year, 12, 31), False)
+
+        month = int(month)
+        if not 1 <= month <= 12:
+            return (date(year, 1, 1), date(year, 12, 31), False)
+
+        if pd.isna(day):
+            first_day = date(year, month, 1)
+            last_day = _last_day_of_month(year, month)
+            return (first_day, last_day, False)
+
+        day = int(day)
+        complete_date = date(year, month, day)
+        return (complete_date, complete_date, False)
+    except (ValueError, OverflowError):
+        return (None, None, True)
+
+
+def _last_day_of_month(year: int, month: int) -> date:
+    if month == 12:
+        return date(year, 12, 31)
+    return date(year, month + 1, 1) - timedelta(days=1)
+
+
+def _ranges_overlap(case_min: Optional[date], case_max: Optional[date], is_unknown: bool,
+                    filter_min: date, filter_max: date) -> bool:
+    if is_unknown:
+        return True
+    return not (case_max < filter_min or case_min > filter_max)
+
+
+def _apply_date_range_mask(data: pd.DataFrame, from_date: Optional[date], to_date: Optional[date]) -> np.ndarray:
+    from utils.date_filter import MAX_DATE, MIN_DATE
+
+    case_ranges = data.apply(
+        lambda row: _compute_case_date_range(row["year"], row["month"], row["day"]), axis=1, result_type="expand"
+    )
+    case_ranges.columns = ["case_min", "case_max", "is_unknown"]
+    mask = case_ranges.apply(
+        lambda row: _ranges_overlap(row["case_min"], row["case_max"], row["is_unknown"],
+                                    from_date or MIN_DATE, to_date or MAX_DATE),
+        axis=1,
+    )
+    return mask.to_numpy(dtype=bool)
+
+
+def _bench_dates(data: pd.DataFrame, repeat: int) -> List[Dict]:
+    from core.filters import FilterEngine
+    from utils.date_filter import DateIntervalIndex, date_range_mask
+
+    rows: List[Dict] = []
+    timing = _time(lambda: DateIntervalIndex.from_data(data), repeat)
+    rows.append({"case": "date_index_build", "query": "", "matches": len(data), **timing})
+    index = DateIntervalIndex.from_data(data)
+
+    for from_date, to_date in DATE_WINDOWS:
+        label = f"{from_date or '-'}..{to_date or '-'}"
+        mask = date_range_mask(data, from_date=from_date, to_date=to_date)
+        if len(data) <= APPLY_MAX_ROWS:
+            legacy = _apply_date_range_mask(data, from_date, to_date)
+            if not np.array_equal(legacy, mask):
+                logger.error(f"Date index disagrees with apply-based filter for {label}")
+            timing = _time(lambda: _apply_date_range_mask(data, from_date, to_date), min(repeat, 2))
+            rows.append({"case": "date_mask_apply", "query": label, "matches": int(legacy.sum()), **timing})
+
+        timing = _time(lambda: date_range_mask(data, from_date=from_date, to_date=to_date), repeat)
+        rows.append({"case": "date_mask", "query": label, "matches": int(mask.sum()), **timing})
+
+        timing = _time(lambda: index.positions(from_date, to_date), repeat)
+        rows.append({"case": "date_index_query", "query": label, "matches": int(mask.sum()), **timing})
+
+        filters = FilterEngine()
+        filters.set_source_data(data)
+        timing = _time(lambda: filters.date_window(from_date, to_date), repeat)
+        rows.append({"case": "date_bitset_cached", "query": label, "matches": int(mask.sum()), **timing})
+    return rows
+
+
+def _bench_sort(data: pd.DataFrame, repeat: int) -> List[Dict]:
+    from core.sort_keys import SortKeyCache
+
+    rng = np.random.default_rng(0)
+    rows: List[Dict] = []
+    for column in SORT_COLUMNS:
+        cache = SortKeyCache()
+        timing = _time(lambda: (cache.clear_cache(), cache.key(data, column)), repeat)
+        rows.append({"case": "sort_key_build", "column": column, "query": column,
+                     "matches": len(data), **timing})
+
+        for k in (100, len(data) // 4):
+            positions = rng.choice(len(data), size=min(k, len(data)), replace=False)
+            timing = _time(lambda: cache.argsort(data, positions, column), repeat)
+            rows.append({"case": "sort_gather", "column": column, "query": f"{column} ({len(positions)} rows)",
+                         "matches": len(positions), **timing})
+    return rows
+
+
+def _bench_service(data: pd.DataFrame, repeat: int) -> List[Dict]:
+    from PySide6.QtCore import QCoreApplication, QEventLoop
+    from services.search_service import SearchService
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    service = SearchService()
+    service.set_data(data)
+    results = []
+    service.search_complete.connect(results.append)
+
+    def run(column: str, query: str):
+        service._results.clear()
+        results.clear()
+        service.schedule_search(column, query)
+        service._timer.stop()
+        service._execute_search()
+        if not results:
+            # Fuzzy-eligible queries finish on the fuzzy thread and report back through the event loop.
+            loop = QEventLoop()
+            service.search_complete.connect(loop.quit)
+            loop.exec()
+            service.search_complete.disconnect(loop.quit)
+
+    rows: List[Dict] = []
+    windows = [(None, None)] + DATE_WINDOWS[:1]
+    for from_date, to_date in windows:
+        service.set_date_filters(from_date, to_date)
+        for column, query in EXACT_QUERIES[:1] + FUZZY_QUERIES[:1]:
+            timing = _time(lambda: run(column, query), repeat)
+            last = results[-1]
+            rows.append({
+                "case": "service_end_to_end",
+                "column": column,
+                "query": query,
+                "date_window": f"{from_date or '-'}..{to_date or '-'}",
+                "matches": len(last.exact_positions) + last.fuzzy_count,
+                **timing,
+            })
+    app.processEvents()
+    return rows
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _result_key(row: Dict) -> str:
+    return "|".join(str(row.get(k, "")) for k in ("size", "case", "column", "query", "date_window"))
+
+
+def compare(baseline_path: Path, results: List[Dict], threshold: float) -> int:
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {_result_key(r): r for r in json.load(f)["results"]}
+
+    regressions = 0
+    for row in results:
+        old = baseline.get(_result_key(row))
+        if not old or not old.get("median_s"):
+            continue
+        change = row["median_s"] / old["median_s"] - 1.0
+        flag = "REGRESSION" if change > threshold else ""
+        regressions += bool(flag)
+        print(f"{_result_key(row):<90} {old['median_s']:.4f}s -> {row['median_s']:.4f}s ({change:+.0%}) {flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="SearchEngine microbenchmarks over synthetic caselaw tables")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Row counts to generate (10k to 2M)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed repetitions after one cold run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-dir", type=Path, default=None, help="Reuse generated tables between runs")
+    parser.add_argument("--skip", nargs="*", default=[], choices=["engine", "dates", "sort", "service"])
+    parser.add_argument("--output", type=Path, default=Path("bench_results.json"))
+    parser.add_argument("--compare", type=Path, default=None, help="Previous results file to diff against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    results: List[Dict] = []
+    for size in args.sizes:
+        start = perf_counter()
+        data = load_or_generate(size, seed=args.seed, cache_dir=args.cache_dir)
+        print(f"[{size:,} rows] table ready in {perf_counter() - start:.1f}s", flush=True)
+
+        sections = {"engine": _bench_engine, "dates": _bench_dates, "sort": _bench_sort, "service": _bench_service}
+        for name, bench in sections.items():
+            if name in args.skip:
+                continue
+            for row in bench(data, args.repeat):
+                row["size"] = size
+                results.append(row)
+                print(f"  {row['case']:<22} {row.get('query', ''):<40} median {row['median_s']:.4f}s "
+                      f"(cold {row['cold_s']:.4f}s, {row['matches']} matches)", flush=True)
+
+    payload = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.compare is not None:
+        return 1 if compare(args.compare, results, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QHeaderView, QTableView
+
+from benchmarks.synthetic import load_or_generate
+from gui.models.pandas_model import PandasModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [10_000, 100_000]
+DEFAULT_FRAMES = 200
+VIEW_SIZE = (1400, 900)
+
+
+class IlocRowModel(PandasModel):
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        position = self._positions[index.row()]
+        return str(self._source.iloc[position][self._display_columns[index.column()]])
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "frames": len(samples),
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def _bench_scroll(model: PandasModel, frames: int) -> Dict[str, float]:
+    view = QTableView()
+    view.setModel(model)
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    view.setAlternatingRowColors(True)
+    view.resize(*VIEW_SIZE)
+    view.show()
+    QApplication.processEvents()
+
+    bar = view.verticalScrollBar()
+    step = max(1, bar.pageStep() // 2)
+    samples: List[float] = []
+    for _ in range(frames):
+        if bar.value() >= bar.maximum():
+            model.fetchMore()
+            QApplication.processEvents()
+        start = perf_counter()
+        bar.setValue(bar.value() + step)
+        view.viewport().repaint()
+        samples.append(perf_counter() - start)
+
+    view.close()
+    return _summary(samples)
+
+
+def _bench_cells(model: PandasModel, cells: int) -> Dict[str, float]:
+    rows, cols = model.rowCount(), model.columnCount()
+    indices = [model.index(i % rows, (i // rows) % cols) for i in range(min(cells, rows * cols))]
+    start = perf_counter()
+    for index in indices:
+        model.data(index, Qt.DisplayRole)
+        model.data(index, Qt.TextAlignmentRole)
+    elapsed = perf_counter() - start
+    return {"cells": len(indices), "us_per_cell": elapsed / max(1, len(indices)) * 1e6}
+
+
+def run(sizes: List[int], frames: int, seed: int, cache_dir: Optional[Path]) -> List[Dict]:
+    results: List[Dict] = []
+    for n in sizes:
+        data = load_or_generate(n, seed=seed, cache_dir=cache_dir)
+        positions = np.random.default_rng(seed).permutation(n).astype(np.intp)
+        for name, cls in (("array", PandasModel), ("iloc_row", IlocRowModel)):
+            model = cls()
+            start = perf_counter()
+            model.set_results(data, positions)
+            build_s = perf_counter() - start
+            row = {"rows": n, "model": name, "build_s": build_s,
+                   **_bench_scroll(model, frames), **_bench_cells(model, 20_000)}
+            results.append(row)
+            print(f"[{n:,} rows] {name:<9} build {build_s * 1000:7.1f}ms  "
+                  f"frame median {row['median_ms']:6.2f}ms p95 {row['p95_ms']:6.2f}ms max {row['max_ms']:6.2f}ms  "
+                  f"data() {row['us_per_cell']:.2f}us/cell", flush=True)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scroll and repaint benchmark for the results table model (Qt offscreen)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Half-page scroll steps per model")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-dir", type=Path, default=None, help="Reuse generated tables between runs")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    results = run(args.sizes, args.frames, args.seed, args.cache_dir)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"results": results}, f, indent=2)
+    del app
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+import argparse
+import json
+import logging
+import socket
+import statistics
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import data.workers.stream_worker as stream_worker
+from core.llm_clients import ClientManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUESTS = 50
+MOCK_MODEL = "lmstudio-mock"
+
+
+def _sse_body(tokens: int, send_done: bool) -> List[bytes]:
+    events = []
+    for i in range(tokens):
+        chunk = {
+            "id": "mock", "object": "chat.completion.chunk", "created": 0, "model": MOCK_MODEL,
+            "choices": [{"index": 0, "delta": {"content": f"token{i} "}, "finish_reason": None}],
+        }
+        events.append(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+    if send_done:
+        events.append(b"data: [DONE]\n\n")
+    return events
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    lock = threading.Lock()
+    first_token_s = 0.0
+    tokens = 20
+    send_done = True
+
+    def setup(self):
+        super().setup()
+        # Streaming servers disable Nagle; without this, small event writes stall on delayed ACKs.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with _MockHandler.lock:
+            _MockHandler.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        events = _sse_body(self.tokens, self.send_done)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(sum(len(e) for e in events)))
+        self.end_headers()
+        sleep(self.first_token_s)
+        for event in events:
+            self.wfile.write(event)
+            self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_mock_server(port: int, first_token_ms: float, tokens: int, send_done: bool) -> ThreadingHTTPServer:
+    _MockHandler.first_token_s = first_token_ms / 1000
+    _MockHandler.tokens = tokens
+    _MockHandler.send_done = send_done
+    server = ThreadingHTTPServer(("127.0.0.1", port), _MockHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_mode(mode: str, requests: int) -> Dict:
+    ttft: List[float] = []
+    total: List[float] = []
+    shared = ClientManager()
+    connections_before = _MockHandler.connections
+    for _ in range(requests):
+        # "fresh" reproduces the old behaviour of building a client for every brief and chat message.
+        manager = shared if mode == "shared" else ClientManager()
+        stream_worker.llm_clients = manager
+        worker = stream_worker.StreamWorker([{"role": "user", "content": "Brief this case."}], MOCK_MODEL)
+        start = perf_counter()
+        first = None
+        with worker._lease_client() as client:
+            for text in worker._stream_response(client):
+                if first is None and text:
+                    first = perf_counter() - start
+        total.append(perf_counter() - start)
+        if manager is not shared:
+            manager.close()
+        ttft.append(first if first is not None else total[-1])
+    shared.close()
+    return {
+        "mode": mode,
+        "requests": requests,
+        "connections": _MockHandler.connections - connections_before,
+        "ttft_p50_ms": statistics.median(ttft) * 1000,
+        "ttft_p95_ms": sorted(ttft)[int(0.95 * (len(ttft) - 1))] * 1000,
+        "total_p50_ms": statistics.median(total) * 1000,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Time to first token with a fresh vs. a shared LLM client, against a local mock server")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS, help="Streamed requests per mode")
+    parser.add_argument("--port", type=int, default=8798, help="Port for the mock server")
+    parser.add_argument("--first-token-ms", type=float, default=0.0, help="Server-side delay before the first token")
+    parser.add_argument("--tokens", type=int, default=20, help="Tokens streamed per response")
+    parser.add_argument("--no-done", action="store_true",
+                        help="End streams at EOF without the [DONE] sentinel, as the Responses API does")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    server = _start_mock_server(args.port, args.first_token_ms, args.tokens, not args.no_done)
+    stream_worker.LMSTUDIO_BASE_URL = f"http://127.0.0.1:{args.port}/v1"
+    original = stream_worker.llm_clients
+    try:
+        run_mode("shared", 3)
+        results = [run_mode(mode, args.requests) for mode in ("fresh", "shared")]
+    finally:
+        stream_worker.llm_clients = original
+        server.shutdown()
+
+    for row in results:
+        print(f"  {row['mode']:>6}: TTFT p50 {row['ttft_p50_ms']:6.1f}ms  p95 {row['ttft_p95_ms']:6.1f}ms  "
+              f"total p50 {row['total_p50_ms']:6.1f}ms  ({row['connections']} connections for {row['requests']} requests)")
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"first_token_ms": args.first_token_ms, "tokens": args.tokens, "done_sentinel": not args.no_done,
+                       "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+import argparse
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import threading
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.bench_search import DATE_WINDOWS, EXACT_QUERIES, FUZZY_QUERIES
+from core.search_client import SearchClient, SearchServerError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = [1, 4, 16]
+DEFAULT_DURATION_S = 10.0
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))]
+
+
+def _request_mix(fuzzy_share: float, date_share: float, rng: random.Random):
+    queries = FUZZY_QUERIES if rng.random() < fuzzy_share else EXACT_QUERIES
+    column, query = rng.choice(queries)
+    query = query[: rng.randint(min(3, len(query)), len(query))]
+    from_date, to_date = rng.choice(DATE_WINDOWS) if rng.random() < date_share else (None, None)
+    return column, query, from_date, to_date
+
+
+def run_load(
+    url: str, concurrency: int, duration_s: float, fuzzy_share: float, date_share: float, seed: int
+) -> Dict:
+    latencies: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+    deadline = perf_counter() + duration_s
+
+    def worker(index: int):
+        client = SearchClient(url)
+        rng = random.Random(seed + index)
+        local: List[float] = []
+        while perf_counter() < deadline:
+            column, query, from_date, to_date = _request_mix(fuzzy_share, date_share, rng)
+            start = perf_counter()
+            try:
+                result = client.search(column, query, from_date=from_date, to_date=to_date)
+                if not result.success:
+                    raise SearchServerError(result.message)
+            except SearchServerError as e:
+                with lock:
+                    errors.append(str(e))
+                continue
+            local.append(perf_counter() - start)
+        client.close()
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    start = perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = perf_counter() - start
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "elapsed_s": elapsed,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p95_ms": _percentile(latencies, 0.95) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+    }
+
+
+def _start_synthetic_server(n_rows: int, port: int, workers: int) -> str:
+    import asyncio
+    from benchmarks.synthetic import load_or_generate
+    from search_server import SearchServer, serve
+
+    data = load_or_generate(n_rows)
+    server = SearchServer(data, database_path=f"synthetic:{n_rows}", workers=workers)
+    ready = threading.Event()
+    threading.Thread(target=lambda: asyncio.run(serve(server, "127.0.0.1", port, ready)), daemon=True).start()
+    if not ready.wait(timeout=60):
+        raise RuntimeError("Synthetic search server did not start")
+    return f"http://127.0.0.1:{port}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test a running search_server.py (or a synthetic one)")
+    parser.add_argument("--url", default=None, help="Server to test, e.g. http://127.0.0.1:8765")
+    parser.add_argument("--synthetic", type=int, default=None, help="Start an in-process server over N synthetic rows instead")
+    parser.add_argument("--port", type=int, default=8799, help="Port for the synthetic server")
+    parser.add_argument("--server-workers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION_S, help="Seconds per concurrency level")
+    parser.add_argument("--fuzzy-share", type=float, default=0.3, help="Fraction of requests using fuzzy-prone queries")
+    parser.add_argument("--date-share", type=float, default=0.3, help="Fraction of requests with a date window")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    if args.synthetic:
+        url = _start_synthetic_server(args.synthetic, args.port, args.server_workers)
+    elif args.url:
+        url = args.url
+    else:
+        parser.error("pass --url or --synthetic")
+
+    health = SearchClient(url).health()
+    print(f"Testing {url} ({health.get('rows', 0):,} rows)", flush=True)
+
+    results = []
+    for concurrency in args.concurrency:
+        row = run_load(url, concurrency, args.duration, args.fuzzy_share, args.date_share, args.seed)
+        results.append(row)
+        print(f"  concurrency {concurrency:>3}: {row['throughput_rps']:8.1f} req/s  "
+              f"p50 {row['p50_ms']:7.1f}ms  p95 {row['p95_ms']:7.1f}ms  p99 {row['p99_ms']:7.1f}ms  "
+              f"({row['requests']} ok, {row['errors']} errors)", flush=True)
+        sleep(0.2)
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "health": health, "results": results}, f, indent=2)
+    return 1 if any(r["errors"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+from pathlib import Path
+from typing import Optional
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SURNAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
+    "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker",
+    "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+    "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell",
+    "Carter", "Roberts", "McFadden", "Dillard", "Barnes", "Doyle", "Gobeil", "Pipkin",
+]
+ENTITIES = [
+    "State", "Department of Human Services", "City of Atlanta", "Fulton County",
+    "DeKalb County", "Georgia Power Co.", "Cobb County School District",
+    "Board of Regents", "Department of Transportation", "Wells Fargo Bank, N.A.",
+]
+REPORTERS = [("Ga.", 140, 318), ("Ga. App.", 1, 372)]
+MONTH_NAMES = [
+    "January", "February", "March", "April", "May", "June", "July",
+    "August", "September", "October", "November", "December",
+]
+SHARE_ROOT = r"\\lawfs01\Caselaw"
+
+
+def _party(rng: np.random.Generator, n: int) -> np.ndarray:
+    people = rng.choice(SURNAMES, size=n)
+    entities = rng.choice(ENTITIES, size=n)
+    return np.where(rng.random(n) < 0.3, entities, people)
+
+
+def generate_case_table(
+    n_rows: int,
+    seed: int = 0,
+    unknown_date_rate: float = 0.02,
+    partial_date_rate: float = 0.15,
+) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+
+    plaintiffs = _party(rng, n_rows)
+    defendants = _party(rng, n_rows)
+    styles = rng.random(n_rows)
+    case_names = [
+        f"In re {p}" if s < 0.05 else (f"In the Interest of {p[0]}. {d[0]}." if s < 0.08 else f"{p} v. {d}")
+        for p, d, s in zip(plaintiffs, defendants, styles)
+    ]
+
+    is_app = rng.random(n_rows) < 0.6
+    volumes = np.where(
+        is_app,
+        rng.integers(REPORTERS[1][1], REPORTERS[1][2], size=n_rows),
+        rng.integers(REPORTERS[0][1], REPORTERS[0][2], size=n_rows),
+    )
+    pages = rng.integers(1, 950, size=n_rows)
+    reporters = np.where(is_app, REPORTERS[1][0], REPORTERS[0][0])
+
+    years = rng.integers(1846, 2026, size=n_rows)
+    months = rng.integers(1, 13, size=n_rows)
+    days = rng.integers(1, 29, size=n_rows)
+
+    reporter_citations = [f"{v} {r} {p}" for v, r, p in zip(volumes, reporters, pages)]
+    citations = [
+        f"{name}, {cite} ({year})"
+        for name, cite, year in zip(case_names, reporter_citations, years)
+    ]
+    file_paths = [
+        f"{SHARE_ROOT}\\{'GaApp' if app else 'Ga'}\\{v}\\{v}_{r.replace('.', '').replace(' ', '_')}_{p}.html"
+        for app, v, r, p in zip(is_app, volumes, reporters, pages)
+    ]
+
+    year_col = pd.array(years, dtype="Int64")
+    month_col = np.array([MONTH_NAMES[m - 1] for m in months], dtype=object)
+    day_col = pd.array(days, dtype="Int64")
+
+    roll = rng.random(n_rows)
+    unknown = roll < unknown_date_rate
+    month_only = (roll >= unknown_date_rate) & (roll < unknown_date_rate + partial_date_rate / 2)
+    year_only = (roll >= unknown_date_rate + partial_date_rate / 2) & (roll < unknown_date_rate + partial_date_rate)
+    year_col[unknown] = pd.NA
+    month_col[unknown | year_only] = None
+    day_col[unknown | year_only | month_only] = pd.NA
+
+    return pd.DataFrame(
+        {
+            "Reporter Citation": reporter_citations,
+            "Citation": citations,
+            "Case Name": case_names,
+            "File Path": file_paths,
+            "Year": year_col,
+            "Month": month_col,
+            "Day": day_col,
+        }
+    )
+
+
+def load_or_generate(
+    n_rows: int, seed: int = 0, cache_dir: Optional[Path] = None
+) -> pd.DataFrame:
+    from utils.helpers import normalize_dataframe_columns
+
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = Path(cache_dir) / f"synthetic_{n_rows}_{seed}.pkl"
+        if cache_file.exists():
+            logger.info(f"Loading cached synthetic table: {cache_file}")
+            return pd.read_pickle(cache_file)
+
+    data = normalize_dataframe_columns(generate_case_table(n_rows, seed=seed))
+    data = data.reset_index(drop=True)
+
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        data.to_pickle(cache_file)
+    return data
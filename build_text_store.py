@@ -0,0 +1,79 @@
+import argparse
+import logging
+import multiprocessing
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import List, Optional
+
+from config.logging_config import setup_logging
+from config.settings import settings
+from core.text_store import BuildSummary, CaseTextStore, build_text_store
+from data.data_loader import load_database
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_EVERY = 500
+
+
+def _progress_printer():
+    printed = 0
+
+    def report(summary: BuildSummary) -> None:
+        nonlocal printed
+        if summary.done - printed >= PROGRESS_EVERY or summary.done == summary.total:
+            printed = summary.done
+            print(f"  {summary.done:,}/{summary.total:,} ({summary.stored:,} extracted, "
+                  f"{summary.unchanged:,} unchanged, {summary.failed:,} failed)", file=sys.stderr, flush=True)
+
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Extract the text of every case in the database into the compressed case text store")
+    parser.add_argument("--database", default=settings.database_path, help="Excel database (defaults to the configured one)")
+    parser.add_argument("--store", type=Path, default=Path(settings.text_store_path) if settings.text_store_path else None,
+                        help="SQLite store to create or update (defaults to the configured one)")
+    parser.add_argument("--workers", type=int, default=settings.text_store_workers, help="Extraction processes")
+    parser.add_argument("--limit", type=int, default=None, help="Only extract the first N file paths")
+    parser.add_argument("--log-level", default="WARNING", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    args = parser.parse_args(argv)
+
+    setup_logging(log_file="build_text_store.log", log_level=args.log_level)
+    if args.store is None:
+        print("No store path given and text_store_path is not configured", file=sys.stderr)
+        return 2
+
+    load_start = perf_counter()
+    try:
+        data = load_database(args.database)
+    except Exception as e:
+        print(f"Could not load database: {e}", file=sys.stderr)
+        return 2
+    if "file_path" not in data.columns:
+        print("The database has no file_path column", file=sys.stderr)
+        return 2
+
+    file_paths = data["file_path"].dropna().astype(str).unique().tolist()[:args.limit]
+    print(f"Loaded {len(data):,} cases in {perf_counter() - load_start:.1f}s; "
+          f"extracting {len(file_paths):,} files into {args.store}", file=sys.stderr)
+
+    store = CaseTextStore(args.store)
+    try:
+        summary = build_text_store(file_paths, store, args.workers, progress=_progress_printer())
+    except KeyboardInterrupt:
+        print("Interrupted; files extracted so far are kept", file=sys.stderr)
+        return 130
+    finally:
+        store.close()
+
+    for error in summary.errors:
+        logger.warning(f"Text extraction failed for {error}")
+    print(f"Done in {summary.elapsed_s:.1f}s: {summary.stored:,} extracted, {summary.unchanged:,} unchanged, "
+          f"{summary.failed:,} failed", file=sys.stderr)
+    return 1 if summary.failed else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
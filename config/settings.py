@@ -11,6 +11,8 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 PREFS_FILE = PROJECT_ROOT / "config" / "caselaw_viewer.json"
 DEFAULT_BRIEFS_SAVE_DIR = PROJECT_ROOT / "CaseBriefs"
 CHAT_STORAGE_DIR = PROJECT_ROOT / "CaseLawChats"
+TEXT_CACHE_DIR = PROJECT_ROOT / "CaseTextCache"
+TEXT_STORE_PATH = PROJECT_ROOT / "CaseTextStore.sqlite"
 DEFAULT_DATABASE_PATH = PROJECT_ROOT / "DATABASE_updated_dates_added_enriched_FINAL_updated_may_2025.xlsx"
 
 AVAILABLE_OPENAI_MODELS = [
@@ -90,9 +92,28 @@ class SearchDefaults:
     FUZZY_LIMIT: int = 15
     MIN_QUERY_LENGTH_FOR_FUZZY: int = 3
     MAX_EXACT_MATCHES_BEFORE_FUZZY: int = 5
+    ADAPTIVE_DEBOUNCE: bool = True
+    DEBOUNCE_MIN_MS: int = 0
+    DEBOUNCE_MAX_MS: int = 1200
+    CHEAP_SEARCH_MS: int = 40
+    RESULT_CACHE_SIZE: int = 32
+    FUZZY_WORKERS: int = 0
+    SERVER_HOST: str = "127.0.0.1"
+    SERVER_PORT: int = 8765
+    SERVER_TIMEOUT_S: float = 10.0
+
+@dataclass
+class PreviewDefaults:
+    DELAY_MS: int = 200
+    CHARS: int = 1500
+    CACHE_SIZE: int = 64
+    WORKERS: int = 2
 
 DEFAULT_MODEL = "gpt-5.2"
 DEFAULT_EXPORT_FMT = "viewer"
+BRIEF_FILE_FORMATS = ("txt", "docx", "pdf")
+DEFAULT_BRIEF_BATCH_CONCURRENCY = 3
+MAX_BRIEF_BATCH_CONCURRENCY = 16
 DEFAULT_BRIEF_VERBOSITY = "low"
 DEFAULT_BRIEF_REASONING_EFFORT = "medium"
 DEFAULT_CHAT_VERBOSITY = "low"
@@ -103,6 +124,7 @@ MAX_STATUS_MESSAGES = 4
 
 WINDOW = WindowDefaults()
 SEARCH = SearchDefaults()
+PREVIEW = PreviewDefaults()
 
 def requires_api_key(model_name: str) -> bool:
     m = (model_name or "").strip().lower()
@@ -119,6 +141,25 @@ class Settings:
     fuzzy_search_limit: int = SEARCH.FUZZY_LIMIT
     min_query_length_for_fuzzy: int = SEARCH.MIN_QUERY_LENGTH_FOR_FUZZY
     max_exact_matches_before_fuzzy: int = SEARCH.MAX_EXACT_MATCHES_BEFORE_FUZZY
+    adaptive_debounce: bool = SEARCH.ADAPTIVE_DEBOUNCE
+    search_debounce_min_ms: int = SEARCH.DEBOUNCE_MIN_MS
+    search_debounce_max_ms: int = SEARCH.DEBOUNCE_MAX_MS
+    cheap_search_ms: int = SEARCH.CHEAP_SEARCH_MS
+    search_result_cache_size: int = SEARCH.RESULT_CACHE_SIZE
+    fuzzy_workers: int = SEARCH.FUZZY_WORKERS
+    search_server_url: str = ""
+    search_server_host: str = SEARCH.SERVER_HOST
+    search_server_port: int = SEARCH.SERVER_PORT
+    search_server_timeout_s: float = SEARCH.SERVER_TIMEOUT_S
+    preview_delay_ms: int = PREVIEW.DELAY_MS
+    preview_chars: int = PREVIEW.CHARS
+    preview_cache_size: int = PREVIEW.CACHE_SIZE
+    preview_workers: int = PREVIEW.WORKERS
+    text_cache_dir: str = str(TEXT_CACHE_DIR)
+    text_cache_memory_mb: int = 64
+    html_extractor: str = "stream"
+    text_store_path: str = str(TEXT_STORE_PATH)
+    text_store_workers: int = 4
     max_status_messages: int = MAX_STATUS_MESSAGES
     window_title: str = "Chintella Law Case Search"
     window_geometry: Tuple[int, int, int, int] = (WINDOW.X, WINDOW.Y, WINDOW.WIDTH, WINDOW.HEIGHT)
@@ -129,6 +170,7 @@ class Settings:
     briefs_save_dir: str = field(default=str(DEFAULT_BRIEFS_SAVE_DIR))
     brief_verbosity: str = field(default=DEFAULT_BRIEF_VERBOSITY)
     brief_reasoning_effort: str = field(default=DEFAULT_BRIEF_REASONING_EFFORT)
+    brief_batch_concurrency: int = field(default=DEFAULT_BRIEF_BATCH_CONCURRENCY)
     chat_model: str = field(default=DEFAULT_CHAT_MODEL)
     chat_verbosity: str = field(default=DEFAULT_CHAT_VERBOSITY)
     chat_reasoning_effort: str = field(default=DEFAULT_CHAT_REASONING_EFFORT)
@@ -137,6 +179,8 @@ class Settings:
     date_filter_from_date: str = field(default="")
     date_filter_to_enabled: bool = field(default=False)
     date_filter_to_date: str = field(default="")
+    show_search_details: bool = field(default=False)
+    show_case_preview: bool = field(default=True)
 
     def save_user_prefs(self) -> bool:
         try:
@@ -150,6 +194,7 @@ class Settings:
                 "briefs_save_dir": self.briefs_save_dir,
                 "brief_verbosity": self.brief_verbosity,
                 "brief_reasoning_effort": self.brief_reasoning_effort,
+                "brief_batch_concurrency": self.brief_batch_concurrency,
                 "chat_model": self.chat_model,
                 "chat_verbosity": self.chat_verbosity,
                 "chat_reasoning_effort": self.chat_reasoning_effort,
@@ -159,6 +204,10 @@ class Settings:
                 "date_filter_from_date": self.date_filter_from_date,
                 "date_filter_to_enabled": self.date_filter_to_enabled,
                 "date_filter_to_date": self.date_filter_to_date,
+                "show_search_details": self.show_search_details,
+                "show_case_preview": self.show_case_preview,
+                "fuzzy_workers": self.fuzzy_workers,
+                "search_server_url": self.search_server_url,
                 "database_path_relative": database_relative,
             }
 
@@ -192,6 +241,7 @@ class Settings:
             self.export_fmt = data.get("export_fmt", self.export_fmt)
             self.brief_verbosity = data.get("brief_verbosity", data.get("gpt5_verbosity", self.brief_verbosity))
             self.brief_reasoning_effort = data.get("brief_reasoning_effort", self.brief_reasoning_effort)
+            self.brief_batch_concurrency = data.get("brief_batch_concurrency", self.brief_batch_concurrency)
             self.chat_model = data.get("chat_model", self.chat_model)
             self.chat_verbosity = data.get("chat_verbosity", self.chat_verbosity)
             self.chat_reasoning_effort = data.get("chat_reasoning_effort", self.chat_reasoning_effort)
@@ -200,6 +250,10 @@ class Settings:
             self.date_filter_from_date = data.get("date_filter_from_date", self.date_filter_from_date)
             self.date_filter_to_enabled = data.get("date_filter_to_enabled", self.date_filter_to_enabled)
             self.date_filter_to_date = data.get("date_filter_to_date", self.date_filter_to_date)
+            self.show_search_details = data.get("show_search_details", self.show_search_details)
+            self.show_case_preview = data.get("show_case_preview", self.show_case_preview)
+            self.fuzzy_workers = data.get("fuzzy_workers", self.fuzzy_workers)
+            self.search_server_url = data.get("search_server_url", self.search_server_url)
 
             self.briefs_save_dir = self._validate_directory_path(
                 data.get("briefs_save_dir", self.briefs_save_dir),
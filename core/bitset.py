@@ -0,0 +1,85 @@
+from __future__ import annotations
+import numpy as np
+from typing import Iterable
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class RowBitset:
+    __slots__ = ("_bits", "_size")
+
+    def __init__(self, bits: np.ndarray, size: int):
+        expected = (size + 7) // 8
+        if len(bits) != expected:
+            raise ValueError(f"Bitset for {size} rows needs {expected} bytes, got {len(bits)}")
+        self._bits = bits
+        self._size = size
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "RowBitset":
+        mask = np.asarray(mask, dtype=bool)
+        return cls(np.packbits(mask), len(mask))
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[int], size: int) -> "RowBitset":
+        mask = np.zeros(size, dtype=bool)
+        mask[np.asarray(positions, dtype=np.intp)] = True
+        return cls.from_mask(mask)
+
+    @classmethod
+    def full(cls, size: int) -> "RowBitset":
+        return cls.from_mask(np.ones(size, dtype=bool))
+
+    @classmethod
+    def empty(cls, size: int) -> "RowBitset":
+        return cls(np.zeros((size + 7) // 8, dtype=np.uint8), size)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _check(self, other: "RowBitset") -> None:
+        if self._size != other._size:
+            raise ValueError(f"Bitset size mismatch: {self._size} vs {other._size}")
+
+    def __and__(self, other: "RowBitset") -> "RowBitset":
+        self._check(other)
+        return RowBitset(self._bits & other._bits, self._size)
+
+    def __or__(self, other: "RowBitset") -> "RowBitset":
+        self._check(other)
+        return RowBitset(self._bits | other._bits, self._size)
+
+    def __sub__(self, other: "RowBitset") -> "RowBitset":
+        self._check(other)
+        return RowBitset(self._bits & ~other._bits, self._size)
+
+    def __invert__(self) -> "RowBitset":
+        bits = ~self._bits
+        tail = self._size % 8
+        if tail:
+            bits[-1] &= np.uint8((0xFF << (8 - tail)) & 0xFF)
+        return RowBitset(bits, self._size)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RowBitset):
+            return NotImplemented
+        return self._size == other._size and np.array_equal(self._bits, other._bits)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def count(self) -> int:
+        return int(_POPCOUNT[self._bits].sum(dtype=np.int64))
+
+    def any(self) -> bool:
+        return bool(self._bits.any())
+
+    def to_mask(self) -> np.ndarray:
+        return np.unpackbits(self._bits, count=self._size).astype(bool)
+
+    def to_positions(self) -> np.ndarray:
+        return np.flatnonzero(np.unpackbits(self._bits, count=self._size))
+
+    def nbytes(self) -> int:
+        return self._bits.nbytes
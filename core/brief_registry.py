@@ -42,6 +42,7 @@ class BriefType:
     temperature: Optional[float] = None
     max_output_tokens: Optional[int] = None
     category: Optional[str] = None
+    segments: Optional[List[str]] = None
 
     def resolved_template(self) -> str:
         if self.template:
@@ -64,7 +65,7 @@ class BriefConfig:
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "BriefConfig":
         items = []
-        allowed = {"label","kind","topic","template","enabled","model","temperature","max_output_tokens","category"}
+        allowed = {"label","kind","topic","template","enabled","model","temperature","max_output_tokens","category","segments"}
         for raw in d.get("items", []):
             if not isinstance(raw, dict):
                 continue
@@ -86,6 +87,7 @@ class BriefRegistry:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._cfg = BriefConfig()
+            cls._instance._version = 0
             cls._instance.reload()
         return cls._instance
 
@@ -101,9 +103,15 @@ class BriefRegistry:
                 logger.error(f"Failed to save initial briefs: {e}", exc_info=True)
         else:
             self._cfg = BriefConfig.from_dict(user_data)
+        self._version += 1
 
     def save(self) -> None:
         save_yaml(USER_PATH, self._cfg.to_dict())
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     def list_enabled(self) -> List[BriefType]:
         return [i for i in self._cfg.items if i.enabled]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 from config.settings import settings
 
 DEFAULT_TEMPERATURE = 0.3
@@ -15,10 +15,17 @@ class BriefRequest:
     verbosity: str = "medium"
     temperature: float = DEFAULT_TEMPERATURE
     max_output_tokens: Optional[int] = None
+    segments: Optional[List[str]] = None
 
 def build_prompt(request: BriefRequest, case_text: str) -> str:
     return f"{request.template}\n\n{request.citation}\n\n{case_text}"
 
+def build_messages(request: BriefRequest, case_text: str) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": build_prompt(request, case_text)}
+    ]
+
 def build_brief_filename(html_path: str, ext: str) -> str:
     return f"{Path(html_path).stem}_brief.{ext}"
 
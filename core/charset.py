@@ -0,0 +1,158 @@
+from __future__ import annotations
+import atexit
+import codecs
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from utils.diagnostics import register_provider
+from utils.helpers import load_yaml, save_yaml
+
+logger = logging.getLogger(__name__)
+
+ENCODINGS_PATH = Path(__file__).resolve().parent.parent / "config" / "caselaw_viewer_encodings.yaml"
+META_PRESCAN_BYTES = 4096
+FALLBACK_ENCODINGS = ("cp1252", "latin-1")
+
+BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_META_CHARSET = re.compile(rb"""<meta[^>]*?charset\s*=\s*["']?\s*([a-zA-Z0-9_.:-]+)""", re.IGNORECASE)
+# Legacy pages that declare ASCII or Latin-1 are almost always cp1252 in practice (HTML5 maps them the same way).
+_DECLARED_ALIASES = {"ascii": "cp1252", "iso8859-1": "cp1252"}
+
+
+def _translate_newlines(text: str) -> str:
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _codec_name(label: str) -> Optional[str]:
+    try:
+        name = codecs.lookup(label).name
+    except LookupError:
+        return None
+    return _DECLARED_ALIASES.get(name, name)
+
+
+def sniff_bom(raw: bytes) -> Optional[str]:
+    for bom, encoding in BOMS:
+        if raw.startswith(bom):
+            return encoding
+    return None
+
+
+def declared_charset(raw: bytes) -> Optional[str]:
+    match = _META_CHARSET.search(raw, 0, META_PRESCAN_BYTES)
+    return _codec_name(match.group(1).decode("ascii")) if match else None
+
+
+def _try_decode(raw: bytes, encoding: str) -> Optional[str]:
+    try:
+        return raw.decode(encoding)
+    except (UnicodeDecodeError, LookupError):
+        return None
+
+
+def decode_html(raw: bytes, hint: Optional[str] = None) -> Tuple[str, str]:
+    bom = sniff_bom(raw)
+    if bom is not None:
+        text = _try_decode(raw, bom)
+        if text is not None:
+            return _translate_newlines(text), bom
+
+    candidates = [hint] if hint else []
+    candidates.append("utf-8")
+    declared = declared_charset(raw)
+    if declared:
+        candidates.append(declared)
+    candidates.extend(FALLBACK_ENCODINGS)
+
+    for encoding in dict.fromkeys(candidates):
+        text = _try_decode(raw, encoding)
+        if text is not None:
+            return _translate_newlines(text), encoding
+    return _translate_newlines(raw.decode("utf-8", errors="replace")), "utf-8"
+
+
+class EncodingMemo:
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._encodings: Optional[Dict[str, List]] = None
+        self._dirty = False
+        self._detected: Counter = Counter()
+        self._hinted = 0
+
+    def get(self, file_path: str, stat: os.stat_result) -> Optional[str]:
+        with self._lock:
+            entry = self._load().get(file_path)
+        if entry and entry[1:] == [stat.st_mtime_ns, stat.st_size]:
+            return entry[0]
+        return None
+
+    def record(self, file_path: str, stat: os.stat_result, encoding: str, hinted: bool) -> None:
+        entry = [encoding, stat.st_mtime_ns, stat.st_size]
+        with self._lock:
+            encodings = self._load()
+            self._detected[encoding] += 1
+            if hinted:
+                self._hinted += 1
+            # UTF-8 is tried first anyway, so only other encodings are worth remembering.
+            if encoding == "utf-8":
+                if encodings.pop(file_path, None) is not None:
+                    self._dirty = True
+            elif encodings.get(file_path) != entry:
+                encodings[file_path] = entry
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or self._encodings is None:
+                return
+            save_yaml(self.path, {"encodings": dict(sorted(self._encodings.items()))})
+            self._dirty = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "remembered files": len(self._load()),
+                "reads using a remembered encoding": self._hinted,
+            }
+            for encoding, count in self._detected.most_common():
+                stats[f"decoded as {encoding}"] = count
+            return stats
+
+    def _load(self) -> Dict[str, List]:
+        if self._encodings is None:
+            data = load_yaml(self.path, default={})
+            self._encodings = {
+                str(k): list(v) for k, v in (data.get("encodings") or {}).items()
+                if isinstance(v, list) and len(v) == 3
+            }
+        return self._encodings
+
+
+def read_html(path: Path) -> str:
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        raw = f.read()
+    key = str(path)
+    hint = encoding_memo.get(key, stat)
+    text, encoding = decode_html(raw, hint)
+    encoding_memo.record(key, stat, encoding, hinted=hint is not None and encoding == hint)
+    return text
+
+
+encoding_memo = EncodingMemo(ENCODINGS_PATH)
+# Text store pool workers import this module too; only the main process writes the memo.
+if multiprocessing.parent_process() is None:
+    atexit.register(encoding_memo.save)
+register_provider("Case file encodings", encoding_memo.stats)
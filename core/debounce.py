@@ -0,0 +1,104 @@
+from __future__ import annotations
+from typing import Any, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+EWMA_ALPHA = 0.3
+
+
+def _ewma(current: Optional[float], sample: float, alpha: float = EWMA_ALPHA) -> float:
+    return sample if current is None else (alpha * sample + (1 - alpha) * current)
+
+
+class AdaptiveDebounce:
+    def __init__(
+        self,
+        fallback_ms: int,
+        min_ms: int,
+        max_ms: int,
+        cheap_ms: int,
+        min_query_length_for_fuzzy: int,
+        max_exact_before_fuzzy: int,
+    ):
+        self.fallback_ms = fallback_ms
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.cheap_ms = cheap_ms
+        self.min_query_length_for_fuzzy = min_query_length_for_fuzzy
+        self.max_exact_before_fuzzy = max_exact_before_fuzzy
+
+        self._exact_ms: Optional[float] = None
+        self._fuzzy_ms: Optional[float] = None
+        self._keystroke_ms: Optional[float] = None
+        self._last_input_at: Optional[float] = None
+        self._last_query = ""
+        self._last_exact_count: Optional[int] = None
+        self._last_delay_ms = 0
+        self._last_reason = ""
+        self._scheduled = 0
+        self._immediate = 0
+
+    def note_input(self, now: float) -> None:
+        if self._last_input_at is not None:
+            gap_ms = (now - self._last_input_at) * 1000
+            if gap_ms <= self.max_ms:
+                self._keystroke_ms = _ewma(self._keystroke_ms, gap_ms)
+        self._last_input_at = now
+
+    def delay_for(self, query: str, cached: bool = False) -> int:
+        self._scheduled += 1
+        if cached:
+            return self._decide(0, "cached result")
+
+        likely_fuzzy = self._likely_fuzzy(query)
+        predicted = self._fuzzy_ms if likely_fuzzy else self._exact_ms
+        if predicted is None:
+            return self._decide(self.fallback_ms, "no latency samples yet")
+
+        if not likely_fuzzy and predicted <= self.cheap_ms:
+            return self._decide(self.min_ms, f"cheap exact search (~{predicted:.0f}ms)")
+
+        typing_gap = self._keystroke_ms if self._keystroke_ms is not None else self.fallback_ms
+        delay = typing_gap * 1.5 + predicted
+        kind = "fuzzy" if likely_fuzzy else "exact"
+        return self._decide(delay, f"{kind} search (~{predicted:.0f}ms) at {typing_gap:.0f}ms/keystroke")
+
+    def record(self, query: str, duration_s: float, fuzzy_ran: bool, exact_count: int) -> None:
+        duration_ms = duration_s * 1000
+        if fuzzy_ran:
+            self._fuzzy_ms = _ewma(self._fuzzy_ms, duration_ms)
+        else:
+            self._exact_ms = _ewma(self._exact_ms, duration_ms)
+        self._last_query = query
+        self._last_exact_count = exact_count
+
+    def stats(self) -> Dict[str, Any]:
+        def _fmt(value: Optional[float]) -> str:
+            return "n/a" if value is None else f"{value:.1f} ms"
+
+        return {
+            "exact latency (ewma)": _fmt(self._exact_ms),
+            "fuzzy latency (ewma)": _fmt(self._fuzzy_ms),
+            "keystroke interval (ewma)": _fmt(self._keystroke_ms),
+            "last delay": f"{self._last_delay_ms} ms",
+            "last reason": self._last_reason or "n/a",
+            "searches scheduled": self._scheduled,
+            "fired immediately": self._immediate,
+            "bounds": f"{self.min_ms}-{self.max_ms} ms (cheap <= {self.cheap_ms} ms)",
+        }
+
+    def _likely_fuzzy(self, query: str) -> bool:
+        if len(query) < self.min_query_length_for_fuzzy or self._last_exact_count is None:
+            return False
+        narrowing = self._last_query and query.lower().startswith(self._last_query.lower())
+        return bool(narrowing) and self._last_exact_count < self.max_exact_before_fuzzy
+
+    def _decide(self, delay_ms: float, reason: str) -> int:
+        delay = int(min(max(delay_ms, self.min_ms), self.max_ms)) if delay_ms else 0
+        self._last_delay_ms = delay
+        self._last_reason = reason
+        if delay == 0:
+            self._immediate += 1
+        logger.debug(f"Search debounce {delay}ms ({reason})")
+        return delay
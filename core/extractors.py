@@ -0,0 +1,183 @@
+import re
+from html.entities import html5
+from html.parser import HTMLParser
+from typing import Callable, Dict, List
+from bs4 import BeautifulSoup
+from bs4.builder import HTMLTreeBuilder
+
+VOID_TAGS = frozenset(HTMLTreeBuilder().empty_element_tags)
+PRESERVE_WHITESPACE_TAGS = frozenset(HTMLTreeBuilder.DEFAULT_PRESERVE_WHITESPACE_TAGS)
+HIDDEN_TEXT_TAGS = frozenset(HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS)
+ASCII_SPACES = frozenset("\x20\x0a\x09\x0c\x0d")
+_CHARREF_DIGITS = {10: re.compile(r"([0-9]+)(.*)", re.S), 16: re.compile(r"([0-9a-fA-F]+)(.*)", re.S)}
+
+
+def normalize_text(text: str) -> str:
+    lines  = (ln.strip()   for ln in text.splitlines())
+    chunks = (ph.strip()   for ln in lines for ph in ln.split("  "))
+    return " ".join(ch for ch in chunks if ch)
+
+
+def dereference_charref(name: str) -> str:
+    # HTML5 numeric character reference rules, as BeautifulSoup applies them:
+    # a trailing non-numeric part of an unterminated reference is kept as text.
+    base = 10
+    if name[:1] in ("x", "X"):
+        name, base = name[1:], 16
+    match = _CHARREF_DIGITS[base].match(name)
+    if match is None:
+        return name
+    digits, extra = match.groups()
+    code = int(digits, base)
+    if code == 0 or code > 0x10FFFF or 0xD800 <= code <= 0xDFFF:
+        return "\ufffd" + extra
+    if 0x80 <= code <= 0x9F:
+        # References to C1 controls are almost always cp1252 bytes written as numbers.
+        return (bytes([code]).decode("cp1252", errors="ignore") or chr(code)) + extra
+    return chr(code) + extra
+
+
+def extract_text_bs4(raw: str) -> str:
+    soup = BeautifulSoup(raw, "html.parser")
+    for tag in soup(["script", "style"]):
+        tag.decompose()
+    return normalize_text(soup.get_text(separator=" "))
+
+
+class _TextCollector(HTMLParser):
+    # Replays the tag stack and string flushing of BeautifulSoup's html.parser
+    # tree builder without building a tree, so the collected strings are the
+    # ones soup.get_text() would return.
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.strings: List[str] = []
+        self._data: List[str] = []
+        self._stack: List[str] = []
+        self._open: Dict[str, int] = {}
+        self._preserve: List[int] = []
+        self._hidden: List[int] = []
+        self._closed_void: List[str] = []
+
+    def _flush(self, visible: bool = True) -> None:
+        if not self._data:
+            return
+        text = "".join(self._data)
+        self._data = []
+        if not visible:
+            return
+        if not self._preserve:
+            for ch in text:
+                if ch not in ASCII_SPACES:
+                    break
+            else:
+                text = "\n" if "\n" in text else " "
+        if not self._hidden:
+            self.strings.append(text)
+
+    def _push(self, tag: str) -> None:
+        self._stack.append(tag)
+        self._open[tag] = self._open.get(tag, 0) + 1
+        depth = len(self._stack)
+        if tag in PRESERVE_WHITESPACE_TAGS:
+            self._preserve.append(depth)
+        if tag in HIDDEN_TEXT_TAGS:
+            self._hidden.append(depth)
+
+    def _pop(self) -> None:
+        depth = len(self._stack)
+        tag = self._stack.pop()
+        self._open[tag] -= 1
+        if self._preserve and self._preserve[-1] == depth:
+            self._preserve.pop()
+        if self._hidden and self._hidden[-1] == depth:
+            self._hidden.pop()
+
+    def _pop_to(self, tag: str) -> None:
+        while self._stack and self._open.get(tag):
+            popped = self._stack[-1]
+            self._pop()
+            if popped == tag:
+                break
+
+    def _close(self, tag: str) -> None:
+        self._flush()
+        self._pop_to(tag)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        self._push(tag)
+        if tag in VOID_TAGS:
+            self._close(tag)
+            self._closed_void.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()
+        self._push(tag)
+        self._close(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self._closed_void:
+            self._closed_void.remove(tag)
+        else:
+            self._close(tag)
+
+    def handle_data(self, data):
+        self._data.append(data)
+
+    def handle_charref(self, name):
+        self._data.append(dereference_charref(name))
+
+    def handle_entityref(self, name):
+        self._data.append(html5.get(f"{name};", f"&{name}"))
+
+    def _skip(self, data: str) -> None:
+        self._flush()
+        self._data.append(data)
+        self._flush(visible=False)
+
+    def handle_comment(self, data):
+        self._skip(data)
+
+    def handle_decl(self, decl):
+        self._skip(decl)
+
+    def handle_pi(self, data):
+        self._skip(data)
+
+    def unknown_decl(self, data):
+        if not data.upper().startswith("CDATA["):
+            self._skip(data)
+            return
+        self._flush()
+        self._data.append(data[len("CDATA["):])
+        hidden, self._hidden = self._hidden, []
+        self._flush()
+        self._hidden = hidden
+
+
+def extract_text_stream(raw: str) -> str:
+    collector = _TextCollector()
+    collector.feed(raw)
+    collector.close()
+    return normalize_text(" ".join(collector.strings))
+
+
+EXTRACTORS: Dict[str, Callable[[str], str]] = {
+    "stream": extract_text_stream,
+    "bs4": extract_text_bs4,
+}
+
+
+def register_extractor(name: str, extract: Callable[[str], str]) -> None:
+    EXTRACTORS[name] = extract
+
+
+def get_extractor(name: str) -> Callable[[str], str]:
+    try:
+        return EXTRACTORS[name]
+    except KeyError:
+        raise ValueError(f"Unknown HTML extractor '{name}'. Available: {', '.join(EXTRACTORS)}") from None
@@ -0,0 +1,77 @@
+from __future__ import annotations
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Hashable, Optional
+import logging
+import pandas as pd
+from core.bitset import RowBitset
+from utils.date_filter import DateIntervalIndex
+
+logger = logging.getLogger(__name__)
+
+FILTER_CACHE_SIZE = 64
+
+
+class FilterEngine:
+    def __init__(self, max_cached: int = FILTER_CACHE_SIZE):
+        self._max_cached = max_cached
+        self._data: pd.DataFrame = pd.DataFrame()
+        self._source_data_id: Optional[int] = None
+        self._cache: "OrderedDict[Hashable, RowBitset]" = OrderedDict()
+        self._date_index: Optional[DateIntervalIndex] = None
+        self._hits = 0
+        self._misses = 0
+
+    def set_source_data(self, data: pd.DataFrame) -> None:
+        new_id = id(data)
+        if self._source_data_id != new_id:
+            self._source_data_id = new_id
+            self._data = data
+            self.clear_cache()
+
+    @property
+    def row_count(self) -> int:
+        return len(self._data)
+
+    @property
+    def date_index(self) -> DateIntervalIndex:
+        if self._date_index is None:
+            self._date_index = DateIntervalIndex.from_data(self._data)
+        return self._date_index
+
+    def date_window(
+        self, from_date: Optional[date], to_date: Optional[date]
+    ) -> Optional[RowBitset]:
+        if from_date is None and to_date is None:
+            return None
+        return self._cached(
+            ("date", from_date, to_date),
+            lambda: RowBitset.from_mask(self.date_index.mask(from_date, to_date)),
+        )
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "cached_bitsets": len(self._cache),
+            "cached_bytes": sum(b.nbytes() for b in self._cache.values()),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self._date_index = None
+        logger.debug("Filter bitset cache cleared")
+
+    def _cached(self, key: Hashable, build) -> RowBitset:
+        bitset = self._cache.get(key)
+        if bitset is not None:
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return bitset
+
+        self._misses += 1
+        bitset = build()
+        self._cache[key] = bitset
+        if len(self._cache) > self._max_cached:
+            self._cache.popitem(last=False)
+        return bitset
@@ -0,0 +1,192 @@
+from __future__ import annotations
+import atexit
+import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_HEADER = np.dtype(np.int64).itemsize
+_ATTACHED: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def normalize_choice(value) -> str:
+    return str(value).lower().strip()
+
+
+@dataclass(frozen=True)
+class SharedChoices:
+    name: str
+    count: int
+
+
+def _publish(choices: Sequence) -> shared_memory.SharedMemory:
+    encoded = [normalize_choice(c).encode("utf-8") for c in choices]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+
+    blob_start = _HEADER + offsets.nbytes
+    shm = shared_memory.SharedMemory(create=True, size=max(blob_start + int(offsets[-1]), 1))
+    np.frombuffer(shm.buf, dtype=np.int64, count=1)[0] = len(encoded)
+    shm.buf[_HEADER:blob_start] = offsets.tobytes()
+    shm.buf[blob_start : blob_start + int(offsets[-1])] = b"".join(encoded)
+    return shm
+
+
+def _attach(name: str, live: Tuple[str, ...]) -> shared_memory.SharedMemory:
+    # Every task carries the parent's published segments, so segments it has released get unmapped here.
+    for stale in [n for n in _ATTACHED if n not in live]:
+        _ATTACHED.pop(stale).close()
+    shm = _ATTACHED.get(name)
+    if shm is None:
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            # Spawned workers share the parent's resource tracker, where this registration is a no-op;
+            # unregistering here would drop the parent's entry and make its unlink fail in the tracker.
+            shm = shared_memory.SharedMemory(name=name)
+        _ATTACHED[name] = shm
+    return shm
+
+
+def _score_slice(
+    name: str,
+    live: Tuple[str, ...],
+    indices: Optional[np.ndarray],
+    start: int,
+    stop: int,
+    query: str,
+    score_cutoff: int,
+    limit: int,
+    chunk_size: int,
+) -> List[Tuple[int, int]]:
+    from thefuzz import fuzz, process
+
+    shm = _attach(name, live)
+    count = int(np.frombuffer(shm.buf, dtype=np.int64, count=1)[0])
+    offsets = np.frombuffer(shm.buf, dtype=np.int64, count=count + 1, offset=_HEADER)
+    blob_start = _HEADER + offsets.nbytes
+
+    results: List[Tuple[int, int]] = []
+    for lo in range(start, stop, chunk_size):
+        hi = min(lo + chunk_size, stop)
+        selected = range(lo, hi) if indices is None else indices[lo - start : hi - start]
+        choices = {
+            lo + j: bytes(shm.buf[blob_start + offsets[i] : blob_start + offsets[i + 1]]).decode("utf-8")
+            for j, i in enumerate(selected)
+        }
+        chunk_results = process.extractBests(
+            query=query,
+            choices=choices,
+            scorer=fuzz.token_set_ratio,
+            processor=normalize_choice,
+            score_cutoff=score_cutoff,
+            limit=limit,
+        )
+        results.extend((key, score) for _choice, score, key in chunk_results)
+    del offsets
+    return results
+
+
+class FuzzyPool:
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+        self._published: Dict[str, SharedChoices] = {}
+        atexit.register(self.close)
+
+    def publish(self, key: str, choices: Sequence) -> SharedChoices:
+        handle = self._published.get(key)
+        if handle is not None:
+            return handle
+
+        shm = _publish(choices)
+        handle = SharedChoices(name=shm.name, count=len(choices))
+        self._segments[shm.name] = shm
+        self._published[key] = handle
+        logger.info(f"Published {len(choices)} fuzzy choices for '{key}' ({shm.size / 1e6:.1f} MB shared)")
+        return handle
+
+    def score(
+        self,
+        handle: SharedChoices,
+        query: str,
+        score_cutoff: int,
+        limit: int,
+        chunk_size: int,
+        indices: Optional[np.ndarray] = None,
+    ) -> List[Tuple[int, int]]:
+        total = handle.count if indices is None else len(indices)
+        if total == 0:
+            return []
+
+        n_chunks = -(-total // chunk_size)
+        n_slices = min(self.workers * 2, n_chunks)
+        bounds = np.minimum(np.linspace(0, n_chunks, n_slices + 1, dtype=np.int64) * chunk_size, total)
+        executor = self._get_executor()
+        live = tuple(self._segments)
+        futures = []
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            if hi <= lo:
+                continue
+            part = None if indices is None else indices[lo:hi]
+            futures.append(executor.submit(
+                _score_slice, handle.name, live, part, int(lo), int(hi), query, score_cutoff, limit, chunk_size
+            ))
+
+        merged: List[Tuple[int, int]] = []
+        try:
+            for future in futures:
+                merged.extend(future.result())
+        except BrokenProcessPool:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            raise
+        merged.sort(key=lambda item: item[1], reverse=True)
+        if indices is None:
+            return merged[:limit]
+        return [(int(indices[ordinal]), score) for ordinal, score in merged[:limit]]
+
+    def release(self, key: str) -> None:
+        handle = self._published.pop(key, None)
+        if handle is None:
+            return
+        shm = self._segments.pop(handle.name, None)
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    def release_all(self) -> None:
+        for key in list(self._published):
+            self.release(key)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "workers": self.workers,
+            "running": self._executor is not None,
+            "published columns": len(self._published),
+            "shared bytes": sum(s.size for s in self._segments.values()),
+        }
+
+    def close(self) -> None:
+        atexit.unregister(self.close)
+        self.release_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=min(self.workers, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
@@ -1,29 +1,41 @@
-from pathlib import Path
-from bs4 import BeautifulSoup
 import logging
+from typing import List, Optional, Tuple
+from core.charset import read_html
+from core.extractors import get_extractor
+from core.segmenter import Segment, segment_opinion, select_segments
 from utils.helpers import validate_and_resolve_path
 
 logger = logging.getLogger(__name__)
 
-def _read_with_fallback_encoding(path: Path) -> str:
-    for encoding in ("utf-8", "utf-8-sig", "cp1252", "latin-1"):
+def load_case_text(file_path: str, segments: Optional[List[str]] = None) -> str:
+    file_path = file_path.strip()
+    if segments:
+        text, found = load_case_segments(file_path)
+        return select_segments(text, found, segments)
+    from config.settings import settings
+    if settings.search_server_url:
+        from core.search_client import SearchServerError, shared_client
         try:
-            return path.read_text(encoding=encoding)
-        except (UnicodeDecodeError, ValueError):
-            continue
-    return path.read_bytes().decode("utf-8", errors="replace")
+            return shared_client(settings.search_server_url, settings.search_server_timeout_s).case_text(file_path)
+        except (SearchServerError, ValueError) as e:
+            logger.warning(f"Case text from search server failed, reading locally: {e}")
+    from core.text_cache import text_cache
+    return text_cache.get(file_path, parse_html_content)
+
+def load_case_segments(file_path: str) -> Tuple[str, List[Segment]]:
+    from config.settings import settings
+    if settings.search_server_url:
+        text = load_case_text(file_path)
+        return text, segment_opinion(text)
+    from core.text_cache import text_cache
+    return text_cache.get_segments(file_path, parse_html_content)
 
 def parse_html_content(file_path: str) -> str:
     try:
         path = validate_and_resolve_path(file_path, fallback_subdir="Caselaw")
-        raw = _read_with_fallback_encoding(path)
-        soup = BeautifulSoup(raw, "html.parser")
-        for tag in soup(["script", "style"]):
-            tag.decompose()
-        text = soup.get_text(separator=" ")
-        lines  = (ln.strip()   for ln in text.splitlines())
-        chunks = (ph.strip()   for ln in lines for ph in ln.split("  "))
-        return " ".join(ch for ch in chunks if ch)
+        raw = read_html(path)
+        from config.settings import settings
+        return get_extractor(settings.html_extractor)(raw)
     except FileNotFoundError:
         logger.error(f"HTML file not found: {file_path}", exc_info=True)
         raise
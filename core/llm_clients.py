@@ -0,0 +1,92 @@
+from __future__ import annotations
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+from utils.diagnostics import register_provider
+
+logger = logging.getLogger(__name__)
+
+OPENAI_BACKEND = "openai"
+LMSTUDIO_BACKEND = "lmstudio"
+
+
+@dataclass
+class _Entry:
+    client: Any
+    api_key: str
+    base_url: Optional[str]
+    requests: int = 0
+    in_flight: int = 0
+
+
+class ClientManager:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self._retired: List[_Entry] = []
+        self._built = 0
+
+    @contextmanager
+    def lease(self, backend: str, api_key: str, base_url: Optional[str] = None) -> Iterator[Any]:
+        with self._lock:
+            entry = self._entries.get(backend)
+            if entry is None or entry.api_key != api_key or entry.base_url != base_url:
+                if entry is not None:
+                    logger.info(f"Rebuilding the {backend} client after an API key or endpoint change")
+                    self._retire(entry)
+                entry = _Entry(self._build(api_key, base_url), api_key, base_url)
+                self._entries[backend] = entry
+                self._built += 1
+            entry.requests += 1
+            entry.in_flight += 1
+        try:
+            yield entry.client
+        finally:
+            with self._lock:
+                entry.in_flight -= 1
+                idle = entry in self._retired and entry.in_flight == 0
+                if idle:
+                    self._retired.remove(entry)
+            if idle:
+                self._close_client(entry)
+
+    def close(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values()) + self._retired
+            self._entries, self._retired = {}, []
+        for entry in entries:
+            self._close_client(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = {"clients built": self._built, "replaced clients still streaming": len(self._retired)}
+            for backend, entry in self._entries.items():
+                stats[f"{backend} requests"] = entry.requests
+            return stats
+
+    def _retire(self, entry: _Entry) -> None:
+        # A replaced client stays open until the workers streaming through it are done.
+        if entry.in_flight:
+            self._retired.append(entry)
+        else:
+            self._close_client(entry)
+
+    @staticmethod
+    def _close_client(entry: _Entry) -> None:
+        try:
+            entry.client.close()
+        except Exception as e:
+            logger.warning(f"Closing an LLM client failed: {e}")
+
+    @staticmethod
+    def _build(api_key: str, base_url: Optional[str]):
+        from openai import OpenAI
+        return OpenAI(api_key=api_key, base_url=base_url)
+
+
+llm_clients = ClientManager()
+atexit.register(llm_clients.close)
+register_provider("LLM clients", llm_clients.stats)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+from dataclasses import dataclass, asdict, field
+from datetime import date, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+import logging
+import threading
+import numpy as np
+import pandas as pd
+from config.settings import settings, EXPECTED_COLUMNS
+from core.filters import FilterEngine
+from core.search import SearchEngine
+from utils.helpers import load_yaml, save_yaml
+
+logger = logging.getLogger(__name__)
+
+USER_PATH = Path(__file__).resolve().parent.parent / "config" / "caselaw_viewer_saved_searches.yaml"
+SNAPSHOT_PATH = Path(__file__).resolve().parent.parent / "config" / "caselaw_viewer_row_fingerprints.npz"
+MAX_NEW_MATCHES = 500
+
+
+def row_fingerprints(data: pd.DataFrame) -> np.ndarray:
+    columns = [c for c in EXPECTED_COLUMNS if c in data.columns]
+    return pd.util.hash_pandas_object(data[columns], index=False).to_numpy(dtype=np.uint64)
+
+
+def row_identity(data: pd.DataFrame, positions: np.ndarray) -> List[str]:
+    column = "file_path" if "file_path" in data.columns else "citation"
+    return [str(v) for v in data[column].to_numpy()[positions]]
+
+
+@dataclass
+class SavedSearch:
+    name: str
+    column: str
+    query: str
+    include_fuzzy: bool = False
+    from_date: Optional[str] = None
+    to_date: Optional[str] = None
+    new_matches: List[str] = field(default_factory=list)
+    last_checked: Optional[str] = None
+
+    @property
+    def new_count(self) -> int:
+        return len(self.new_matches)
+
+    def date_bounds(self) -> tuple:
+        return (
+            date.fromisoformat(self.from_date) if self.from_date else None,
+            date.fromisoformat(self.to_date) if self.to_date else None,
+        )
+
+
+@dataclass
+class SavedSearchConfig:
+    items: List[SavedSearch] = field(default_factory=list)
+
+    @staticmethod
+    def from_dict(d: Dict[str, Any]) -> "SavedSearchConfig":
+        items = []
+        allowed = {"name", "column", "query", "include_fuzzy", "from_date", "to_date", "new_matches", "last_checked"}
+        for raw in d.get("items", []):
+            if not isinstance(raw, dict):
+                continue
+            filtered = {k: v for k, v in raw.items() if k in allowed}
+            try:
+                items.append(SavedSearch(**filtered))
+            except TypeError as e:
+                logger.error(f"Invalid saved search in YAML: {e}")
+        return SavedSearchConfig(items=sorted(items, key=lambda i: i.name.lower()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"items": [asdict(i) for i in self.items]}
+
+
+class SavedSearchRegistry:
+    _instance = None
+
+    def __new__(cls) -> "SavedSearchRegistry":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._cfg = SavedSearchConfig()
+            cls._instance._lock = threading.RLock()
+            cls._instance.reload()
+        return cls._instance
+
+    def reload(self) -> None:
+        self._cfg = SavedSearchConfig.from_dict(load_yaml(USER_PATH))
+
+    def save(self) -> None:
+        with self._lock:
+            save_yaml(USER_PATH, self._cfg.to_dict())
+
+    def all_items(self) -> List[SavedSearch]:
+        return list(self._cfg.items)
+
+    def get(self, name: str) -> Optional[SavedSearch]:
+        for item in self._cfg.items:
+            if item.name == name:
+                return item
+        return None
+
+    def total_new(self) -> int:
+        return sum(i.new_count for i in self._cfg.items)
+
+    def upsert(self, item: SavedSearch) -> None:
+        with self._lock:
+            by = {i.name: i for i in self._cfg.items}
+            by[item.name] = item
+            self._cfg.items = sorted(by.values(), key=lambda i: i.name.lower())
+            self.save()
+
+    def delete(self, name: str) -> None:
+        with self._lock:
+            self._cfg.items = [i for i in self._cfg.items if i.name != name]
+            self.save()
+
+    def mark_seen(self, name: str) -> None:
+        with self._lock:
+            item = self.get(name)
+            if item is not None and item.new_matches:
+                item.new_matches = []
+                self.save()
+
+    def evaluate(self, data: pd.DataFrame, database: str) -> Dict[str, int]:
+        start = perf_counter()
+        fingerprints = row_fingerprints(data)
+        previous = self._load_snapshot(database)
+        if previous is None:
+            self._save_snapshot(database, fingerprints)
+            logger.info(f"Saved searches: recorded baseline of {len(data)} rows")
+            return {}
+
+        changed = np.flatnonzero(~np.isin(fingerprints, previous))
+        items = self.all_items()
+        added = self._apply_matches(items, self._evaluate_rows(data, changed, items)) if len(changed) and items else {}
+        self._save_snapshot(database, fingerprints)
+        logger.info(
+            f"Saved searches: evaluated {len(items)} searches over {len(changed)} new or changed "
+            f"rows in {perf_counter() - start:.2f}s ({sum(added.values())} new matches)"
+        )
+        return added
+
+    def _evaluate_rows(self, data: pd.DataFrame, changed: np.ndarray, items: List[SavedSearch]) -> Dict[str, List[str]]:
+        delta = data.iloc[changed].reset_index(drop=True)
+        delta_engine = SearchEngine(settings.fuzzy_search_threshold, settings.fuzzy_search_limit)
+        delta_filters = FilterEngine()
+        delta_filters.set_source_data(delta)
+        full_engine: Optional[SearchEngine] = None
+        full_filters: Optional[FilterEngine] = None
+        in_delta: Optional[np.ndarray] = None
+
+        matches: Dict[str, List[str]] = {}
+        for item in items:
+            if item.column not in delta.columns:
+                logger.warning(f"Saved search '{item.name}' targets missing column '{item.column}'")
+                continue
+            from_date, to_date = item.date_bounds()
+            if not item.include_fuzzy:
+                result = delta_engine.search(
+                    delta,
+                    item.column,
+                    item.query,
+                    min_query_length=settings.min_query_length_for_fuzzy,
+                    max_exact_before_fuzzy=0,
+                    rows=delta_filters.date_window(from_date, to_date),
+                )
+                if result.success:
+                    matches[item.name] = row_identity(delta, result.total_positions)
+                continue
+
+            # Whether fuzzy runs, and which values make the top list, depends on the whole table,
+            # so search it exactly as the live search would and keep only the new or changed rows.
+            if full_engine is None:
+                full_engine = SearchEngine(settings.fuzzy_search_threshold, settings.fuzzy_search_limit)
+                full_filters = FilterEngine()
+                full_filters.set_source_data(data)
+                in_delta = np.zeros(len(data), dtype=bool)
+                in_delta[changed] = True
+            result = full_engine.search(
+                data,
+                item.column,
+                item.query,
+                min_query_length=settings.min_query_length_for_fuzzy,
+                max_exact_before_fuzzy=settings.max_exact_matches_before_fuzzy,
+                rows=full_filters.date_window(from_date, to_date),
+            )
+            if result.success:
+                positions = result.total_positions
+                matches[item.name] = row_identity(data, positions[in_delta[positions]])
+        return matches
+
+    def _apply_matches(self, items: List[SavedSearch], matches: Dict[str, List[str]]) -> Dict[str, int]:
+        checked = datetime.now().isoformat(timespec="seconds")
+        evaluated = {i.name for i in items}
+        added: Dict[str, int] = {}
+        with self._lock:
+            for item in self._cfg.items:
+                if item.name not in evaluated:
+                    continue
+                item.last_checked = checked
+                known = set(item.new_matches)
+                fresh = [f for f in dict.fromkeys(matches.get(item.name, [])) if f not in known]
+                if fresh:
+                    item.new_matches = (item.new_matches + fresh)[-MAX_NEW_MATCHES:]
+                    added[item.name] = len(fresh)
+            self.save()
+        return added
+
+    def _load_snapshot(self, database: str) -> Optional[np.ndarray]:
+        if not SNAPSHOT_PATH.exists():
+            return None
+        try:
+            with np.load(SNAPSHOT_PATH, allow_pickle=False) as snapshot:
+                if str(snapshot["database"]) != database:
+                    return None
+                return snapshot["fingerprints"]
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Could not read row fingerprints: {e}")
+            return None
+
+    def _save_snapshot(self, database: str, fingerprints: np.ndarray) -> None:
+        try:
+            SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(SNAPSHOT_PATH, "wb") as f:
+                np.savez(f, database=np.array(database), fingerprints=np.unique(fingerprints))
+        except OSError as e:
+            logger.error(f"Failed saving row fingerprints: {e}", exc_info=True)
+
+
+saved_searches = SavedSearchRegistry()
@@ -1,34 +1,114 @@
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
 from thefuzz import process, fuzz
-from typing import Dict, Tuple, List, Any, Set, Optional
+from typing import Dict, Tuple, List, Any, Optional, Union
+from concurrent.futures.process import BrokenProcessPool
 import logging
+from core.bitset import RowBitset
+from core.fuzzy_pool import FuzzyPool, normalize_choice
 
 logger = logging.getLogger(__name__)
 
 CHUNK_SIZE = 5000
+POOL_MIN_CHOICES = 20000
+EXACT_SCORE = 100
+
+_EMPTY_POSITIONS = np.empty(0, dtype=np.intp)
+
+
+def _empty_positions() -> np.ndarray:
+    return _EMPTY_POSITIONS.copy()
+
+
+@contextmanager
+def _timed(timings: Dict[str, float], phase: str):
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + perf_counter() - start
 
 
 @dataclass
 class SearchResult:
-    exact_matches: pd.DataFrame
-    fuzzy_matches: pd.DataFrame
-    total_results: pd.DataFrame
-    duration: float
-    success: bool
+    exact_positions: np.ndarray = field(default_factory=_empty_positions)
+    fuzzy_positions: np.ndarray = field(default_factory=_empty_positions)
+    fuzzy_scores: np.ndarray = field(default_factory=_empty_positions)
+    total_positions: np.ndarray = field(default_factory=_empty_positions)
+    duration: float = 0.0
+    success: bool = True
     message: str = ""
     fuzzy_count: int = 0
+    source: Optional[pd.DataFrame] = field(default=None, repr=False)
+    timings: Dict[str, float] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def exact_count(self) -> int:
+        return len(self.exact_positions)
+
+    @property
+    def total_count(self) -> int:
+        return len(self.total_positions)
+
+    @property
+    def scores(self) -> np.ndarray:
+        exact = np.full(len(self.exact_positions), EXACT_SCORE, dtype=np.intp)
+        return np.concatenate([exact, self.fuzzy_scores])
+
+
+@dataclass
+class _ValueGroups:
+    codes: np.ndarray
+    uniques: List[Any]
+    code_of: Dict[Any, int]
+    order: np.ndarray
+    starts: np.ndarray
+
+    def positions_for(self, value: Any) -> np.ndarray:
+        code = self.code_of.get(value)
+        if code is None:
+            return _EMPTY_POSITIONS
+        return self.order[self.starts[code] : self.starts[code + 1]]
 
 
 class SearchEngine:
-    def __init__(self, fuzzy_threshold: int = 72, fuzzy_limit: int = 15):
+    def __init__(
+        self,
+        fuzzy_threshold: int = 72,
+        fuzzy_limit: int = 15,
+        fuzzy_workers: int = 0,
+        pool_min_choices: int = POOL_MIN_CHOICES,
+    ):
         self.fuzzy_threshold = fuzzy_threshold
         self.fuzzy_limit = fuzzy_limit
+        self.pool_min_choices = pool_min_choices
 
         self._source_data_id: Optional[int] = None
         self._string_columns_cache: Dict[str, pd.Series] = {}
-        self._unique_values_cache: Dict[str, List[Any]] = {}
-        self._value_to_indices_cache: Dict[str, Dict[Any, List[int]]] = {}
+        self._value_groups_cache: Dict[str, _ValueGroups] = {}
+        self._pool: Optional[FuzzyPool] = None
+        self.set_fuzzy_workers(fuzzy_workers)
+
+    @property
+    def fuzzy_workers(self) -> int:
+        return self._pool.workers if self._pool is not None else 0
+
+    def set_fuzzy_workers(self, workers: int) -> None:
+        if workers == self.fuzzy_workers:
+            return
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        if workers > 0:
+            self._pool = FuzzyPool(workers)
+        logger.info(f"Fuzzy scoring mode: {f'{workers} worker processes' if workers > 0 else 'in-process'}")
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return self._pool.stats() if self._pool is not None else {"workers": 0}
 
     def set_source_data(self, data: pd.DataFrame) -> None:
         new_id = id(data)
@@ -36,6 +116,15 @@ class SearchEngine:
             self._source_data_id = new_id
             self.clear_cache()
 
+    def warm(self, data: pd.DataFrame, column: str) -> None:
+        if column not in data.columns:
+            raise ValueError(f"Column '{column}' not found in data")
+        self.set_source_data(data)
+        string_column = self._get_string_column(data, column)
+        groups = self._get_value_groups(string_column)
+        if self._pool is not None and len(groups.uniques) >= self.pool_min_choices:
+            self._pool.publish(column, groups.uniques)
+
     def search(
         self,
         data: pd.DataFrame,
@@ -43,101 +132,203 @@ class SearchEngine:
         query: str,
         min_query_length: int = 3,
         max_exact_before_fuzzy: int = 5,
+        rows: Optional[Union[np.ndarray, RowBitset]] = None,
+        exact_positions: Optional[np.ndarray] = None,
     ) -> SearchResult:
+        timings: Dict[str, float] = {}
+        counts: Dict[str, int] = {"rows": len(data)}
         try:
             if column not in data.columns:
                 raise ValueError(f"Column '{column}' not found in data")
 
-            string_column = self._get_string_column(data, column)
-            exact_matches = data[
-                string_column.str.contains(query, na=False, case=False, regex=False)
-            ]
-
-            fuzzy_matches = pd.DataFrame()
-            if (
-                len(exact_matches) < max_exact_before_fuzzy
-                and len(query) >= min_query_length
-            ):
-                fuzzy_matches = self._fuzzy_search(
-                    data, string_column, query, exact_matches.index
+            self.set_source_data(data)
+            with _timed(timings, "prepare"):
+                string_column = self._get_string_column(data, column)
+                candidates = None if rows is None else self._as_positions(rows, len(data))
+            counts["candidates"] = len(data) if candidates is None else len(candidates)
+
+            if exact_positions is None:
+                with _timed(timings, "exact"):
+                    exact_positions = self._exact_search(string_column, query, candidates)
+            counts["exact"] = len(exact_positions)
+
+            fuzzy_positions = fuzzy_scores = _EMPTY_POSITIONS
+            if self.wants_fuzzy(len(exact_positions), query, min_query_length, max_exact_before_fuzzy):
+                fuzzy_positions, fuzzy_scores = self._fuzzy_search(
+                    data, string_column, query, candidates, exact_positions, timings, counts
                 )
+            counts["fuzzy"] = len(fuzzy_positions)
 
-            total_results = pd.concat([exact_matches, fuzzy_matches]).drop_duplicates()
+            with _timed(timings, "merge"):
+                total_positions = np.concatenate([exact_positions, fuzzy_positions])
 
             return SearchResult(
-                exact_matches=exact_matches,
-                fuzzy_matches=fuzzy_matches,
-                total_results=total_results,
-                duration=0.0,
+                exact_positions=exact_positions,
+                fuzzy_positions=fuzzy_positions,
+                fuzzy_scores=fuzzy_scores,
+                total_positions=total_positions,
                 success=True,
-                message=f"Found {len(exact_matches)} exact matches",
-                fuzzy_count=len(fuzzy_matches),
+                message=f"Found {len(exact_positions)} exact matches",
+                fuzzy_count=len(fuzzy_positions),
+                source=data,
+                timings=timings,
+                counts=counts,
             )
         except ValueError as e:
             logger.error(f"Search validation failed: {e}", exc_info=True)
-            return SearchResult(
-                exact_matches=pd.DataFrame(),
-                fuzzy_matches=pd.DataFrame(),
-                total_results=pd.DataFrame(),
-                duration=0.0,
-                success=False,
-                message=str(e),
-            )
+            return SearchResult(success=False, message=str(e))
         except MemoryError as e:
             logger.error(f"Search ran out of memory: {e}", exc_info=True)
             return SearchResult(
-                exact_matches=pd.DataFrame(),
-                fuzzy_matches=pd.DataFrame(),
-                total_results=pd.DataFrame(),
-                duration=0.0,
                 success=False,
                 message="Search ran out of memory. Try a more specific query.",
             )
         except Exception as e:
             logger.error(f"Search failed unexpectedly: {e}", exc_info=True)
-            return SearchResult(
-                exact_matches=pd.DataFrame(),
-                fuzzy_matches=pd.DataFrame(),
-                total_results=pd.DataFrame(),
-                duration=0.0,
-                success=False,
-                message=f"Unexpected error: {str(e)}",
-            )
+            return SearchResult(success=False, message=f"Unexpected error: {str(e)}")
+
+    def string_column(self, data: pd.DataFrame, column: str) -> pd.Series:
+        if column not in data.columns:
+            raise ValueError(f"Column '{column}' not found in data")
+        self.set_source_data(data)
+        return self._get_string_column(data, column)
+
+    def adopt_string_column(self, data: pd.DataFrame, string_column: pd.Series) -> None:
+        # Lets a second engine reuse a column another engine already converted for the same frame.
+        self.set_source_data(data)
+        self._string_columns_cache.setdefault(string_column.name, string_column)
+
+    @staticmethod
+    def wants_fuzzy(exact_count: int, query: str, min_query_length: int, max_exact_before_fuzzy: int) -> bool:
+        return exact_count < max_exact_before_fuzzy and len(query) >= min_query_length
+
+    @staticmethod
+    def _as_positions(rows: Union[np.ndarray, RowBitset], n_rows: int) -> np.ndarray:
+        if isinstance(rows, RowBitset):
+            if len(rows) != n_rows:
+                raise ValueError(f"Row bitset has {len(rows)} entries, expected {n_rows}")
+            return rows.to_positions()
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            if len(rows) != n_rows:
+                raise ValueError(f"Row mask has {len(rows)} entries, expected {n_rows}")
+            return np.flatnonzero(rows)
+        return rows.astype(np.intp, copy=False)
+
+    def _exact_search(
+        self, string_column: pd.Series, query: str, candidates: Optional[np.ndarray]
+    ) -> np.ndarray:
+        subset = string_column if candidates is None else string_column.iloc[candidates]
+        hits = subset.str.contains(query, na=False, case=False, regex=False)
+        hit_positions = np.flatnonzero(hits.to_numpy(dtype=bool))
+        return hit_positions if candidates is None else candidates[hit_positions]
 
     def _get_string_column(self, data: pd.DataFrame, column: str) -> pd.Series:
-        if column in self._string_columns_cache:
-            cached = self._string_columns_cache[column]
-            return cached.loc[cached.index.intersection(data.index)]
+        cached = self._string_columns_cache.get(column)
+        if cached is not None:
+            return cached
 
-        string_col = data[column].astype(str)
+        string_col = pd.Series(data[column].astype(str).to_numpy(), name=column)
         self._string_columns_cache[column] = string_col
         return string_col
 
-    def _get_unique_values(self, data: pd.DataFrame, column: str) -> List[Any]:
-        string_col = self._get_string_column(data, column)
-        return string_col.unique().tolist()
-
-    def _get_value_to_indices(
-        self, data: pd.DataFrame, string_column: pd.Series
-    ) -> Dict[Any, List[int]]:
+    def _get_value_groups(self, string_column: pd.Series) -> _ValueGroups:
         column = string_column.name
+        cached = self._value_groups_cache.get(column)
+        if cached is not None:
+            return cached
+
+        codes, uniques = pd.factorize(string_column, use_na_sentinel=False)
+        order = np.argsort(codes, kind="stable")
+        starts = np.zeros(len(uniques) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(codes, minlength=len(uniques)), out=starts[1:])
+        unique_list = list(uniques)
+        groups = _ValueGroups(
+            codes=codes,
+            uniques=unique_list,
+            code_of={value: code for code, value in enumerate(unique_list)},
+            order=order,
+            starts=starts,
+        )
+        self._value_groups_cache[column] = groups
+        return groups
 
-        value_to_indices: Dict[Any, List[int]] = {}
-        for idx, val in string_column.items():
-            value_to_indices.setdefault(val, []).append(idx)
-        return value_to_indices
+    def _get_unique_values(
+        self, groups: _ValueGroups, candidate_codes: Optional[np.ndarray]
+    ) -> List[Any]:
+        if candidate_codes is None:
+            return groups.uniques
+        return [groups.uniques[c] for c in candidate_codes]
 
     def _fuzzy_search(
         self,
         data: pd.DataFrame,
         string_column: pd.Series,
         query: str,
-        exclude_indices: pd.Index,
-    ) -> pd.DataFrame:
-        unique_values = self._get_unique_values(data, string_column.name)
-        
-        logger.debug(f"Fuzzy search over {len(unique_values)} unique values")
+        candidates: Optional[np.ndarray],
+        exclude_positions: np.ndarray,
+        timings: Dict[str, float],
+        counts: Dict[str, int],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        with _timed(timings, "fuzzy_groups"):
+            groups = self._get_value_groups(string_column)
+            candidate_codes = None if candidates is None else pd.unique(groups.codes[candidates])
+        n_choices = len(groups.uniques) if candidate_codes is None else len(candidate_codes)
+        counts["fuzzy_choices"] = n_choices
+
+        logger.debug(f"Fuzzy search over {n_choices} unique values")
+
+        with _timed(timings, "fuzzy_score"):
+            all_results = None
+            if self._pool is not None and n_choices >= self.pool_min_choices:
+                try:
+                    all_results = self._score_with_pool(string_column.name, groups, query, candidate_codes)
+                except (BrokenProcessPool, OSError) as e:
+                    logger.warning(f"Fuzzy worker pool failed, scoring in-process: {e}")
+            if all_results is None:
+                unique_values = self._get_unique_values(groups, candidate_codes)
+                all_results = self._score_choices(query, unique_values)
+
+        all_results.sort(key=lambda x: x[1], reverse=True)
+        top_results = all_results[: self.fuzzy_limit]
+        if not top_results:
+            return _EMPTY_POSITIONS, _EMPTY_POSITIONS
+
+        with _timed(timings, "fuzzy_rows"):
+            allowed = np.ones(len(data), dtype=bool) if candidates is None else np.zeros(len(data), dtype=bool)
+            if candidates is not None:
+                allowed[candidates] = True
+            allowed[exclude_positions] = False
 
+            fuzzy_positions: List[np.ndarray] = []
+            fuzzy_scores: List[np.ndarray] = []
+            for match, score in top_results:
+                positions = groups.positions_for(match)
+                positions = positions[allowed[positions]]
+                fuzzy_positions.append(positions)
+                fuzzy_scores.append(np.full(len(positions), score, dtype=np.intp))
+
+            return np.concatenate(fuzzy_positions), np.concatenate(fuzzy_scores)
+
+    def _score_with_pool(
+        self,
+        column: str,
+        groups: _ValueGroups,
+        query: str,
+        candidate_codes: Optional[np.ndarray],
+    ) -> List[Tuple[Any, int]]:
+        handle = self._pool.publish(column, groups.uniques)
+        scored = self._pool.score(
+            handle,
+            query,
+            score_cutoff=self.fuzzy_threshold,
+            limit=self.fuzzy_limit,
+            chunk_size=CHUNK_SIZE,
+            indices=candidate_codes,
+        )
+        return [(groups.uniques[code], score) for code, score in scored]
+
+    def _score_choices(self, query: str, unique_values: List[Any]) -> List[Tuple[Any, int]]:
         all_results: List[Tuple[Any, int]] = []
 
         for i in range(0, len(unique_values), CHUNK_SIZE):
@@ -147,7 +338,7 @@ class SearchEngine:
                     query=query,
                     choices=chunk,
                     scorer=fuzz.token_set_ratio,
-                    processor=lambda x: str(x).lower().strip(),
+                    processor=normalize_choice,
                     score_cutoff=self.fuzzy_threshold,
                     limit=self.fuzzy_limit,
                 )
@@ -159,22 +350,11 @@ class SearchEngine:
                 )
                 break
 
-        all_results.sort(key=lambda x: x[1], reverse=True)
-        top_results = all_results[: self.fuzzy_limit]
-
-        value_to_indices = self._get_value_to_indices(data, string_column)
-
-        exclude_set: Set[Any] = set(exclude_indices)
-
-        fuzzy_indices: List[int] = []
-        for match, _score in top_results:
-            indices = value_to_indices.get(match, [])
-            fuzzy_indices.extend(idx for idx in indices if idx not in exclude_set)
-
-        return data.loc[fuzzy_indices] if fuzzy_indices else pd.DataFrame()
+        return all_results
 
     def clear_cache(self) -> None:
         self._string_columns_cache.clear()
-        self._unique_values_cache.clear()
-        self._value_to_indices_cache.clear()
-        logger.debug("Search engine cache cleared")
\ No newline at end of file
+        self._value_groups_cache.clear()
+        if self._pool is not None:
+            self._pool.release_all()
+        logger.debug("Search engine cache cleared")
@@ -0,0 +1,181 @@
+from __future__ import annotations
+import base64
+import gzip
+import http.client
+import json
+import logging
+import threading
+from datetime import date
+from time import perf_counter
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import numpy as np
+import pandas as pd
+from core.search import SearchResult
+
+logger = logging.getLogger(__name__)
+
+POSITION_DTYPE = "<i4"
+NULLABLE_INT_COLUMNS = ("year", "month", "day")
+
+
+_shared_clients: Dict[Tuple[str, float], "SearchClient"] = {}
+_shared_lock = threading.Lock()
+
+
+class SearchServerError(RuntimeError):
+    pass
+
+
+def encode_positions(positions: np.ndarray) -> str:
+    return base64.b64encode(np.asarray(positions, dtype=POSITION_DTYPE).tobytes()).decode("ascii")
+
+
+def decode_positions(encoded: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(encoded), dtype=POSITION_DTYPE).astype(np.intp)
+
+
+def result_to_payload(result: SearchResult) -> Dict[str, Any]:
+    return {
+        "success": result.success,
+        "message": result.message,
+        "exact_positions": encode_positions(result.exact_positions),
+        "fuzzy_positions": encode_positions(result.fuzzy_positions),
+        "fuzzy_scores": encode_positions(result.fuzzy_scores),
+        "duration": result.duration,
+        "timings": result.timings,
+        "counts": result.counts,
+    }
+
+
+def result_from_payload(payload: Dict[str, Any], source: Optional[pd.DataFrame] = None) -> SearchResult:
+    exact = decode_positions(payload["exact_positions"])
+    fuzzy = decode_positions(payload["fuzzy_positions"])
+    return SearchResult(
+        exact_positions=exact,
+        fuzzy_positions=fuzzy,
+        fuzzy_scores=decode_positions(payload["fuzzy_scores"]),
+        total_positions=np.concatenate([exact, fuzzy]),
+        duration=payload.get("duration", 0.0),
+        success=payload.get("success", True),
+        message=payload.get("message", ""),
+        fuzzy_count=len(fuzzy),
+        source=source,
+        timings=dict(payload.get("timings", {})),
+        counts=dict(payload.get("counts", {})),
+    )
+
+
+def table_to_payload(data: pd.DataFrame, version: str) -> Dict[str, Any]:
+    columns = {}
+    for column in data.columns:
+        values = data[column]
+        columns[str(column)] = values.astype(object).where(values.notna(), None).tolist()
+    return {"version": version, "rows": len(data), "columns": columns}
+
+
+def table_from_payload(payload: Dict[str, Any]) -> pd.DataFrame:
+    data = pd.DataFrame(payload["columns"])
+    for column in NULLABLE_INT_COLUMNS:
+        if column in data.columns:
+            data[column] = pd.array(data[column], dtype="Int64")
+    return data
+
+
+class SearchClient:
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        parts = urlsplit(base_url if "://" in base_url else f"http://{base_url}")
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError(f"Unsupported search server URL: '{base_url}'")
+        self.base_url = f"http://{parts.hostname}:{parts.port or 80}"
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def health(self) -> Dict[str, Any]:
+        return self._request("GET", "/health")
+
+    def fetch_table(self) -> pd.DataFrame:
+        start = perf_counter()
+        payload = self._request("GET", "/table")
+        data = table_from_payload(payload)
+        data.attrs["search_server_url"] = self.base_url
+        data.attrs["search_server_version"] = payload.get("version", "")
+        logger.info(f"Fetched {len(data)} rows from {self.base_url} in {perf_counter() - start:.2f}s")
+        return data
+
+    def search(
+        self,
+        column: str,
+        query: str,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        min_query_length: int = 3,
+        max_exact_before_fuzzy: int = 5,
+        source: Optional[pd.DataFrame] = None,
+    ) -> SearchResult:
+        body = {
+            "column": column,
+            "query": query,
+            "from_date": from_date.isoformat() if from_date else None,
+            "to_date": to_date.isoformat() if to_date else None,
+            "min_query_length": min_query_length,
+            "max_exact_before_fuzzy": max_exact_before_fuzzy,
+        }
+        return result_from_payload(self._request("POST", "/search", body), source=source)
+
+    def case_text(self, file_path: str) -> str:
+        return self._request("POST", "/case-text", {"file_path": file_path})["text"]
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        encoded = None if body is None else json.dumps(body).encode("utf-8")
+        headers = {"Accept-Encoding": "gzip"}
+        if encoded is not None:
+            headers["Content-Type"] = "application/json"
+
+        for attempt in (1, 2):
+            conn = self._connection()
+            try:
+                conn.request(method, path, body=encoded, headers=headers)
+                response = conn.getresponse()
+                raw = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError) as e:
+                self.close()
+                if attempt == 2:
+                    raise SearchServerError(f"Search server {self.base_url} unreachable: {e}") from e
+            except OSError as e:
+                self.close()
+                raise SearchServerError(f"Search server {self.base_url} unreachable: {e}") from e
+
+        if response.getheader("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        try:
+            payload = json.loads(raw.decode("utf-8")) if raw else {}
+        except ValueError as e:
+            raise SearchServerError(f"Invalid response from {self.base_url}{path}: {e}") from e
+        if response.status != 200:
+            raise SearchServerError(payload.get("error") or f"{method} {path} failed with HTTP {response.status}")
+        return payload
+
+
+def shared_client(base_url: str, timeout: float = 10.0) -> SearchClient:
+    with _shared_lock:
+        client = _shared_clients.get((base_url, timeout))
+        if client is None:
+            client = _shared_clients[(base_url, timeout)] = SearchClient(base_url, timeout=timeout)
+        return client
@@ -0,0 +1,100 @@
+from __future__ import annotations
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+SEGMENTER_VERSION = 1
+SEGMENT_KINDS = ["caption", "syllabus", "majority", "concurrence", "dissent", "footnotes"]
+SEGMENT_LABELS = {
+    "caption": "Caption",
+    "syllabus": "Syllabus / headnotes",
+    "majority": "Majority opinion",
+    "concurrence": "Concurrences",
+    "dissent": "Dissents",
+    "footnotes": "Footnotes",
+}
+SEGMENT_SEPARATOR = "\n\n"
+
+_OPINION_HEAD = re.compile(
+    r"(?<![\w,(])(?P<author>[A-Z][A-Za-z'’-]+)"
+    r",\s+(?P<title>(?:(?:Chief|Presiding|Senior|Senior Appellate|Special|Acting)\s+)*(?:Judge|Justice))"
+    r"(?:,\s+(?P<role>(?:concurring|dissenting)[^.]{0,80}?))?\.(?=\s|$)"
+)
+_PER_CURIAM = re.compile(r"\bPER CURIAM\.", re.IGNORECASE)
+_SYLLABUS = re.compile(r"\b(?:SYLLABUS|Syllabus|HEADNOTES?|Headnotes?)\b")
+_FOOTNOTES = re.compile(r"\b(?:FOOTNOTES|Footnotes)\b")
+
+
+@dataclass
+class Segment:
+    kind: str
+    start: int
+    end: int
+    label: str = ""
+
+    @staticmethod
+    def from_dict(d: Dict[str, Any]) -> "Segment":
+        return Segment(kind=d["kind"], start=int(d["start"]), end=int(d["end"]), label=d.get("label", ""))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _role_kind(role: Optional[str]) -> str:
+    if not role:
+        return "majority"
+    return "dissent" if "dissent" in role.lower() else "concurrence"
+
+
+def segment_opinion(text: str) -> List[Segment]:
+    heads = [(m.start(), _role_kind(m.group("role")), f"{m.group('author')}, {m.group('title')}")
+             for m in _OPINION_HEAD.finditer(text)]
+    per_curiam = _PER_CURIAM.search(text)
+    if per_curiam is not None:
+        heads.append((per_curiam.start(), "majority", "Per Curiam"))
+    heads.sort()
+
+    opinion_start = next((start for start, kind, _ in heads if kind == "majority"), None)
+    if opinion_start is None:
+        return [Segment("majority", 0, len(text))] if text else []
+
+    segments: List[Segment] = []
+    head_matter = text[:opinion_start]
+    syllabus = _SYLLABUS.search(head_matter)
+    if syllabus is not None:
+        if syllabus.start():
+            segments.append(Segment("caption", 0, syllabus.start()))
+        segments.append(Segment("syllabus", syllabus.start(), opinion_start))
+    elif opinion_start:
+        segments.append(Segment("caption", 0, opinion_start))
+
+    footnotes = None
+    for match in _FOOTNOTES.finditer(text, opinion_start):
+        footnotes = match
+    body_end = footnotes.start() if footnotes is not None else len(text)
+
+    for start, kind, label in heads:
+        if start < opinion_start or start >= body_end or kind == "majority" and start != opinion_start:
+            continue
+        if segments and segments[-1].start == start:
+            continue
+        segments.append(Segment(kind, start, body_end, label))
+
+    if footnotes is not None:
+        segments.append(Segment("footnotes", footnotes.start(), len(text)))
+    for segment, following in zip(segments, segments[1:]):
+        segment.end = following.start
+    return segments
+
+
+def select_segments(text: str, segments: Iterable[Segment], kinds: Iterable[str]) -> str:
+    wanted = set(kinds)
+    parts = [text[s.start:s.end].strip() for s in segments if s.kind in wanted]
+    parts = [p for p in parts if p]
+    if not parts:
+        logger.info(f"No {', '.join(sorted(wanted))} segments found; using the full opinion")
+        return text
+    return SEGMENT_SEPARATOR.join(parts)
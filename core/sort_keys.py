@@ -0,0 +1,138 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Dict, Optional
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+RELEVANCE = -1
+GATHER_RATIO = 16
+CITATION_PATTERN = r"(\d+)\s+(.+?)\s+(\d+)\s*$"
+
+
+@dataclass
+class SortKey:
+    ranks: np.ndarray
+    permutation: np.ndarray
+    missing: np.ndarray
+
+    def argsort(self, positions: np.ndarray, descending: bool = False) -> np.ndarray:
+        positions = np.asarray(positions, dtype=np.intp)
+        n_rows = len(self.ranks)
+        if len(positions) * GATHER_RATIO < n_rows:
+            indices = np.argsort(self.ranks[positions], kind="stable")
+        else:
+            slots = np.full(n_rows, -1, dtype=np.intp)
+            slots[positions] = np.arange(len(positions), dtype=np.intp)
+            indices = slots[self.permutation]
+            indices = indices[indices >= 0]
+
+        if not descending:
+            return indices
+        n_present = len(indices) - int(self.missing[positions[indices]].sum())
+        return np.concatenate([indices[:n_present][::-1], indices[n_present:]])
+
+    def order(self, positions: np.ndarray, descending: bool = False) -> np.ndarray:
+        positions = np.asarray(positions, dtype=np.intp)
+        return positions[self.argsort(positions, descending=descending)]
+
+
+def _from_lexsort(keys, missing: np.ndarray) -> SortKey:
+    permutation = np.lexsort(keys).astype(np.intp)
+    ranks = np.empty(len(permutation), dtype=np.intp)
+    ranks[permutation] = np.arange(len(permutation), dtype=np.intp)
+    return SortKey(ranks=ranks, permutation=permutation, missing=missing)
+
+
+def _text_codes(values: pd.Series) -> np.ndarray:
+    codes, _ = pd.factorize(values, sort=True, use_na_sentinel=True)
+    return codes
+
+
+def _casefolded(column: pd.Series) -> pd.Series:
+    text = column.astype("string").str.strip().str.casefold()
+    return text.mask(text == "")
+
+
+def _text_key(column: pd.Series) -> SortKey:
+    text = _casefolded(column)
+    missing = text.isna().to_numpy()
+    return _from_lexsort((_text_codes(text), missing), missing)
+
+
+def _date_key(data: pd.DataFrame) -> SortKey:
+    if not {"year", "month", "day"}.issubset(data.columns):
+        return _text_key(data["date"])
+    year = pd.to_numeric(data["year"], errors="coerce")
+    month = pd.to_numeric(data["month"], errors="coerce")
+    day = pd.to_numeric(data["day"], errors="coerce")
+    missing = year.isna().to_numpy()
+    return _from_lexsort(
+        (
+            day.fillna(0).to_numpy(dtype=np.int64),
+            month.fillna(0).to_numpy(dtype=np.int64),
+            year.fillna(0).to_numpy(dtype=np.int64),
+            missing,
+        ),
+        missing,
+    )
+
+
+def _citation_key(column: pd.Series) -> SortKey:
+    text = _casefolded(column)
+    parts = text.str.extract(CITATION_PATTERN)
+    volume = pd.to_numeric(parts[0], errors="coerce")
+    page = pd.to_numeric(parts[2], errors="coerce")
+    unparsed = volume.isna().to_numpy() | page.isna().to_numpy()
+    missing = text.isna().to_numpy()
+    return _from_lexsort(
+        (
+            _text_codes(text),
+            page.fillna(0).to_numpy(dtype=np.int64),
+            volume.fillna(0).to_numpy(dtype=np.int64),
+            _text_codes(parts[1]),
+            unparsed,
+            missing,
+        ),
+        missing,
+    )
+
+
+class SortKeyCache:
+    def __init__(self):
+        self._source_data_id: Optional[int] = None
+        self._keys: Dict[str, SortKey] = {}
+
+    def set_source_data(self, data: pd.DataFrame) -> None:
+        new_id = id(data)
+        if self._source_data_id != new_id:
+            self._source_data_id = new_id
+            self._keys.clear()
+
+    def key(self, data: pd.DataFrame, column: str) -> SortKey:
+        self.set_source_data(data)
+        cached = self._keys.get(column)
+        if cached is not None:
+            return cached
+
+        start = perf_counter()
+        if column == "date":
+            key = _date_key(data)
+        elif column == "reporter_citation":
+            key = _citation_key(data[column])
+        else:
+            key = _text_key(data[column])
+        self._keys[column] = key
+        logger.info(f"Built sort key for '{column}' over {len(data)} rows in {perf_counter() - start:.3f}s")
+        return key
+
+    def argsort(
+        self, data: pd.DataFrame, positions: np.ndarray, column: str, descending: bool = False
+    ) -> np.ndarray:
+        return self.key(data, column).argsort(positions, descending=descending)
+
+    def clear_cache(self) -> None:
+        self._keys.clear()
@@ -0,0 +1,213 @@
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from config.settings import settings
+from core.segmenter import SEGMENTER_VERSION, Segment, segment_opinion
+from core.text_store import CaseTextStore, text_store
+from utils.diagnostics import register_provider
+from utils.helpers import validate_and_resolve_path
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 2
+DISK_SUFFIX = ".zz"
+SEGMENTS_SUFFIX = ".seg.json"
+MAX_SEGMENT_ENTRIES = 4096
+
+
+def cache_key(path: Path, stat: os.stat_result) -> str:
+    raw = f"{FORMAT_VERSION}|{path}|{stat.st_mtime_ns}|{stat.st_size}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CaseTextCache:
+    def __init__(self, disk_dir: Optional[Path], max_memory_chars: int, store: Optional[CaseTextStore] = None):
+        self._disk_dir = disk_dir
+        self._store = store
+        self._max_memory_chars = max_memory_chars
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._memory_chars = 0
+        self._segments: "OrderedDict[str, List[Segment]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._store_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def get(self, file_path: str, extract: Callable[[str], str]) -> str:
+        return self._lookup(file_path, extract)[1]
+
+    def get_segments(self, file_path: str, extract: Callable[[str], str]) -> Tuple[str, List[Segment]]:
+        key, text = self._lookup(file_path, extract)
+        with self._lock:
+            segments = self._segments.get(key)
+            if segments is not None:
+                self._segments.move_to_end(key)
+                return text, segments
+
+        segments = self._read_segments(key)
+        if segments is None:
+            segments = segment_opinion(text)
+            self._write_segments(key, segments)
+        with self._lock:
+            self._segments[key] = segments
+            while len(self._segments) > MAX_SEGMENT_ENTRIES:
+                self._segments.popitem(last=False)
+        return text, segments
+
+    def _lookup(self, file_path: str, extract: Callable[[str], str]) -> Tuple[str, str]:
+        file_path = file_path.strip()
+        path = validate_and_resolve_path(file_path, fallback_subdir="Caselaw")
+        stat = path.stat()
+        key = cache_key(path, stat)
+
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return key, text
+
+        if self._store is not None:
+            text = self._store.get(file_path, stat)
+            if text is not None:
+                with self._lock:
+                    self._store_hits += 1
+                self._remember(key, text)
+                return key, text
+
+        text = self._read_disk(key)
+        if text is not None:
+            with self._lock:
+                self._disk_hits += 1
+            self._remember(key, text)
+            return key, text
+
+        text = extract(str(path))
+        with self._lock:
+            self._misses += 1
+        self._remember(key, text)
+        self._write_disk(key, text)
+        return key, text
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_chars = 0
+            self._segments.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self._memory_hits + self._store_hits + self._disk_hits
+            lookups = hits + self._misses
+            stats = {
+                "memory hits": self._memory_hits,
+                "text store hits": self._store_hits,
+                "disk hits": self._disk_hits,
+                "misses (parsed)": self._misses,
+                "hit rate": f"{hits / lookups:.0%}" if lookups else "n/a",
+                "memory entries": len(self._memory),
+                "memory size": f"{self._memory_chars / 1e6:.1f}M chars of {self._max_memory_chars / 1e6:.0f}M",
+            }
+        files, size = self._disk_usage()
+        stats["disk store"] = str(self._disk_dir) if self._disk_dir else "disabled"
+        stats["disk entries"] = files
+        stats["disk size"] = f"{size / 1e6:.1f} MB"
+        return stats
+
+    def _remember(self, key: str, text: str) -> None:
+        if len(text) > self._max_memory_chars:
+            return
+        with self._lock:
+            if key in self._memory:
+                return
+            self._memory[key] = text
+            self._memory_chars += len(text)
+            while self._memory_chars > self._max_memory_chars:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_chars -= len(evicted)
+
+    def _disk_path(self, key: str, suffix: str = DISK_SUFFIX) -> Optional[Path]:
+        if self._disk_dir is None:
+            return None
+        return self._disk_dir / key[:2] / f"{key}{suffix}"
+
+    def _read_segments(self, key: str) -> Optional[List[Segment]]:
+        path = self._disk_path(key, SEGMENTS_SUFFIX)
+        if path is None:
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != SEGMENTER_VERSION:
+                return None
+            return [Segment.from_dict(d) for d in data["segments"]]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding unreadable cached segments {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_segments(self, key: str, segments: List[Segment]) -> None:
+        path = self._disk_path(key, SEGMENTS_SUFFIX)
+        if path is None:
+            return
+        payload = json.dumps({"version": SEGMENTER_VERSION, "segments": [s.to_dict() for s in segments]})
+        self._write_atomic(path, payload.encode("utf-8"))
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            return zlib.decompress(path.read_bytes()).decode("utf-8")
+        except FileNotFoundError:
+            return None
+        except (OSError, zlib.error, UnicodeDecodeError) as e:
+            logger.warning(f"Discarding unreadable cached case text {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_disk(self, key: str, text: str) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        self._write_atomic(path, zlib.compress(text.encode("utf-8"), 6))
+
+    def _write_atomic(self, path: Path, payload: bytes) -> None:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(payload)
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not store cached case text {path.name}: {e}")
+            tmp.unlink(missing_ok=True)
+
+    def _disk_usage(self) -> tuple:
+        if self._disk_dir is None or not self._disk_dir.exists():
+            return 0, 0
+        files = size = 0
+        for shard in os.scandir(self._disk_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(DISK_SUFFIX):
+                    files += 1
+                    size += entry.stat().st_size
+        return files, size
+
+
+text_cache = CaseTextCache(
+    Path(settings.text_cache_dir) if settings.text_cache_dir else None,
+    settings.text_cache_memory_mb * 1_000_000,
+    text_store,
+)
+register_provider("Case text cache", text_cache.stats)
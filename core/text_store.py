@@ -0,0 +1,228 @@
+from __future__ import annotations
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+import weakref
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from config.settings import settings
+from utils.diagnostics import register_provider
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 2
+WRITE_BATCH = 200
+IN_FLIGHT_PER_WORKER = 8
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS texts (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    chars INTEGER NOT NULL,
+    body BLOB NOT NULL
+)
+"""
+
+Entry = Tuple[str, int, int, int, bytes]
+
+
+class _Reader:
+    __slots__ = ("conn", "generation", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection, generation: int):
+        self.conn = conn
+        self.generation = generation
+
+
+class CaseTextStore:
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # WAL lets every reader thread query through its own connection while the writer holds _lock.
+        # Only the thread-local holds a reader, so it is closed when its thread goes away.
+        self._local = threading.local()
+        self._readers: weakref.WeakSet = weakref.WeakSet()
+        self._generation = 0
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._stale = 0
+        self._missing = 0
+
+    def get(self, file_path: str, stat: os.stat_result) -> Optional[str]:
+        conn = self._reader()
+        if conn is None:
+            return None
+        row = conn.execute("SELECT mtime_ns, size, body FROM texts WHERE path = ?", (file_path.strip(),)).fetchone()
+        with self._stats_lock:
+            if row is None:
+                self._missing += 1
+                return None
+            if (row[0], row[1]) != (stat.st_mtime_ns, stat.st_size):
+                self._stale += 1
+                return None
+            self._hits += 1
+        return zlib.decompress(row[2]).decode("utf-8")
+
+    def versions(self) -> Dict[str, Tuple[int, int]]:
+        conn = self._reader()
+        if conn is None:
+            return {}
+        return {path: (mtime, size) for path, mtime, size in conn.execute("SELECT path, mtime_ns, size FROM texts")}
+
+    def put_many(self, entries: Iterable[Entry]) -> None:
+        with self._lock:
+            conn = self._connection(create=True)
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO texts VALUES (?, ?, ?, ?, ?)", entries)
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {"file": str(self.db_path)}
+        with self._stats_lock:
+            stats.update({"hits": self._hits, "stale": self._stale, "not stored": self._missing})
+        conn = self._reader()
+        if conn is None:
+            stats["entries"] = "not built"
+            return stats
+        count, chars, stored = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(chars), 0), COALESCE(SUM(LENGTH(body)), 0) FROM texts"
+        ).fetchone()
+        stats["entries"] = count
+        stats["text"] = f"{chars / 1e6:.1f}M chars in {stored / 1e6:.1f} MB"
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            readers, self._readers = list(self._readers), weakref.WeakSet()
+            self._generation += 1
+            for reader in readers:
+                reader.conn.close()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _reader(self) -> Optional[sqlite3.Connection]:
+        reader = getattr(self._local, "reader", None)
+        if reader is not None and reader.generation == self._generation:
+            return reader.conn
+        with self._lock:
+            # Opening the writer first creates or resets the schema before anyone reads it.
+            if self._connection(create=False) is None:
+                return None
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA query_only = ON")
+            reader = _Reader(conn, self._generation)
+            self._readers.add(reader)
+            self._local.reader = reader
+        return conn
+
+    def _connection(self, create: bool) -> Optional[sqlite3.Connection]:
+        if self._conn is not None:
+            return self._conn
+        if not create and not self.db_path.exists():
+            return None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != FORMAT_VERSION:
+            logger.info(f"Resetting case text store {self.db_path.name} to format {FORMAT_VERSION}")
+            conn.execute("DROP TABLE IF EXISTS texts")
+            conn.execute(f"PRAGMA user_version = {FORMAT_VERSION}")
+        conn.execute(_SCHEMA)
+        conn.commit()
+        self._conn = conn
+        return conn
+
+
+@dataclass
+class BuildSummary:
+    total: int = 0
+    done: int = 0
+    stored: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    elapsed_s: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+
+def _extract_entry(file_path: str, known: Optional[Tuple[int, int]]) -> Tuple[str, Optional[Entry], str]:
+    from core.html_parser import parse_html_content
+    from utils.helpers import validate_and_resolve_path
+
+    try:
+        path = validate_and_resolve_path(file_path, fallback_subdir="Caselaw")
+        stat = path.stat()
+        if known == (stat.st_mtime_ns, stat.st_size):
+            return file_path, None, ""
+        text = parse_html_content(str(path))
+    except Exception as e:
+        return file_path, None, str(e) or type(e).__name__
+    body = zlib.compress(text.encode("utf-8"), 6)
+    return file_path, (file_path, stat.st_mtime_ns, stat.st_size, len(text), body), ""
+
+
+def build_text_store(
+    file_paths: Iterable[str],
+    store: CaseTextStore,
+    workers: int,
+    progress: Optional[Callable[[BuildSummary], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> BuildSummary:
+    start = perf_counter()
+    paths = list(dict.fromkeys(p.strip() for p in file_paths if p and p.strip()))
+    known = store.versions()
+    summary = BuildSummary(total=len(paths))
+    pending: List[Entry] = []
+    workers = max(1, min(workers, os.cpu_count() or 1))
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            queue = iter(paths)
+            in_flight = set()
+            while True:
+                stopping = should_stop is not None and should_stop()
+                while not stopping and len(in_flight) < workers * IN_FLIGHT_PER_WORKER:
+                    file_path = next(queue, None)
+                    if file_path is None:
+                        break
+                    in_flight.add(executor.submit(_extract_entry, file_path, known.get(file_path)))
+                if not in_flight:
+                    break
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    file_path, entry, error = future.result()
+                    summary.done += 1
+                    if error:
+                        summary.failed += 1
+                        summary.errors.append(f"{file_path}: {error}")
+                    elif entry is None:
+                        summary.unchanged += 1
+                    else:
+                        summary.stored += 1
+                        pending.append(entry)
+                if len(pending) >= WRITE_BATCH:
+                    store.put_many(pending)
+                    pending = []
+                if progress is not None:
+                    progress(summary)
+    finally:
+        if pending:
+            store.put_many(pending)
+    summary.elapsed_s = perf_counter() - start
+    logger.info(
+        f"Case text store: {summary.stored} stored, {summary.unchanged} unchanged, "
+        f"{summary.failed} failed of {summary.total} in {summary.elapsed_s:.1f}s"
+    )
+    return summary
+
+
+text_store = CaseTextStore(Path(settings.text_store_path)) if settings.text_store_path else None
+if text_store is not None:
+    register_provider("Case text store", text_store.stats)
@@ -3,26 +3,36 @@ import pandas as pd
 import logging
 from time import perf_counter
 from utils.helpers import validate_and_resolve_path, normalize_dataframe_columns
+from config.settings import settings
+from core.search_client import SearchClient, SearchServerError
 
 logger = logging.getLogger(__name__)
 
+TABLE_FETCH_TIMEOUT_S = 60.0
+
+def load_database(file_path: str) -> pd.DataFrame:
+    path = validate_and_resolve_path(file_path, fallback_subdir="")
+    logger.info(f"Loading Excel file: {path}")
+    data = pd.read_excel(path, engine="openpyxl")
+    return normalize_dataframe_columns(data)
+
 class DataLoaderThread(QThread):
     data_loaded = Signal(pd.DataFrame)
     error_occurred = Signal(str)
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, server_url: str = ""):
         super().__init__()
         self.file_path = file_path
+        self.server_url = server_url
 
     def run(self):
         start_time = perf_counter()
         try:
-            path = validate_and_resolve_path(self.file_path, fallback_subdir="")
-            logger.info(f"Loading Excel file: {path}")
-            data = pd.read_excel(path, engine="openpyxl")
-            
-            data = normalize_dataframe_columns(data)
-            
+            data = None
+            if self.server_url:
+                data = self._fetch_from_server()
+            if data is None:
+                data = load_database(self.file_path)
             self.data_loaded.emit(data)
             logger.info(f"Data loading completed in {perf_counter() - start_time:.2f} seconds")
         except FileNotFoundError as e:
@@ -32,4 +42,11 @@ class DataLoaderThread(QThread):
         except Exception as e:
             msg = f"Failed to load Excel file: {e}"
             logger.error(msg, exc_info=True)
-            self.error_occurred.emit(msg)
\ No newline at end of file
+            self.error_occurred.emit(msg)
+
+    def _fetch_from_server(self):
+        try:
+            return SearchClient(self.server_url, timeout=max(settings.search_server_timeout_s, TABLE_FETCH_TIMEOUT_S)).fetch_table()
+        except (SearchServerError, ValueError) as e:
+            logger.warning(f"Search server unavailable, loading the database locally: {e}")
+            return None
\ No newline at end of file
@@ -0,0 +1,24 @@
+from PySide6.QtCore import QThread, Signal
+import logging
+import pandas as pd
+from core.saved_searches import SavedSearchRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class SavedSearchThread(QThread):
+    completed = Signal(object)
+    error = Signal(str)
+
+    def __init__(self, data: pd.DataFrame, database: str, registry: SavedSearchRegistry):
+        super().__init__()
+        self._data = data
+        self._database = database
+        self._registry = registry
+
+    def run(self) -> None:
+        try:
+            self.completed.emit(self._registry.evaluate(self._data, self._database))
+        except Exception as e:
+            logger.error("Saved search evaluation failed", exc_info=True)
+            self.error.emit(str(e))
@@ -1,6 +1,9 @@
 from PySide6.QtCore import QThread, Signal
 from typing import List, Dict, Any
 import logging
+from core.brief_utils import BriefRequest, build_messages
+from core.html_parser import load_case_text
+from core.llm_clients import LMSTUDIO_BACKEND, OPENAI_BACKEND, llm_clients
 
 logger = logging.getLogger(__name__)
 
@@ -29,30 +32,23 @@ class StreamWorker(QThread):
     def run(self) -> None:
         full: List[str] = []
         try:
-            client = self._get_client()
-
-            for chunk_text in self._stream_response(client):
-                if chunk_text:
-                    self.chunk.emit(chunk_text)
-                    full.append(chunk_text)
+            with self._lease_client() as client:
+                for chunk_text in self._stream_response(client):
+                    if chunk_text:
+                        self.chunk.emit(chunk_text)
+                        full.append(chunk_text)
 
             self.done.emit("".join(full))
         except Exception as e:
             logger.error("Streaming failed", exc_info=True)
             self.error.emit(str(e))
 
-    def _get_client(self):
-        from openai import OpenAI
+    def _lease_client(self):
         from config.settings import settings
 
-        timeout = self._kw.get("timeout", DEFAULT_TIMEOUT)
         if _is_lmstudio(self._model):
-            return OpenAI(
-                base_url=LMSTUDIO_BASE_URL,
-                api_key=LMSTUDIO_API_KEY,
-                timeout=timeout,
-            )
-        return OpenAI(api_key=settings.openai_api_key, timeout=timeout)
+            return llm_clients.lease(LMSTUDIO_BACKEND, LMSTUDIO_API_KEY, LMSTUDIO_BASE_URL)
+        return llm_clients.lease(OPENAI_BACKEND, settings.openai_api_key)
 
     def _stream_response(self, client):
         if _is_lmstudio(self._model):
@@ -66,6 +62,7 @@ class StreamWorker(QThread):
             messages=self._messages,
             stream=True,
             temperature=self._kw.get("temperature", DEFAULT_TEMPERATURE),
+            timeout=self._kw.get("timeout", DEFAULT_TIMEOUT),
         )
         in_think = False
         for ch in stream:
@@ -86,6 +83,7 @@ class StreamWorker(QThread):
             "model": self._model,
             "input": self._messages,
             "stream": True,
+            "timeout": self._kw.get("timeout", DEFAULT_TIMEOUT),
         }
 
         model = self._model
@@ -115,4 +113,19 @@ class StreamWorker(QThread):
             elif ev.type in ("response.error", "response.failed"):
                 msg = str(getattr(ev, "error", getattr(ev, "response", "unknown error")))
                 logger.error(f"OpenAI API error ({ev.type}): {msg}")
-                raise RuntimeError(f"API error: {msg}")
\ No newline at end of file
+                raise RuntimeError(f"API error: {msg}")
+
+class BriefStreamWorker(StreamWorker):
+    def __init__(self, request: BriefRequest, **kw: Any):
+        super().__init__([], request.model, temperature=request.temperature, verbosity=request.verbosity, **kw)
+        self._request = request
+
+    def run(self) -> None:
+        try:
+            case_text = load_case_text(self._request.file_path, self._request.segments)
+        except Exception as e:
+            logger.error(f"Loading case text failed for {self._request.file_path}", exc_info=True)
+            self.error.emit(str(e))
+            return
+        self._messages = build_messages(self._request, case_text)
+        super().run()
\ No newline at end of file
@@ -0,0 +1,39 @@
+from PySide6.QtCore import QThread, Signal
+from typing import List
+import logging
+from core.text_store import BuildSummary, CaseTextStore, build_text_store
+
+logger = logging.getLogger(__name__)
+
+
+class TextStoreBuildThread(QThread):
+    progress = Signal(int, int)
+    completed = Signal(object)
+    error = Signal(str)
+
+    def __init__(self, file_paths: List[str], store: CaseTextStore, workers: int):
+        super().__init__()
+        self._file_paths = file_paths
+        self._store = store
+        self._workers = workers
+        self._stop = False
+
+    def request_stop(self) -> None:
+        self._stop = True
+
+    def run(self) -> None:
+        try:
+            summary = build_text_store(
+                self._file_paths,
+                self._store,
+                self._workers,
+                progress=self._report,
+                should_stop=lambda: self._stop,
+            )
+            self.completed.emit(summary)
+        except Exception as e:
+            logger.error("Building the case text store failed", exc_info=True)
+            self.error.emit(str(e))
+
+    def _report(self, summary: BuildSummary) -> None:
+        self.progress.emit(summary.done, summary.total)
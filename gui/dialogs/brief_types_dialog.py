@@ -3,6 +3,7 @@ from PySide6.QtCore import Qt, QEvent
 from PySide6.QtGui import QFont
 from utils.tooltip_utils import apply_tooltips
 from core.brief_registry import registry, BriefType, GENERAL_BRIEF_TEMPLATE, TOPIC_BRIEF_TEMPLATE
+from core.segmenter import SEGMENT_KINDS, SEGMENT_LABELS
 
 class BriefTypesDialog(QDialog):
     def __init__(self, parent=None):
@@ -117,6 +118,21 @@ class BriefTypesDialog(QDialog):
         advanced_layout.addWidget(template_label)
         advanced_layout.addWidget(template_help)
         advanced_layout.addWidget(self.template_edit)
+        segments_label = QLabel("<b>Opinion Parts Sent:</b>")
+        segments_help = QLabel("<small>Leave all unchecked to send the whole opinion. Checking only 'Majority opinion' skips long dissents and concurrences, which makes briefs faster and cheaper.</small>")
+        segments_help.setStyleSheet("color: gray;")
+        segments_help.setWordWrap(True)
+        segments_row = QHBoxLayout()
+        self.segment_checks = {}
+        for kind in SEGMENT_KINDS:
+            check = QCheckBox(SEGMENT_LABELS[kind])
+            check.setObjectName(f"segment_{kind}_chk")
+            segments_row.addWidget(check)
+            self.segment_checks[kind] = check
+        segments_row.addStretch()
+        advanced_layout.addWidget(segments_label)
+        advanced_layout.addLayout(segments_row)
+        advanced_layout.addWidget(segments_help)
         advanced_group.setLayout(advanced_layout)
         right_layout.addWidget(advanced_group)
         preview_group = QGroupBox("Template Preview")
@@ -191,6 +207,8 @@ class BriefTypesDialog(QDialog):
         self.category_combo.setEnabled(enabled)
         self.topic_edit.setEnabled(enabled)
         self.template_edit.setEnabled(enabled)
+        for check in self.segment_checks.values():
+            check.setEnabled(enabled)
         self.enabled_chk.setEnabled(enabled)
         self.save_btn.setEnabled(enabled)
         if enabled:
@@ -327,6 +345,8 @@ class BriefTypesDialog(QDialog):
         self.kind_combo.setCurrentText(it.kind)
         self.topic_edit.setText(it.topic or "")
         self.template_edit.setPlainText(it.template or "")
+        for kind, check in self.segment_checks.items():
+            check.setChecked(kind in (it.segments or []))
         self.enabled_chk.setChecked(it.enabled)
         if it.category:
             index = self.category_combo.findText(it.category)
@@ -347,6 +367,8 @@ class BriefTypesDialog(QDialog):
         self.category_combo.setCurrentIndex(0)
         self.topic_edit.clear()
         self.template_edit.clear()
+        for check in self.segment_checks.values():
+            check.setChecked(False)
         self.enabled_chk.setChecked(True)
         self._toggle_topic_visibility()
         self._update_preview()
@@ -366,6 +388,7 @@ class BriefTypesDialog(QDialog):
         topic = self.topic_edit.text().strip() or None
         template = self.template_edit.toPlainText().strip() or None
         enabled = self.enabled_chk.isChecked()
+        segments = [kind for kind, check in self.segment_checks.items() if check.isChecked()] or None
         category = self.category_combo.currentText().strip()
         if category == "None" or not category:
             category = None
@@ -374,7 +397,7 @@ class BriefTypesDialog(QDialog):
             return
         if self._current_editing_label and self._current_editing_label != label:
             registry.delete(self._current_editing_label)
-        registry.upsert(BriefType(label=label, kind=kind, topic=topic, template=template, enabled=enabled, category=category))
+        registry.upsert(BriefType(label=label, kind=kind, topic=topic, template=template, enabled=enabled, category=category, segments=segments))
         self._current_editing_label = label
         self._load_tree()
         self._refresh_categories()
@@ -0,0 +1,51 @@
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QPlainTextEdit
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QFont
+from utils.diagnostics import collect
+
+REFRESH_INTERVAL_MS = 1000
+
+
+class DiagnosticsDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Diagnostics")
+        self.resize(600, 500)
+
+        layout = QVBoxLayout(self)
+
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        font = QFont("Consolas")
+        font.setStyleHint(QFont.Monospace)
+        self.text.setFont(font)
+        layout.addWidget(self.text)
+
+        button_row = QHBoxLayout()
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.refresh)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.close)
+        button_row.addWidget(refresh_btn)
+        button_row.addStretch()
+        button_row.addWidget(close_btn)
+        layout.addLayout(button_row)
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(REFRESH_INTERVAL_MS)
+        self.refresh()
+
+    def refresh(self) -> None:
+        lines = []
+        for section, values in collect().items():
+            lines.append(f"[{section}]")
+            width = max((len(str(k)) for k in values), default=0)
+            for key, value in values.items():
+                lines.append(f"  {str(key).ljust(width)}  {value}")
+            lines.append("")
+        text = "\n".join(lines) or "No diagnostics available."
+
+        scroll = self.text.verticalScrollBar().value()
+        self.text.setPlainText(text)
+        self.text.verticalScrollBar().setValue(scroll)
@@ -1,3 +1,4 @@
+import os
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -10,12 +11,15 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QMessageBox,
     QFrame,
+    QCheckBox,
+    QSpinBox,
 )
 from PySide6.QtCore import Qt
 from config.settings import (
     AVAILABLE_OPENAI_MODELS,
     LOCAL_CHAT_MODELS,
     AVAILABLE_BRIEF_MODELS,
+    MAX_BRIEF_BATCH_CONCURRENCY,
     MODEL_PRICING,
     REASONING_EFFORT_OPTIONS,
     get_model_pricing,
@@ -229,9 +233,60 @@ class SettingsDialog(QDialog):
         row3.addWidget(browse_btn)
         output_layout.addLayout(row3)
 
+        row_batch = QHBoxLayout()
+        row_batch.addWidget(QLabel("Concurrent Briefs:"))
+        self.batch_concurrency_spin = QSpinBox()
+        self.batch_concurrency_spin.setObjectName("batch_concurrency_spin")
+        self.batch_concurrency_spin.setRange(1, MAX_BRIEF_BATCH_CONCURRENCY)
+        self.batch_concurrency_spin.setValue(settings.brief_batch_concurrency)
+        self.batch_concurrency_spin.setToolTip("How many briefs \"Brief Selected Cases\" generates at the same time. Higher values finish sooner but may hit API rate limits.")
+        row_batch.addWidget(self.batch_concurrency_spin)
+        row_batch.addStretch()
+        output_layout.addLayout(row_batch)
+
         output_group.setLayout(output_layout)
         vbox.addWidget(output_group)
 
+        search_group = QGroupBox("Search Settings")
+        search_layout = QVBoxLayout()
+
+        self.search_details_chk = QCheckBox("Show per-phase search timings in the status area")
+        self.search_details_chk.setObjectName("search_details_chk")
+        self.search_details_chk.setChecked(settings.show_search_details)
+        self.search_details_chk.setToolTip("Adds a line showing where each search spent its time and how many rows it considered.")
+        search_layout.addWidget(self.search_details_chk)
+
+        self.case_preview_chk = QCheckBox("Show a text preview of the selected or hovered case")
+        self.case_preview_chk.setObjectName("case_preview_chk")
+        self.case_preview_chk.setChecked(settings.show_case_preview)
+        self.case_preview_chk.setToolTip("Shows the opening of the opinion below the results. Text is loaded in the background and cached.")
+        search_layout.addWidget(self.case_preview_chk)
+
+        row_workers = QHBoxLayout()
+        row_workers.addWidget(QLabel("Fuzzy Scoring Processes:"))
+        self.fuzzy_workers_spin = QSpinBox()
+        self.fuzzy_workers_spin.setObjectName("fuzzy_workers_spin")
+        self.fuzzy_workers_spin.setRange(0, max(1, os.cpu_count() or 1))
+        self.fuzzy_workers_spin.setSpecialValueText("Off (in-process)")
+        self.fuzzy_workers_spin.setValue(settings.fuzzy_workers)
+        self.fuzzy_workers_spin.setToolTip("Score fuzzy matches across several processes on large databases. 0 keeps scoring in the application process.")
+        row_workers.addWidget(self.fuzzy_workers_spin)
+        row_workers.addStretch()
+        search_layout.addLayout(row_workers)
+
+        row_server = QHBoxLayout()
+        row_server.addWidget(QLabel("Search Server:"))
+        self.search_server_edit = QLineEdit()
+        self.search_server_edit.setObjectName("search_server_edit")
+        self.search_server_edit.setPlaceholderText(f"http://{settings.search_server_host}:{settings.search_server_port}")
+        self.search_server_edit.setText(settings.search_server_url)
+        self.search_server_edit.setToolTip("Leave blank to search locally. When set, the case table and searches come from a shared search server (started with search_server.py). Takes effect on the next start.")
+        row_server.addWidget(self.search_server_edit)
+        search_layout.addLayout(row_server)
+
+        search_group.setLayout(search_layout)
+        vbox.addWidget(search_group)
+
         vbox.addStretch()
 
         btn_row = QHBoxLayout()
@@ -309,6 +364,11 @@ class SettingsDialog(QDialog):
         settings.chat_reasoning_effort = self.chat_r_combo.currentText()
         settings.export_fmt = self.fmt_combo.currentText()
         settings.briefs_save_dir = self.dir_edit.text()
+        settings.brief_batch_concurrency = self.batch_concurrency_spin.value()
         settings.openai_api_key = self.api_key_edit.text().strip()
+        settings.show_search_details = self.search_details_chk.isChecked()
+        settings.show_case_preview = self.case_preview_chk.isChecked()
+        settings.fuzzy_workers = self.fuzzy_workers_spin.value()
+        settings.search_server_url = self.search_server_edit.text().strip()
         settings.save_user_prefs()
         super().accept()
\ No newline at end of file
@@ -2,7 +2,7 @@ import os
 import logging
 from pathlib import Path
 import pandas as pd
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt, QUrl, QTimer
 from PySide6.QtGui import QDesktopServices, QAction
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -15,14 +15,21 @@ from PySide6.QtWidgets import (
     QMenu,
     QApplication,
     QFileDialog,
+    QInputDialog,
+    QTextBrowser,
+    QProgressDialog,
 )
-from typing import Optional
+from typing import List, Optional, Tuple
 from datetime import date
-from config.settings import settings, expected_columns
-from core.brief_registry import registry
+from config.settings import settings, expected_columns, requires_api_key, BRIEF_FILE_FORMATS
+from core.brief_registry import registry, BriefType
+from core.saved_searches import saved_searches, SavedSearch
 from core.brief_utils import build_prompt, BriefRequest
-from core.html_parser import parse_html_content
+from core.html_parser import load_case_text
+from core.text_store import text_store
 from data.data_loader import DataLoaderThread
+from data.workers.saved_search_worker import SavedSearchThread
+from data.workers.text_store_worker import TextStoreBuildThread
 from gui.dialogs.brief_viewer import BriefViewer
 from gui.dialogs.settings_dialog import SettingsDialog
 from gui.dialogs.case_chat_dialog import CaseChatDialog
@@ -30,19 +37,40 @@ from gui.models.pandas_model import PandasModel
 from gui.widgets.search_bar import SearchBar
 from gui.widgets.date_filter_bar import DateFilterBar
 from services.case_service import CaseService
+from services.brief_batch import BriefBatch
+from services.preview_service import PreviewService
+from services.file_index_service import FileIndexService
 from services.search_service import SearchService
 from utils.tooltip_utils import apply_tooltips
 from utils.helpers import convert_file_url_to_windows_path, is_url, is_local_html_file
 
 logger = logging.getLogger(__name__)
 
+MAX_LISTED_FAILURES = 10
+CONFIRM_BRIEF_BATCH_ABOVE = 5
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.data = pd.DataFrame()
         self.search_service = SearchService()
         self.case_service = CaseService()
+        self.preview_service = PreviewService(self)
+        self.file_index_service = FileIndexService(self)
+        self._preview_path = ""
+        self._preview_row = -1
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._context_menu: Optional[QMenu] = None
+        self._context_menu_version = -1
+        self._context_case = (None, "", "")
+        self._case_text_actions = []
+        self._brief_selected_action: Optional[QAction] = None
+        self._brief_batch: Optional[BriefBatch] = None
         self._data_loader_thread = None
+        self._text_store_thread = None
+        self._saved_search_thread = None
+        self._pending_saved_search: Optional[pd.DataFrame] = None
         self.status_messages = []
         self._setup_ui()
         self._connect_signals()
@@ -67,9 +95,25 @@ class MainWindow(QMainWindow):
         view_chats_action.setObjectName("action_view_chats")
         view_chats_action.triggered.connect(self._show_saved_chats)
 
+        diagnostics_action = QAction("Diagnostics…", self)
+        diagnostics_action.setObjectName("action_diagnostics")
+        diagnostics_action.triggered.connect(self._show_diagnostics_dialog)
+
+        self.build_text_store_action = QAction("Build Case Text Store…", self)
+        self.build_text_store_action.setObjectName("action_build_text_store")
+        self.build_text_store_action.triggered.connect(self._build_text_store)
+
         file_menu.addAction(settings_action)
         file_menu.addAction(manage_briefs_action)
         file_menu.addAction(view_chats_action)
+        file_menu.addAction(self.build_text_store_action)
+        file_menu.addAction(diagnostics_action)
+
+        self.save_search_action = QAction("Save Current Search…", self)
+        self.save_search_action.triggered.connect(self._save_current_search)
+        self.saved_searches_menu = self.menuBar().addMenu("&Saved Searches")
+        self.saved_searches_menu.setToolTipsVisible(True)
+        self._rebuild_saved_searches_menu()
 
         self.main_widget = QWidget()
         self.setCentralWidget(self.main_widget)
@@ -82,11 +126,23 @@ class MainWindow(QMainWindow):
         self.results_table.setModel(self.results_model)
         self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.results_table.setSelectionBehavior(QTableView.SelectRows)
+        self.results_table.setSelectionMode(QTableView.ExtendedSelection)
         self.results_table.setEditTriggers(QTableView.NoEditTriggers)
         self.results_table.setAlternatingRowColors(True)
+        self.results_table.horizontalHeader().setSortIndicatorClearable(True)
+        self.results_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.results_table.setSortingEnabled(True)
         self.results_table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.results_table.setMouseTracking(True)
         self.layout.addWidget(self.results_table)
 
+        self.preview_pane = QTextBrowser()
+        self.preview_pane.setObjectName("case_preview")
+        self.preview_pane.setMaximumHeight(160)
+        self.preview_pane.setPlaceholderText("Hover over or select a case to preview its opening text.")
+        self.preview_pane.setVisible(settings.show_case_preview)
+        self.layout.addWidget(self.preview_pane)
+
         self.search_bar = SearchBar()
         self.search_bar.search_box.setObjectName("search_box")
         self.search_bar.column_selector.setObjectName("column_selector")
@@ -108,6 +164,9 @@ class MainWindow(QMainWindow):
             actions={
                 "action_settings": settings_action,
                 "action_manage_briefs": manage_briefs_action,
+                "action_diagnostics": diagnostics_action,
+                "action_build_text_store": self.build_text_store_action,
+                "action_save_search": self.save_search_action,
             },
         )
 
@@ -179,11 +238,115 @@ class MainWindow(QMainWindow):
         layout.addLayout(button_layout)
         dialog.exec()
 
+    def _rebuild_saved_searches_menu(self) -> None:
+        menu = self.saved_searches_menu
+        menu.clear()
+        total_new = saved_searches.total_new()
+        menu.setTitle(f"&Saved Searches ({total_new} new)" if total_new else "&Saved Searches")
+
+        menu.addAction(self.save_search_action)
+
+        items = saved_searches.all_items()
+        if not items:
+            return
+        menu.addSeparator()
+        for item in items:
+            label = f"{item.name}  ({item.new_count} new)" if item.new_count else item.name
+            act = QAction(label, menu)
+            act.setToolTip(f"{item.column}: {item.query}")
+            act.triggered.connect(lambda checked=False, n=item.name: self._run_saved_search(n))
+            menu.addAction(act)
+
+        menu.addSeparator()
+        remove_menu = menu.addMenu("Remove")
+        for item in items:
+            act = QAction(item.name, remove_menu)
+            act.triggered.connect(lambda checked=False, n=item.name: self._remove_saved_search(n))
+            remove_menu.addAction(act)
+
+    def _save_current_search(self) -> None:
+        query = self.search_bar.current_query()
+        if not query:
+            QMessageBox.information(self, "Save Search", "Type a search first, then save it.")
+            return
+        name, ok = QInputDialog.getText(self, "Save Search", "Name for this search:", text=query)
+        name = name.strip()
+        if not ok or not name:
+            return
+        if saved_searches.get(name) and QMessageBox.question(
+            self, "Save Search", f"Replace the saved search '{name}'?", QMessageBox.Yes | QMessageBox.No
+        ) != QMessageBox.Yes:
+            return
+
+        from_date, to_date = self.date_filter_bar.get_date_filters()
+        saved_searches.upsert(SavedSearch(
+            name=name,
+            column=self.search_bar.current_column(),
+            query=query,
+            include_fuzzy=self.search_bar.show_fuzzy_results(),
+            from_date=from_date.isoformat() if from_date else None,
+            to_date=to_date.isoformat() if to_date else None,
+        ))
+        self._rebuild_saved_searches_menu()
+        self.update_status(f"Saved search '{name}'")
+
+    def _run_saved_search(self, name: str) -> None:
+        item = saved_searches.get(name)
+        if item is None:
+            return
+        new_count = item.new_count
+        from_date, to_date = item.date_bounds()
+        self.date_filter_bar.set_date_filters(from_date=from_date, to_date=to_date)
+        self._on_date_filter_changed()
+        self.search_bar.apply_search(item.column, item.query, item.include_fuzzy)
+        saved_searches.mark_seen(name)
+        self._rebuild_saved_searches_menu()
+        if new_count:
+            self.update_status(f"Saved search '{name}': {new_count} new matches since the last database update")
+
+    def _remove_saved_search(self, name: str) -> None:
+        saved_searches.delete(name)
+        self._rebuild_saved_searches_menu()
+
+    def _refresh_saved_searches(self, data: pd.DataFrame) -> None:
+        if self._saved_search_thread is not None:
+            # Evaluations share the row snapshot, so a reload waits for the one in flight.
+            self._pending_saved_search = data
+            return
+        database = data.attrs.get("search_server_url") or settings.database_path
+        thread = SavedSearchThread(data, database, saved_searches)
+        thread.completed.connect(self._on_saved_searches_evaluated)
+        thread.finished.connect(self._on_saved_search_thread_finished)
+        self._saved_search_thread = thread
+        thread.start()
+
+    def _on_saved_search_thread_finished(self) -> None:
+        self._saved_search_thread.deleteLater()
+        self._saved_search_thread = None
+        if self._pending_saved_search is not None:
+            data, self._pending_saved_search = self._pending_saved_search, None
+            self._refresh_saved_searches(data)
+
+    def _on_saved_searches_evaluated(self, added) -> None:
+        self._rebuild_saved_searches_menu()
+        if added:
+            summary = ", ".join(f"{name} ({count})" for name, count in added.items())
+            self.update_status(f"New matches for saved searches: {summary}")
+
     def _connect_signals(self) -> None:
         self.search_bar.search_requested.connect(self.handle_search_request)
         self.search_service.search_complete.connect(self.handle_search_results)
+        self.search_service.search_partial.connect(self.handle_partial_results)
         self.results_table.doubleClicked.connect(self.handle_double_click)
         self.results_table.clicked.connect(self.handle_single_click)
+        self.results_table.entered.connect(self._on_table_hovered)
+        self.results_table.selectionModel().currentRowChanged.connect(
+            lambda current, previous: self._request_preview(current.row())
+        )
+        self._preview_timer.timeout.connect(lambda: self._request_preview(self._preview_row))
+        self.preview_service.preview_ready.connect(self._on_preview_ready)
+        self.preview_service.preview_failed.connect(self._on_preview_failed)
+        self.file_index_service.missing_files.connect(self._on_missing_files)
         self.results_table.customContextMenuRequested.connect(self.show_context_menu)
         self.case_service.brief_chunk.connect(self._on_brief_chunk)
         self.case_service.brief_ready.connect(self._on_brief_done)
@@ -258,7 +421,7 @@ class MainWindow(QMainWindow):
     def _load_data(self) -> None:
         self._set_widgets_enabled(False)
         self.update_status("Loading data, please wait…")
-        self._data_loader_thread = DataLoaderThread(settings.database_path)
+        self._data_loader_thread = DataLoaderThread(settings.database_path, settings.search_server_url)
         self._data_loader_thread.data_loaded.connect(self.handle_data_loaded)
         self._data_loader_thread.error_occurred.connect(self.handle_error)
         self._data_loader_thread.finished.connect(self._data_loader_thread.deleteLater)
@@ -266,6 +429,82 @@ class MainWindow(QMainWindow):
 
     def _show_settings_dialog(self) -> None:
         SettingsDialog(self).exec()
+        self.search_service.apply_settings()
+        self.preview_pane.setVisible(settings.show_case_preview)
+        if not settings.show_case_preview:
+            self.preview_service.cancel()
+            self._preview_path = ""
+
+    def _on_table_hovered(self, index) -> None:
+        self._preview_row = index.row()
+        self._preview_timer.start(settings.preview_delay_ms)
+
+    def _request_preview(self, row: int) -> None:
+        if not settings.show_case_preview or row < 0 or not self.results_model.has_column("file_path"):
+            return
+        try:
+            file_path = str(self.results_model.value(row, "file_path")).strip()
+        except IndexError:
+            return
+        if not file_path or file_path == self._preview_path:
+            return
+        self._preview_path = file_path
+        self.preview_pane.setPlainText("Loading preview…")
+        self.preview_service.request(file_path)
+
+    def _on_preview_ready(self, file_path: str, text: str) -> None:
+        if file_path == self._preview_path:
+            self.preview_pane.setPlainText(text)
+
+    def _on_preview_failed(self, file_path: str, error: str) -> None:
+        if file_path == self._preview_path:
+            self.preview_pane.setPlainText(f"Preview unavailable: {error}")
+
+    def _show_diagnostics_dialog(self) -> None:
+        from gui.dialogs.diagnostics_dialog import DiagnosticsDialog
+        DiagnosticsDialog(self).exec()
+
+    def _build_text_store(self) -> None:
+        if text_store is None:
+            self.update_status("The case text store is disabled (no text_store_path in settings)")
+            return
+        if self._text_store_thread is not None:
+            return
+        if "file_path" not in self.data.columns:
+            self.update_status("No file paths loaded to extract")
+            return
+
+        file_paths = self.data["file_path"].dropna().astype(str).unique().tolist()
+        thread = TextStoreBuildThread(file_paths, text_store, settings.text_store_workers)
+        dialog = QProgressDialog("Extracting case text…", "Cancel", 0, len(file_paths), self)
+        dialog.setWindowTitle("Build Case Text Store")
+        dialog.setWindowModality(Qt.NonModal)
+        dialog.setMinimumDuration(0)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.canceled.connect(thread.request_stop)
+        thread.progress.connect(lambda done, total: dialog.setValue(done))
+        thread.completed.connect(self._on_text_store_built)
+        thread.error.connect(lambda msg: self.update_status(f"Building the case text store failed: {msg}"))
+        thread.finished.connect(dialog.deleteLater)
+        thread.finished.connect(self._on_text_store_thread_finished)
+        self._text_store_thread = thread
+        self.build_text_store_action.setEnabled(False)
+        self.update_status(f"Extracting text for {len(file_paths):,} cases in the background…")
+        thread.start()
+
+    def _on_text_store_built(self, summary) -> None:
+        self.update_status(
+            f"Case text store: {summary.stored:,} extracted, {summary.unchanged:,} unchanged, "
+            f"{summary.failed:,} failed in {summary.elapsed_s:.0f}s"
+        )
+        for error in summary.errors[:20]:
+            logger.warning(f"Text extraction failed for {error}")
+
+    def _on_text_store_thread_finished(self) -> None:
+        self._text_store_thread.deleteLater()
+        self._text_store_thread = None
+        self.build_text_store_action.setEnabled(True)
 
     def _set_briefs_folder(self) -> None:
         current = settings.briefs_save_dir
@@ -299,9 +538,16 @@ class MainWindow(QMainWindow):
             return
         self.search_service.schedule_search(column, query)
 
+    def handle_partial_results(self, result) -> None:
+        source = result.source if result.source is not None else pd.DataFrame()
+        self.results_model.set_results(source, result.exact_positions)
+
     def handle_search_results(self, result) -> None:
-        display = result.total_results if self.search_bar.show_fuzzy_results() else result.exact_matches
-        self.results_model.update_data(display)
+        source = result.source if result.source is not None else pd.DataFrame()
+        if self.search_bar.show_fuzzy_results() and result.fuzzy_count:
+            self.results_model.set_results(source, result.total_positions, result.scores)
+        else:
+            self.results_model.set_results(source, result.exact_positions)
         if result.success:
             fuzz = f"(+ {result.fuzzy_count} fuzzy)" if result.fuzzy_count else ""
             filter_note = ""
@@ -315,10 +561,22 @@ class MainWindow(QMainWindow):
                 elif to_date:
                     filter_note = f" [filtered: up through {self._format_date(to_date)}]"
             
-            self.update_status(f"{result.message} (search {result.duration:.4f}s){filter_note}", fuzz)
+            status = f"{result.message} (search {result.duration:.4f}s){filter_note}"
+            if settings.show_search_details:
+                status += (f" | {fuzz}" if fuzz else "") + f"<br>{self._format_search_details(result)}"
+                fuzz = ""
+            self.update_status(status, fuzz)
         else:
             self.update_status(f"Search failed: {result.message}")
 
+    def _format_search_details(self, result) -> str:
+        phases = " · ".join(f"{name} {secs * 1000:.1f}ms" for name, secs in result.timings.items())
+        counts = result.counts
+        rows = f"{counts.get('candidates', 0):,}/{counts.get('rows', 0):,} rows searched"
+        if "fuzzy_choices" in counts:
+            rows += f", {counts['fuzzy_choices']:,} fuzzy choices"
+        return f"&nbsp;&nbsp;{phases} — {rows}"
+
     def handle_data_loaded(self, data: pd.DataFrame) -> None:
         if data.empty:
             QMessageBox.critical(
@@ -336,9 +594,18 @@ class MainWindow(QMainWindow):
         
         self.data = data
         self.search_service.set_data(data)
+        self.file_index_service.set_data(data)
+        self.date_filter_bar.set_date_counts(self.search_service.date_counts())
         self.search_bar.set_columns(expected_columns())
         self._set_widgets_enabled(True)
         self.update_status("Data loaded successfully")
+        self._refresh_saved_searches(data)
+
+    def _on_missing_files(self, missing) -> None:
+        self.results_model.set_missing_files(missing)
+        count = int(missing.sum())
+        if count:
+            self.update_status(f"{count:,} cases have no case file on disk (shown in gray)")
 
     def handle_error(self, msg: str) -> None:
         QMessageBox.critical(
@@ -355,11 +622,11 @@ class MainWindow(QMainWindow):
         try:
             row = index.row()
 
-            if self.results_model._data.empty or "file_path" not in self.results_model._data.columns:
+            if self.results_model.is_empty() or not self.results_model.has_column("file_path"):
                 QMessageBox.information(self, "Open File", "No 'file_path' column is available for this table.")
                 return
 
-            raw_path = str(self.results_model._data.iloc[row]["file_path"]).strip()
+            raw_path = str(self.results_model.value(row, "file_path")).strip()
             if not raw_path:
                 QMessageBox.information(self, "Open File", "This row has an empty file_path.")
                 return
@@ -382,11 +649,11 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to open file: {e}")
 
     def handle_single_click(self, index) -> None:
-        if self.results_model._data.empty:
+        if self.results_model.is_empty():
             return
         try:
-            col_name = self.results_model._display_columns[index.column()]
-            value = str(self.results_model._data.iloc[index.row()][col_name])
+            col_name = self.results_model.column_name(index.column())
+            value = str(self.results_model.value(index.row(), col_name))
             if is_url(value):
                 QDesktopServices.openUrl(QUrl(value))
         except (IndexError, KeyError):
@@ -394,75 +661,187 @@ class MainWindow(QMainWindow):
 
     def show_context_menu(self, position) -> None:
         index = self.results_table.indexAt(position)
-        if not index.isValid() or self.results_model._data.empty:
+        if not index.isValid() or self.results_model.is_empty():
             return
-        menu = QMenu(self)
 
         citation = ""
         file_path = ""
         try:
-            if "citation" in self.results_model._data.columns:
-                citation = str(self.results_model._data.iloc[index.row()]["citation"])
-            if "file_path" in self.results_model._data.columns:
-                file_path = str(self.results_model._data.iloc[index.row()]["file_path"])
+            if self.results_model.has_column("citation"):
+                citation = str(self.results_model.value(index.row(), "citation"))
+            if self.results_model.has_column("file_path"):
+                file_path = str(self.results_model.value(index.row(), "file_path")).strip()
         except Exception as e:
             logger.error(f"Get citation/file_path error: {e}")
 
-        copy_cell_action = QAction("Copy Cell", self)
-        copy_cell_action.triggered.connect(lambda: self.copy_cell_content(index))
-        menu.addAction(copy_cell_action)
-
-        if is_local_html_file(file_path):
-            copy_text_action = QAction("Copy Case Text", self)
-            copy_text_action.triggered.connect(lambda: self.case_service.copy_case_text(file_path))
-            menu.addAction(copy_text_action)
-
-            chat_action = QAction("Chat About This Case", self)
-            chat_action.triggered.connect(lambda _chk, f=file_path, c=citation: self._open_case_chat(f, c))
-            menu.addAction(chat_action)
-
-            general = registry.get_general()
-            if general is not None:
-                get_case_brief_action = QAction("Get Case Brief", self)
-                get_case_brief_action.triggered.connect(
-                    lambda _chk, f=file_path, c=citation, t=general.resolved_template(): self._start_streaming_brief(f, c, t)
-                )
-                menu.addAction(get_case_brief_action)
-
-            menu.addSeparator()
-
-            categorized_briefs = {}
-            uncategorized_briefs = []
-
-            for item in registry.list_topics_alpha():
-                if item.category:
-                    if item.category not in categorized_briefs:
-                        categorized_briefs[item.category] = []
-                    categorized_briefs[item.category].append(item)
-                else:
-                    uncategorized_briefs.append(item)
+        if self._context_menu is None or self._context_menu_version != registry.version:
+            self._build_context_menu()
+        self._context_case = (index, file_path, citation)
+        html = is_local_html_file(file_path)
+        for action in self._case_text_actions:
+            action.setVisible(html)
+        if self._brief_selected_action is not None:
+            selected = len(self.results_table.selectionModel().selectedRows())
+            self._brief_selected_action.setText(f"Brief Selected Cases ({selected})")
+            self._brief_selected_action.setVisible(selected > 1)
+        self._context_menu.exec(self.results_table.viewport().mapToGlobal(position))
+
+    def _build_context_menu(self) -> None:
+        if self._context_menu is not None:
+            self._context_menu.deleteLater()
+        menu = QMenu(self)
+        menu.triggered.connect(self._on_brief_action)
+
+        copy_cell_action = menu.addAction("Copy Cell")
+        copy_cell_action.triggered.connect(lambda: self.copy_cell_content(self._context_case[0]))
+
+        copy_text_action = menu.addAction("Copy Case Text")
+        copy_text_action.triggered.connect(lambda: self.case_service.copy_case_text(self._context_case[1]))
+
+        chat_action = menu.addAction("Chat About This Case")
+        chat_action.triggered.connect(lambda: self._open_case_chat(self._context_case[1], self._context_case[2]))
+        actions = [copy_text_action, chat_action]
+
+        general = registry.get_general()
+        self._brief_selected_action = None
+        if general is not None:
+            get_case_brief_action = menu.addAction("Get Case Brief")
+            get_case_brief_action.setData(general)
+            actions.append(get_case_brief_action)
+            self._brief_selected_action = menu.addAction("Brief Selected Cases")
+            self._brief_selected_action.triggered.connect(lambda: self._brief_selected_cases(general))
+
+        actions.append(menu.addSeparator())
+
+        categorized_briefs = {}
+        uncategorized_briefs = []
+        for item in registry.list_topics_alpha():
+            if item.category:
+                categorized_briefs.setdefault(item.category, []).append(item)
+            else:
+                uncategorized_briefs.append(item)
+
+        for category in sorted(categorized_briefs.keys()):
+            category_menu = menu.addMenu(category)
+            for item in categorized_briefs[category]:
+                category_menu.addAction(item.label).setData(item)
+            actions.append(category_menu.menuAction())
+
+        for item in uncategorized_briefs:
+            act = menu.addAction(item.label)
+            act.setData(item)
+            actions.append(act)
+
+        self._context_menu = menu
+        self._context_menu_version = registry.version
+        self._case_text_actions = actions
+
+    def _on_brief_action(self, action: QAction) -> None:
+        brief = action.data()
+        if isinstance(brief, BriefType):
+            _, file_path, citation = self._context_case
+            self._start_streaming_brief(file_path, citation, brief.resolved_template(), brief.segments)
+
+    def _selected_cases(self) -> List[Tuple[str, str]]:
+        if self.results_model.is_empty() or not self.results_model.has_column("file_path"):
+            return []
+        has_citation = self.results_model.has_column("citation")
+        cases = []
+        for row in sorted(index.row() for index in self.results_table.selectionModel().selectedRows()):
+            file_path = str(self.results_model.value(row, "file_path")).strip()
+            if is_local_html_file(file_path):
+                citation = str(self.results_model.value(row, "citation")) if has_citation else ""
+                cases.append((file_path, citation))
+        return cases
+
+    def _brief_selected_cases(self, brief: BriefType) -> None:
+        if self._brief_batch is not None:
+            self.update_status("A batch of briefs is already running")
+            return
+        if requires_api_key(settings.model) and not settings.has_openai_api_key():
+            self._on_api_key_missing()
+            return
 
-            def _add_brief_action(target_menu, brief_item, f=file_path, c=citation):
-                template = brief_item.resolved_template()
-                act = QAction(brief_item.label, self)
-                act.triggered.connect(lambda _=False, t=template: self._start_streaming_brief(f, c, t))
-                target_menu.addAction(act)
+        save_dir = Path(settings.briefs_save_dir)
+        if not self._validate_save_directory(save_dir):
+            QMessageBox.warning(
+                self,
+                "Invalid Save Location",
+                f"The configured save location does not exist or is not accessible:\n\n{save_dir}\n\n"
+                "Choose a folder in Settings before briefing several cases."
+            )
+            return
 
-            for category in sorted(categorized_briefs.keys()):
-                category_menu = QMenu(category, self)
-                for item in categorized_briefs[category]:
-                    _add_brief_action(category_menu, item)
-                menu.addMenu(category_menu)
+        requests = [
+            BriefRequest(
+                file_path=file_path,
+                citation=citation,
+                template=brief.resolved_template(),
+                model=settings.model,
+                verbosity=settings.brief_verbosity,
+                segments=brief.segments,
+            )
+            for file_path, citation in self._selected_cases()
+        ]
+        if not requests:
+            self.update_status("None of the selected rows has a local case file")
+            return
+        if len(requests) > CONFIRM_BRIEF_BATCH_ABOVE and requires_api_key(settings.model) and QMessageBox.question(
+            self,
+            "Brief Selected Cases",
+            f"Generate {len(requests)} '{brief.label}' briefs with {settings.model}?\n\n"
+            "Each brief is a separate API request billed to your OpenAI account.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No,
+        ) != QMessageBox.Yes:
+            return
 
-            for item in uncategorized_briefs:
-                _add_brief_action(menu, item)
+        fmt = settings.export_fmt if settings.export_fmt in BRIEF_FILE_FORMATS else "txt"
+        batch = BriefBatch(requests, fmt, settings.brief_batch_concurrency, settings.brief_reasoning_effort, self)
+        dialog = QProgressDialog(f"Generating {len(requests)} briefs…", "Cancel", 0, len(requests), self)
+        dialog.setWindowTitle("Brief Selected Cases")
+        dialog.setWindowModality(Qt.NonModal)
+        dialog.setMinimumDuration(0)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.canceled.connect(batch.cancel)
+        batch.progress.connect(lambda summary: self._on_brief_batch_progress(dialog, summary))
+        batch.finished.connect(lambda summary: self._on_brief_batch_finished(dialog, summary))
+        self._brief_batch = batch
+        self.update_status(
+            f"Generating {len(requests)} briefs, {settings.brief_batch_concurrency} at a time, as {fmt} files in {save_dir}"
+        )
+        batch.start()
 
-        menu.exec(self.results_table.viewport().mapToGlobal(position))
+    def _on_brief_batch_progress(self, dialog: QProgressDialog, summary) -> None:
+        if dialog.wasCanceled():
+            return
+        dialog.setValue(summary.done)
+        label = f"{summary.done} of {summary.total} briefs done ({summary.per_minute:.1f} per minute)"
+        if summary.failed:
+            label += f"\n{summary.failed} failed — last: {summary.errors[-1][:120]}"
+        dialog.setLabelText(label)
+
+    def _on_brief_batch_finished(self, dialog: QProgressDialog, summary) -> None:
+        dialog.deleteLater()
+        self._brief_batch.deleteLater()
+        self._brief_batch = None
+        canceled = f", {summary.canceled} canceled" if summary.canceled else ""
+        self.update_status(
+            f"Batch briefs: {summary.saved} saved, {summary.failed} failed{canceled} "
+            f"in {summary.elapsed_s:.0f}s ({summary.per_minute:.1f} per minute)"
+        )
+        if summary.failed:
+            listed = "\n".join(summary.errors[:MAX_LISTED_FAILURES])
+            more = summary.failed - MAX_LISTED_FAILURES
+            if more > 0:
+                listed += f"\n… and {more} more (see the log)"
+            QMessageBox.warning(self, "Brief Selected Cases", f"{summary.failed} of {summary.total} briefs failed:\n\n{listed}")
 
     def copy_cell_content(self, index) -> None:
         try:
-            col_name = self.results_model._display_columns[index.column()]
-            content = str(self.results_model._data.iloc[index.row()][col_name])
+            col_name = self.results_model.column_name(index.column())
+            content = str(self.results_model.value(index.row(), col_name))
             QApplication.clipboard().setText(content)
         except (IndexError, KeyError):
             pass
@@ -491,13 +870,14 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             self._show_settings_dialog()
 
-    def _start_streaming_brief(self, file_path: str, citation: str, template: str) -> None:
+    def _start_streaming_brief(self, file_path: str, citation: str, template: str, segments: Optional[List[str]] = None) -> None:
         request = BriefRequest(
             file_path=file_path,
             citation=citation,
             template=template,
             model=settings.model,
-            verbosity=settings.brief_verbosity
+            verbosity=settings.brief_verbosity,
+            segments=segments,
         )
 
         fmt = settings.export_fmt
@@ -509,8 +889,8 @@ class MainWindow(QMainWindow):
 
         if fmt == "prompt_clipboard":
             try:
-                from core.html_parser import parse_html_content
-                case_text = parse_html_content(file_path)
+                from core.html_parser import load_case_text
+                case_text = load_case_text(file_path, request.segments)
                 from core.brief_utils import build_prompt
                 prompt = build_prompt(request, case_text)
                 QApplication.clipboard().setText(prompt)
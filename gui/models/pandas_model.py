@@ -1,40 +1,216 @@
+import numpy as np
 import pandas as pd
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+from typing import Any, List, Optional, Tuple
 from config.settings import EXPECTED_COLUMNS
+from core.sort_keys import RELEVANCE, SortKeyCache
+
+PAGE_SIZE = 500
+CELL_ALIGNMENT = int(Qt.AlignLeft | Qt.AlignVCenter)
+DIFF_MAX_RUNS = 64
+MISSING_FILE_COLOR = QColor("#808080")
+
+
+def _runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
 
 
 class PandasModel(QAbstractTableModel):
     def __init__(self, data=pd.DataFrame(), parent=None):
         super().__init__(parent)
-        self._data = data
-        self._display_columns = []
+        self._source = data
+        self._result_positions = np.arange(len(data), dtype=np.intp)
+        self._positions = self._result_positions
+        self._result_scores: Optional[np.ndarray] = None
+        self._scores: Optional[np.ndarray] = None
+        self._sort_keys = SortKeyCache()
+        self._sort_column = RELEVANCE
+        self._sort_order = Qt.AscendingOrder
+        self._loaded = 0
+        self._display_columns: List[str] = []
+        self._display_values: List[np.ndarray] = []
+        self._display_source_id: Optional[int] = None
+        self._missing: Optional[np.ndarray] = None
         self._update_display_columns()
+        self._loaded = min(PAGE_SIZE, len(self._positions))
 
     def _update_display_columns(self):
-        if self._data.empty:
+        if self._display_source_id == id(self._source):
+            return
+        if self._source.empty:
             self._display_columns = []
         else:
-            self._display_columns = [col for col in EXPECTED_COLUMNS if col in self._data.columns]
+            self._display_columns = [col for col in EXPECTED_COLUMNS if col in self._source.columns]
+        self._display_values = [
+            self._source[col].astype(str).to_numpy(dtype=object) for col in self._display_columns
+        ]
+        self._display_source_id = id(self._source)
+
+    def set_results(self, source: pd.DataFrame, positions: np.ndarray, scores: Optional[np.ndarray] = None):
+        self._result_positions = np.asarray(positions, dtype=np.intp)
+        self._result_scores = None if scores is None else np.asarray(scores)
+        if source is self._source:
+            self._update_rows(*self._sorted())
+            return
 
-    def update_data(self, data: pd.DataFrame):
         self.beginResetModel()
-        self._data = data
+        self._source = source
         self._update_display_columns()
+        if self._sort_column >= len(self._display_columns):
+            self._sort_column = RELEVANCE
+        self._positions, self._scores = self._sorted()
+        self._loaded = min(PAGE_SIZE, len(self._positions))
         self.endResetModel()
 
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        self._sort_column = column if 0 <= column < len(self._display_columns) else RELEVANCE
+        self._sort_order = order
+        self._update_rows(*self._sorted())
+
+    def sort_column(self) -> int:
+        return self._sort_column
+
+    def _sorted(self) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        if self._sort_column == RELEVANCE or len(self._result_positions) < 2:
+            return self._result_positions, self._result_scores
+        indices = self._sort_keys.argsort(
+            self._source,
+            self._result_positions,
+            self._display_columns[self._sort_column],
+            descending=self._sort_order == Qt.DescendingOrder,
+        )
+        scores = None if self._result_scores is None else self._result_scores[indices]
+        return self._result_positions[indices], scores
+
+    def _update_rows(self, positions: np.ndarray, scores: Optional[np.ndarray]) -> None:
+        loaded = min(max(self._loaded, PAGE_SIZE), len(positions))
+        old = self._positions[:self._loaded]
+        new = positions[:loaded]
+        if not np.array_equal(old, new):
+            kept = np.isin(old, new)
+            added = ~np.isin(new, old)
+            if kept.all() and not added.any():
+                self._move_rows(new)
+            elif (
+                np.array_equal(old[kept], new[~added])
+                and len(_runs(~kept)) + len(_runs(added)) <= DIFF_MAX_RUNS
+            ):
+                self._scores = None
+                self._remove_rows(old, ~kept)
+                self._insert_rows(new, added)
+            else:
+                self.beginResetModel()
+                self._positions, self._scores, self._loaded = positions, scores, loaded
+                self.endResetModel()
+                return
+        self._positions, self._scores, self._loaded = positions, scores, loaded
+
+    def _remove_rows(self, current: np.ndarray, removed: np.ndarray) -> None:
+        for start, stop in reversed(_runs(removed)):
+            self.beginRemoveRows(QModelIndex(), start, stop - 1)
+            current = np.concatenate([current[:start], current[stop:]])
+            self._positions, self._loaded = current, len(current)
+            self.endRemoveRows()
+
+    def _insert_rows(self, new: np.ndarray, added: np.ndarray) -> None:
+        current = self._positions
+        for start, stop in _runs(added):
+            self.beginInsertRows(QModelIndex(), start, stop - 1)
+            current = np.concatenate([current[:start], new[start:stop], current[start:]])
+            self._positions, self._loaded = current, len(current)
+            self.endInsertRows()
+
+    def _move_rows(self, new: np.ndarray) -> None:
+        self.layoutAboutToBeChanged.emit()
+        old = self._positions
+        row_of = {position: row for row, position in enumerate(new.tolist())}
+        persistent = self.persistentIndexList()
+        self._positions, self._loaded = new, len(new)
+        moved = [self.index(row_of[int(old[index.row()])], index.column()) for index in persistent]
+        self.changePersistentIndexList(persistent, moved)
+        self.layoutChanged.emit()
+
+    def set_missing_files(self, missing: Optional[np.ndarray]) -> None:
+        self._missing = missing
+        if self._loaded and self._display_columns:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self._loaded - 1, len(self._display_columns) - 1),
+                [Qt.ForegroundRole, Qt.ToolTipRole],
+            )
+
+    def _is_missing(self, row: int) -> bool:
+        if self._missing is None or len(self._missing) != len(self._source) or not 0 <= row < len(self._positions):
+            return False
+        return bool(self._missing[self._positions[row]])
+
+    def update_data(self, data: pd.DataFrame):
+        self.set_results(data, np.arange(len(data), dtype=np.intp))
+
+    def total_rows(self) -> int:
+        return len(self._positions)
+
+    def is_empty(self) -> bool:
+        return len(self._positions) == 0
+
+    def has_column(self, column: str) -> bool:
+        return column in self._source.columns
+
+    def column_name(self, section: int) -> str:
+        return self._display_columns[section]
+
+    def source_position(self, row: int) -> int:
+        if not 0 <= row < self._loaded:
+            raise IndexError(f"Row {row} out of range")
+        return int(self._positions[row])
+
+    def value(self, row: int, column: str) -> Any:
+        return self._source.iat[self.source_position(row), self._source.columns.get_loc(column)]
+
     def rowCount(self, parent=QModelIndex()):
-        return len(self._data)
+        if parent.isValid():
+            return 0
+        return self._loaded
 
     def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
         return len(self._display_columns)
 
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._positions)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        remaining = len(self._positions) - self._loaded
+        if remaining <= 0:
+            return
+        count = min(PAGE_SIZE, remaining)
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
     def data(self, index, role=Qt.DisplayRole):
-        if role == Qt.DisplayRole and index.isValid():
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
             try:
-                col_name = self._display_columns[index.column()]
-                return str(self._data.iloc[index.row()][col_name])
-            except (IndexError, KeyError):
+                return self._display_values[index.column()][self._positions[index.row()]]
+            except IndexError:
                 return None
+        if role == Qt.TextAlignmentRole:
+            return CELL_ALIGNMENT
+        if role == Qt.ForegroundRole and self._is_missing(index.row()):
+            return MISSING_FILE_COLOR
+        if role == Qt.ToolTipRole and self._is_missing(index.row()):
+            return "Case file not found on disk"
+        if role == Qt.ToolTipRole and self._scores is not None and 0 <= index.row() < len(self._scores):
+            return f"Relevance score: {self._scores[index.row()]}"
         return None
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
@@ -45,4 +221,6 @@ class PandasModel(QAbstractTableModel):
         return str(section)
 
     def flags(self, index):
-        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
\ No newline at end of file
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
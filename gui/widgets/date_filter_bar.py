@@ -11,6 +11,8 @@ from PySide6.QtWidgets import (
 )
 from datetime import date
 from typing import Optional, Tuple
+from gui.widgets.date_histogram import DateHistogram
+from utils.date_filter import DateCounts
 
 
 class DateFilterBar(QWidget):
@@ -19,6 +21,7 @@ class DateFilterBar(QWidget):
     def __init__(self):
         super().__init__()
         self._expanded = False
+        self._counts: Optional[DateCounts] = None
         self._setup_ui()
         self._connect_signals()
         self._update_visibility()
@@ -78,7 +81,14 @@ class DateFilterBar(QWidget):
         to_row.addStretch()
         filter_layout.addLayout(to_row)
 
+        self.histogram = DateHistogram()
+        self.histogram.setObjectName("date_histogram")
+        filter_layout.addWidget(self.histogram)
+
         bottom_row = QHBoxLayout()
+        self.range_count_label = QLabel("")
+        self.range_count_label.setObjectName("date_range_count")
+        bottom_row.addWidget(self.range_count_label)
         bottom_row.addStretch()
         
         self.apply_btn = QPushButton("Apply Filter")
@@ -99,6 +109,8 @@ class DateFilterBar(QWidget):
     def _connect_signals(self):
         self.from_enabled.stateChanged.connect(self._on_from_enabled_changed)
         self.to_enabled.stateChanged.connect(self._on_to_enabled_changed)
+        self.from_date.dateChanged.connect(self._update_range_preview)
+        self.to_date.dateChanged.connect(self._update_range_preview)
         self.apply_btn.clicked.connect(self._on_apply_clicked)
         self.clear_btn.clicked.connect(self._clear_all_filters)
 
@@ -114,10 +126,28 @@ class DateFilterBar(QWidget):
     def _on_from_enabled_changed(self, state):
         enabled = bool(state)
         self.from_date.setEnabled(enabled)
+        self._update_range_preview()
 
     def _on_to_enabled_changed(self, state):
         enabled = bool(state)
         self.to_date.setEnabled(enabled)
+        self._update_range_preview()
+
+    def set_date_counts(self, counts: Optional[DateCounts]):
+        self._counts = counts
+        self.histogram.set_counts(counts)
+        self._update_range_preview()
+
+    def _update_range_preview(self):
+        from_date, to_date = self.get_date_filters()
+        self.histogram.set_range(from_date, to_date)
+        if self._counts is None:
+            self.range_count_label.setText("")
+            return
+        text = f"{self._counts.matching(from_date, to_date):,} cases match"
+        if self._counts.unknown_count and (from_date is not None or to_date is not None):
+            text += f" (including {self._counts.unknown_count:,} with unknown dates)"
+        self.range_count_label.setText(text)
 
     def _on_apply_clicked(self):
         self.filter_changed.emit()
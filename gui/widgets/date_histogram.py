@@ -0,0 +1,80 @@
+from datetime import date
+from typing import List, Optional, Tuple
+import numpy as np
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QPainter, QPalette
+from PySide6.QtWidgets import QWidget, QToolTip
+from utils.date_filter import DateCounts
+
+MONTHLY_MAX_YEARS = 3
+
+
+class DateHistogram(QWidget):
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setMinimumHeight(60)
+        self.setMaximumHeight(90)
+        self.setMouseTracking(True)
+        self._counts: Optional[DateCounts] = None
+        self._from_date: Optional[date] = None
+        self._to_date: Optional[date] = None
+        self._bins: List[Tuple[str, date, date, int]] = []
+
+    def set_counts(self, counts: Optional[DateCounts]):
+        self._counts = counts
+        self._rebuild_bins()
+
+    def set_range(self, from_date: Optional[date], to_date: Optional[date]):
+        self._from_date = from_date
+        self._to_date = to_date
+        self._rebuild_bins()
+
+    def _rebuild_bins(self):
+        self._bins = []
+        counts = self._counts
+        if counts is not None and counts.known_count:
+            if self._from_date and self._to_date and 0 <= self._to_date.year - self._from_date.year < MONTHLY_MAX_YEARS:
+                months, values = counts.month_bins(self._from_date.year, self._to_date.year)
+                for month, value in zip(months, values):
+                    first = month.astype("datetime64[D]").item()
+                    last = ((month + 1).astype("datetime64[D]") - 1).item()
+                    self._bins.append((first.strftime("%b %Y"), first, last, int(value)))
+            else:
+                years, values = counts.year_bins()
+                for year, value in zip(years, values):
+                    self._bins.append((str(year), date(int(year), 1, 1), date(int(year), 12, 31), int(value)))
+        self.update()
+
+    def _in_range(self, first: date, last: date) -> bool:
+        if self._from_date and last < self._from_date:
+            return False
+        if self._to_date and first > self._to_date:
+            return False
+        return True
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if not self._bins:
+            painter.setPen(self.palette().color(QPalette.PlaceholderText))
+            painter.drawText(self.rect(), Qt.AlignCenter, "No dated cases")
+            return
+
+        peak = max(b[3] for b in self._bins) or 1
+        width = self.width() / len(self._bins)
+        height = self.height() - 2
+        selected = self.palette().color(QPalette.Highlight)
+        other = self.palette().color(QPalette.Mid)
+        painter.setPen(Qt.NoPen)
+        for i, (_, first, last, value) in enumerate(self._bins):
+            if not value:
+                continue
+            bar = max(1.0, height * value / peak)
+            painter.setBrush(selected if self._in_range(first, last) else other)
+            painter.drawRect(QRectF(i * width, self.height() - bar, max(1.0, width - 1), bar))
+
+    def mouseMoveEvent(self, event):
+        if not self._bins:
+            return
+        index = int(event.position().x() * len(self._bins) / max(1, self.width()))
+        label, _, _, value = self._bins[int(np.clip(index, 0, len(self._bins) - 1))]
+        QToolTip.showText(event.globalPosition().toPoint(), f"{label}: {value:,} cases", self)
@@ -44,3 +44,19 @@ class SearchBar(QWidget):
 
     def show_fuzzy_results(self) -> bool:
         return self.fuzzy_checkbox.isChecked()
+
+    def current_column(self) -> str:
+        return self.column_selector.currentText()
+
+    def current_query(self) -> str:
+        return self.search_box.text().strip()
+
+    def apply_search(self, column: str, query: str, fuzzy: bool):
+        for widget in (self.column_selector, self.search_box, self.fuzzy_checkbox):
+            widget.blockSignals(True)
+        self.column_selector.setCurrentText(column)
+        self.search_box.setText(query)
+        self.fuzzy_checkbox.setChecked(fuzzy)
+        for widget in (self.column_selector, self.search_box, self.fuzzy_checkbox):
+            widget.blockSignals(False)
+        self._on_search_text_changed()
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
@@ -16,4 +17,5 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,322 @@
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import multiprocessing
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Hashable, Optional
+
+import pandas as pd
+
+from config.logging_config import setup_logging
+from config.settings import settings, expected_columns
+from core.filters import FilterEngine
+from core.html_parser import parse_html_content
+from core.text_cache import text_cache
+from core.search import SearchEngine
+from core.search_client import result_to_payload, table_to_payload
+from data.data_loader import load_database
+from utils.path_index import CASELAW_DIR
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 1024 * 1024
+GZIP_MIN_BYTES = 4096
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class _Gzipped(bytes):
+    pass
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except (ValueError, TypeError):
+        raise HttpError(400, f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+def _parse_int(request: Dict[str, Any], name: str, default: int) -> int:
+    value = request.get(name, default)
+    if isinstance(value, bool):
+        raise HttpError(400, f"'{name}' must be an integer")
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        raise HttpError(400, f"'{name}' must be an integer")
+
+
+class SearchServer:
+    def __init__(self, data: pd.DataFrame, database_path: str = "", workers: int = 4, fuzzy_workers: int = 0):
+        self.data = data
+        self.database_path = database_path
+        self.version = f"{len(data)}-{datetime.now():%Y%m%d%H%M%S}"
+        self.started_at = datetime.now()
+        self._engine = SearchEngine(
+            fuzzy_threshold=settings.fuzzy_search_threshold,
+            fuzzy_limit=settings.fuzzy_search_limit,
+            fuzzy_workers=fuzzy_workers,
+        )
+        self._filters = FilterEngine()
+        self._filters.set_source_data(data)
+        self._case_paths = frozenset(
+            data["file_path"].dropna().astype(str).str.strip() if "file_path" in data.columns else ()
+        )
+        self._caselaw_root = CASELAW_DIR.resolve()
+        self._filter_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="search")
+        self._results: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._results_lock = threading.Lock()
+        self._table_body: Optional[_Gzipped] = None
+        self._requests = 0
+        self._result_hits = 0
+
+        start = perf_counter()
+        for column in expected_columns():
+            if column in data.columns:
+                self._engine.warm(data, column)
+        logger.info(f"Search indexes warmed in {perf_counter() - start:.2f}s")
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").strip().split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Malformed request line"}, close=True)
+                    break
+
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {"error": "Invalid Content-Length header"}, close=True)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": "Request body too large"}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                gzip_ok = "gzip" in headers.get("accept-encoding", "")
+                self._requests += 1
+                try:
+                    status, payload = 200, await self._route(method, path.split("?", 1)[0], body)
+                except HttpError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except Exception as e:
+                    logger.error(f"{method} {path} failed: {e}", exc_info=True)
+                    status, payload = 500, {"error": str(e)}
+                await self._respond(writer, status, payload, close=not keep_alive, gzip_ok=gzip_ok)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(
+        self, writer: asyncio.StreamWriter, status: int, payload: Any, close: bool = False, gzip_ok: bool = False
+    ) -> None:
+        compressed = False
+        if isinstance(payload, _Gzipped):
+            body = bytes(payload) if gzip_ok else gzip.decompress(payload)
+            compressed = gzip_ok
+        elif isinstance(payload, bytes):
+            body = payload
+        else:
+            body = json.dumps(payload).encode("utf-8")
+        if gzip_ok and not compressed and len(body) >= GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            compressed = True
+
+        headers = [
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+            "Content-Type: application/json",
+            f"Connection: {'close' if close else 'keep-alive'}",
+        ]
+        if compressed:
+            headers.append("Content-Encoding: gzip")
+        headers.append(f"Content-Length: {len(body)}")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def _route(self, method: str, path: str, body: bytes) -> Any:
+        routes = {
+            ("GET", "/health"): self._health,
+            ("GET", "/stats"): self._stats,
+            ("GET", "/table"): self._table,
+            ("POST", "/search"): self._search,
+            ("POST", "/case-text"): self._case_text,
+        }
+        handler = routes.get((method, path))
+        if handler is None:
+            if any(p == path for _, p in routes):
+                raise HttpError(405, f"{method} not allowed on {path}")
+            raise HttpError(404, f"No route for {path}")
+
+        request = {}
+        if body:
+            try:
+                request = json.loads(body.decode("utf-8"))
+            except ValueError as e:
+                raise HttpError(400, f"Invalid JSON body: {e}")
+            if not isinstance(request, dict):
+                raise HttpError(400, "JSON body must be an object")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, handler, request)
+
+    def _health(self, _request: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "ok", "rows": len(self.data), "version": self.version,
+                "database": self.database_path, "started": self.started_at.isoformat(timespec="seconds")}
+
+    def _stats(self, _request: Dict[str, Any]) -> Dict[str, Any]:
+        with self._filter_lock:
+            filter_stats = self._filters.stats()
+        return {"requests": self._requests, "result cache": len(self._results),
+                "result cache hits": self._result_hits, "filters": filter_stats,
+                "fuzzy pool": self._engine.pool_stats(), "case text cache": text_cache.stats()}
+
+    def _table(self, _request: Dict[str, Any]) -> _Gzipped:
+        if self._table_body is None:
+            start = perf_counter()
+            body = json.dumps(table_to_payload(self.data, self.version)).encode("utf-8")
+            self._table_body = _Gzipped(gzip.compress(body, compresslevel=6))
+            logger.info(f"Table payload built in {perf_counter() - start:.2f}s "
+                        f"({len(body) / 1e6:.1f} MB, {len(self._table_body) / 1e6:.1f} MB gzipped)")
+        return self._table_body
+
+    def _search(self, request: Dict[str, Any]) -> bytes:
+        column = request.get("column")
+        query = request.get("query")
+        if not isinstance(column, str) or not isinstance(query, str):
+            raise HttpError(400, "'column' and 'query' are required strings")
+        from_date = _parse_date(request.get("from_date"))
+        to_date = _parse_date(request.get("to_date"))
+        min_query_length = _parse_int(request, "min_query_length", settings.min_query_length_for_fuzzy)
+        max_exact = _parse_int(request, "max_exact_before_fuzzy", settings.max_exact_matches_before_fuzzy)
+
+        key = (column, query, from_date, to_date, min_query_length, max_exact)
+        with self._results_lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                self._result_hits += 1
+                return cached
+
+        start = perf_counter()
+        with self._filter_lock:
+            rows = self._filters.date_window(from_date, to_date)
+        filter_duration = perf_counter() - start
+
+        result = self._engine.search(
+            self.data, column, query,
+            min_query_length=min_query_length,
+            max_exact_before_fuzzy=max_exact,
+            rows=rows,
+        )
+        result.timings = {"filter": filter_duration, **result.timings}
+        result.duration = perf_counter() - start
+        body = json.dumps(result_to_payload(result)).encode("utf-8")
+        if result.success:
+            with self._results_lock:
+                self._results[key] = body
+                if len(self._results) > settings.search_result_cache_size * 8:
+                    self._results.popitem(last=False)
+        return body
+
+    def _case_text(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        file_path = request.get("file_path")
+        if not isinstance(file_path, str) or not file_path:
+            raise HttpError(400, "'file_path' is required")
+        if not self._is_case_path(file_path):
+            raise HttpError(404, f"Not a case file: {file_path}")
+        try:
+            return {"text": text_cache.get(file_path, parse_html_content)}
+        except FileNotFoundError as e:
+            raise HttpError(404, str(e))
+
+    def _is_case_path(self, file_path: str) -> bool:
+        # Only files listed in the table or kept under Caselaw/ are served; anything else could be any file on the host.
+        if file_path.strip() in self._case_paths:
+            return True
+        try:
+            return Path(file_path).resolve().is_relative_to(self._caselaw_root)
+        except (OSError, ValueError):
+            return False
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._engine.set_fuzzy_workers(0)
+
+
+async def serve(server: SearchServer, host: str, port: int, ready: Optional[threading.Event] = None) -> None:
+    listener = await asyncio.start_server(server.handle_connection, host, port)
+    addresses = ", ".join(str(s.getsockname()) for s in listener.sockets)
+    logger.info(f"Search server listening on {addresses}")
+    print(f"Serving {len(server.data):,} cases on http://{host}:{port}", file=sys.stderr, flush=True)
+    if ready is not None:
+        ready.set()
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Serve one shared in-memory case index over local HTTP/JSON")
+    parser.add_argument("--database", default=settings.database_path, help="Excel database (defaults to the configured one)")
+    parser.add_argument("--host", default=settings.search_server_host)
+    parser.add_argument("--port", type=int, default=settings.search_server_port)
+    parser.add_argument("--workers", type=int, default=4, help="Threads serving concurrent requests")
+    parser.add_argument("--fuzzy-workers", type=int, default=settings.fuzzy_workers, help="Processes used for fuzzy scoring (0 = in-process)")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    args = parser.parse_args(argv)
+
+    setup_logging(log_file="search_server.log", log_level=args.log_level)
+    try:
+        data = load_database(args.database)
+    except Exception as e:
+        print(f"Could not load database: {e}", file=sys.stderr)
+        return 2
+
+    server = SearchServer(data, database_path=str(Path(args.database)), workers=args.workers,
+                          fuzzy_workers=args.fuzzy_workers)
+    try:
+        asyncio.run(serve(server, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
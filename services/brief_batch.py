@@ -0,0 +1,110 @@
+from PySide6.QtCore import QObject, Signal
+from collections import deque
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import List, Set
+import logging
+from data.workers.stream_worker import BriefStreamWorker
+from core.brief_utils import BriefRequest, build_brief_path
+from utils.helpers import save_brief
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchSummary:
+    total: int
+    saved: int = 0
+    failed: int = 0
+    canceled: int = 0
+    elapsed_s: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def done(self) -> int:
+        return self.saved + self.failed
+
+    @property
+    def per_minute(self) -> float:
+        return self.done * 60 / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+class BriefBatch(QObject):
+    progress = Signal(object)
+    finished = Signal(object)
+
+    def __init__(self, requests: List[BriefRequest], fmt: str, concurrency: int, reasoning_effort: str, parent=None):
+        super().__init__(parent)
+        self._pending = deque(requests)
+        self._fmt = fmt
+        self._concurrency = max(1, concurrency)
+        self._reasoning_effort = reasoning_effort
+        self._running: Set[BriefStreamWorker] = set()
+        self._summary = BatchSummary(total=len(requests))
+        self._start = 0.0
+        self._finished = False
+
+    @property
+    def summary(self) -> BatchSummary:
+        return self._summary
+
+    def start(self) -> None:
+        self._start = perf_counter()
+        self._fill()
+
+    def cancel(self) -> None:
+        # Briefs already streaming are left to finish and are still saved.
+        self._summary.canceled += len(self._pending)
+        self._pending.clear()
+        self._finish_if_done()
+
+    def _fill(self) -> None:
+        while self._pending and len(self._running) < self._concurrency:
+            request = self._pending.popleft()
+            try:
+                self._start_worker(request)
+            except Exception as e:
+                logger.error(f"Failed to start brief for {request.file_path}: {e}", exc_info=True)
+                self._fail(request, str(e))
+        self._finish_if_done()
+
+    def _start_worker(self, request: BriefRequest) -> None:
+        worker = BriefStreamWorker(request, reasoning_effort=self._reasoning_effort)
+        worker.setParent(self)
+        worker.done.connect(lambda text, r=request: self._on_done(r, text))
+        worker.error.connect(lambda msg, r=request: self._fail(r, msg))
+        worker.finished.connect(lambda w=worker: self._on_worker_finished(w))
+        self._running.add(worker)
+        worker.start()
+
+    def _on_done(self, request: BriefRequest, text: str) -> None:
+        try:
+            save_path = save_brief(text, build_brief_path(request.file_path, self._fmt), self._fmt)
+        except Exception as e:
+            logger.error(f"Save failed for {request.file_path}: {e}", exc_info=True)
+            self._fail(request, f"save failed: {e}")
+            return
+        logger.info(f"Brief saved to {save_path}")
+        self._summary.saved += 1
+        self._report()
+
+    def _fail(self, request: BriefRequest, msg: str) -> None:
+        self._summary.failed += 1
+        self._summary.errors.append(f"{request.citation or request.file_path}: {msg}")
+        self._report()
+
+    def _on_worker_finished(self, worker: BriefStreamWorker) -> None:
+        self._running.discard(worker)
+        worker.deleteLater()
+        self._fill()
+
+    def _report(self) -> None:
+        self._summary.elapsed_s = perf_counter() - self._start
+        self.progress.emit(self._summary)
+
+    def _finish_if_done(self) -> None:
+        if self._finished or self._pending or self._running:
+            return
+        self._finished = True
+        self._report()
+        self.finished.emit(self._summary)
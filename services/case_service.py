@@ -2,8 +2,8 @@ from PySide6.QtCore import QObject, Signal
 from typing import List
 import logging
 from data.workers.stream_worker import StreamWorker
-from core.brief_utils import build_prompt, BriefRequest
-from core.html_parser import parse_html_content
+from core.brief_utils import build_messages, BriefRequest
+from core.html_parser import load_case_text
 from config.settings import settings, requires_api_key
 
 logger = logging.getLogger(__name__)
@@ -21,7 +21,7 @@ class CaseService(QObject):
     def copy_case_text(self, file_path: str) -> bool:
         from PySide6.QtWidgets import QApplication
         try:
-            QApplication.clipboard().setText(parse_html_content(file_path))
+            QApplication.clipboard().setText(load_case_text(file_path))
             return True
         except Exception as e:
             logger.error(f"Copy case text failed: {e}", exc_info=True)
@@ -38,16 +38,10 @@ class CaseService(QObject):
                 self.api_key_missing.emit()
                 return
 
-            case_text = parse_html_content(request.file_path)
-            prompt = build_prompt(request, case_text)
-
-            messages = [
-                {"role": "system", "content": "You are a helpful assistant."},
-                {"role": "user", "content": prompt}
-            ]
+            case_text = load_case_text(request.file_path, request.segments)
 
             worker = StreamWorker(
-                messages=messages,
+                messages=build_messages(request, case_text),
                 model=request.model,
                 temperature=request.temperature,
                 verbosity=request.verbosity,
@@ -4,7 +4,7 @@ import logging
 import hashlib
 from datetime import datetime
 from core.chat_models import CaseConversation, ChatMessage
-from core.html_parser import parse_html_content
+from core.html_parser import load_case_text
 from data.chat_storage import ChatStorage
 from data.workers.stream_worker import StreamWorker
 from config.settings import settings, requires_api_key
@@ -32,7 +32,7 @@ class ChatService(QObject):
                 self.api_key_missing.emit()
                 return None
 
-            case_text = parse_html_content(file_path)
+            case_text = load_case_text(file_path)
             conversation_id = self._generate_conversation_id(file_path)
 
             conversation = CaseConversation(
@@ -0,0 +1,110 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, QFileSystemWatcher, Signal
+from typing import Any, Dict, List, Set
+import logging
+import pandas as pd
+from utils.diagnostics import register_provider
+from utils.path_index import CASELAW_DIR, case_directories, path_index
+
+logger = logging.getLogger(__name__)
+
+REFRESH_DELAY_MS = 1500
+MAX_WATCHED_DIRS = 256
+
+
+class _IndexSignals(QObject):
+    finished = Signal(int, bool, object)
+
+
+class _IndexTask(QRunnable):
+    def __init__(self, generation: int, file_paths: List[str], directories: List[str], full: bool, signals: _IndexSignals):
+        super().__init__()
+        self.generation = generation
+        self.file_paths = file_paths
+        self.directories = directories
+        self.full = full
+        self.signals = signals
+
+    def run(self):
+        try:
+            if self.full:
+                path_index.build(self.directories)
+            else:
+                path_index.refresh(self.directories)
+            missing = path_index.missing_mask(self.file_paths, CASELAW_DIR)
+        except Exception as e:
+            logger.error(f"Indexing case directories failed: {e}", exc_info=True)
+            return
+        self.signals.finished.emit(self.generation, self.full, missing)
+
+
+class FileIndexService(QObject):
+    missing_files = Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._signals = _IndexSignals(self)
+        self._signals.finished.connect(self._on_finished)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._refresh)
+        self._file_paths: List[str] = []
+        self._generation = 0
+        self._changed: Set[str] = set()
+        self._missing = 0
+        self._refreshes = 0
+
+        register_provider("Case file index", self.diagnostics)
+
+    def set_data(self, data: pd.DataFrame) -> None:
+        self._generation += 1
+        self._changed.clear()
+        if "file_path" in data.columns:
+            self._file_paths = data["file_path"].fillna("").astype(str).tolist()
+        else:
+            self._file_paths = []
+        directories = case_directories(self._file_paths, CASELAW_DIR)
+        self._pool.start(_IndexTask(self._generation, self._file_paths, directories, True, self._signals))
+
+    def diagnostics(self) -> Dict[str, Any]:
+        stats = path_index.stats()
+        stats.update({
+            "watched directories": len(self._watcher.directories()),
+            "refreshes after directory changes": self._refreshes,
+            "cases with missing files": self._missing,
+        })
+        return stats
+
+    def _watch(self) -> None:
+        watched = self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+        directories = path_index.directories()
+        if len(directories) > MAX_WATCHED_DIRS:
+            logger.info(f"Watching {MAX_WATCHED_DIRS} of {len(directories)} case directories for changes")
+        if directories:
+            self._watcher.addPaths(directories[:MAX_WATCHED_DIRS])
+
+    def _on_directory_changed(self, directory: str) -> None:
+        self._changed.add(directory)
+        self._refresh_timer.start()
+
+    def _refresh(self) -> None:
+        if not self._changed:
+            return
+        directories = sorted(self._changed)
+        self._changed.clear()
+        self._refreshes += 1
+        self._pool.start(_IndexTask(self._generation, self._file_paths, directories, False, self._signals))
+
+    def _on_finished(self, generation: int, full: bool, missing) -> None:
+        if generation != self._generation:
+            return
+        if full:
+            self._watch()
+        self._missing = int(missing.sum())
+        self.missing_files.emit(missing)
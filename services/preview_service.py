@@ -0,0 +1,129 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from collections import OrderedDict
+from typing import Any, Dict, Set
+import logging
+import threading
+from core.html_parser import load_case_text
+from config.settings import settings
+from utils.diagnostics import register_provider
+
+logger = logging.getLogger(__name__)
+
+
+def excerpt(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind(" ", 0, max_chars)
+    return text[:cut if cut > max_chars // 2 else max_chars].rstrip() + " …"
+
+
+class _Latest:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._path = ""
+
+    def set(self, path: str) -> None:
+        with self._lock:
+            self._path = path
+
+    def get(self) -> str:
+        with self._lock:
+            return self._path
+
+
+class _PreviewSignals(QObject):
+    loaded = Signal(str, str)
+    failed = Signal(str, str)
+    skipped = Signal(str)
+
+
+class _PreviewTask(QRunnable):
+    def __init__(self, file_path: str, max_chars: int, latest: _Latest, signals: _PreviewSignals):
+        super().__init__()
+        self.file_path = file_path
+        self.max_chars = max_chars
+        self.latest = latest
+        self.signals = signals
+
+    def run(self):
+        if self.latest.get() != self.file_path:
+            self.signals.skipped.emit(self.file_path)
+            return
+        try:
+            text = excerpt(load_case_text(self.file_path), self.max_chars)
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, str(e))
+            return
+        self.signals.loaded.emit(self.file_path, text)
+
+
+class PreviewService(QObject):
+    preview_ready = Signal(str, str)
+    preview_failed = Signal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, settings.preview_workers))
+        self._signals = _PreviewSignals(self)
+        self._signals.loaded.connect(self._on_loaded)
+        self._signals.failed.connect(self._on_failed)
+        self._signals.skipped.connect(self._on_skipped)
+        self._latest = _Latest()
+        self._in_flight: Set[str] = set()
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._skipped = 0
+
+        register_provider("Preview", self.diagnostics)
+
+    def request(self, file_path: str) -> None:
+        self._latest.set(file_path)
+        cached = self._cache.get(file_path)
+        if cached is not None:
+            self._cache.move_to_end(file_path)
+            self._hits += 1
+            self.preview_ready.emit(file_path, cached)
+            return
+
+        self._misses += 1
+        if file_path in self._in_flight:
+            return
+        self._in_flight.add(file_path)
+        self._pool.start(_PreviewTask(file_path, settings.preview_chars, self._latest, self._signals))
+
+    def cancel(self) -> None:
+        self._latest.set("")
+
+    def diagnostics(self) -> Dict[str, Any]:
+        return {
+            "cached previews": f"{len(self._cache)}/{settings.preview_cache_size}",
+            "hits": self._hits,
+            "misses": self._misses,
+            "stale requests skipped": self._skipped,
+        }
+
+    def _on_loaded(self, file_path: str, text: str) -> None:
+        self._in_flight.discard(file_path)
+        self._cache[file_path] = text
+        self._cache.move_to_end(file_path)
+        while len(self._cache) > settings.preview_cache_size:
+            self._cache.popitem(last=False)
+        if file_path == self._latest.get():
+            self.preview_ready.emit(file_path, text)
+
+    def _on_failed(self, file_path: str, error: str) -> None:
+        self._in_flight.discard(file_path)
+        logger.warning(f"Preview failed for {file_path}: {error}")
+        if file_path == self._latest.get():
+            self.preview_failed.emit(file_path, error)
+
+    def _on_skipped(self, file_path: str) -> None:
+        self._in_flight.discard(file_path)
+        self._skipped += 1
+        # The row may have been selected again after the task saw it as stale; request() found it
+        # still in flight then and queued nothing, so queue it now.
+        if file_path == self._latest.get():
+            self._in_flight.add(file_path)
+            self._pool.start(_PreviewTask(file_path, settings.preview_chars, self._latest, self._signals))
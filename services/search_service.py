@@ -1,55 +1,168 @@
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, QTimer
 import pandas as pd
+from collections import OrderedDict
+from dataclasses import replace
+from functools import partial
 from datetime import date
 from time import perf_counter
-from typing import Optional
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 import logging
+from core.debounce import AdaptiveDebounce
+from core.bitset import RowBitset
+from core.filters import FilterEngine
+from utils.date_filter import DateCounts
 from core.search import SearchEngine, SearchResult
+from core.search_client import SearchClient, SearchServerError
 from config.settings import settings
-from utils.date_filter import filter_by_date_range
+from utils.diagnostics import register_provider
 
 logger = logging.getLogger(__name__)
 
 
+class _SearchSignals(QObject):
+    done = Signal(int, object)
+
+
+class _SearchTask(QRunnable):
+    def __init__(self, generation: int, current: Callable[[], int], work: Callable[[], Any], signals: _SearchSignals):
+        super().__init__()
+        self.generation = generation
+        self.current = current
+        self.work = work
+        self.signals = signals
+
+    def run(self):
+        if self.current() != self.generation:
+            return
+        self.signals.done.emit(self.generation, self.work())
+
+
+class _EngineTask(QRunnable):
+    def __init__(self, work: Callable[[], Any]):
+        super().__init__()
+        self.work = work
+
+    def run(self):
+        try:
+            self.work()
+        except Exception as e:
+            logger.error(f"Fuzzy engine maintenance failed: {e}", exc_info=True)
+
+
 class SearchService(QObject):
     search_complete = Signal(SearchResult)
+    search_partial = Signal(SearchResult)
     search_started = Signal()
 
     def __init__(self):
         super().__init__()
         self._data = pd.DataFrame()
+        # The GUI thread runs exact searches on _engine. Fuzzy passes and remote searches run on the
+        # single background thread, and only that thread touches _fuzzy_engine and its worker pool.
         self._engine = SearchEngine(
             fuzzy_threshold=settings.fuzzy_search_threshold,
             fuzzy_limit=settings.fuzzy_search_limit,
         )
+        self._fuzzy_engine = SearchEngine(
+            fuzzy_threshold=settings.fuzzy_search_threshold,
+            fuzzy_limit=settings.fuzzy_search_limit,
+            fuzzy_workers=settings.fuzzy_workers,
+        )
+        self._filters = FilterEngine()
+        self._client: Optional[SearchClient] = None
         self._timer = QTimer()
         self._timer.setSingleShot(True)
         self._timer.timeout.connect(self._execute_search)
+        self._background = QThreadPool(self)
+        self._background.setMaxThreadCount(1)
+        self._background_signals = _SearchSignals(self)
+        self._background_signals.done.connect(self._on_background_done)
+        self._generation = 0
+        self._discarded = 0
         self._debounce_ms = settings.search_debounce_ms
+        self._debounce = AdaptiveDebounce(
+            fallback_ms=settings.search_debounce_ms,
+            min_ms=settings.search_debounce_min_ms,
+            max_ms=settings.search_debounce_max_ms,
+            cheap_ms=settings.cheap_search_ms,
+            min_query_length_for_fuzzy=settings.min_query_length_for_fuzzy,
+            max_exact_before_fuzzy=settings.max_exact_matches_before_fuzzy,
+        )
+        self._results: "OrderedDict[Hashable, SearchResult]" = OrderedDict()
+        self._result_hits = 0
+        self._result_misses = 0
         self._column = ""
         self._query = ""
         
         self._from_date: Optional[date] = None
         self._to_date: Optional[date] = None
 
+        register_provider("Search", self.diagnostics)
+
     def set_data(self, data: pd.DataFrame):
+        self._cancel_pending()
         self._data = data
         self._engine.set_source_data(data)
         self._engine.clear_cache()
+        self._background.start(_EngineTask(self._fuzzy_engine.clear_cache))
+        self._filters.set_source_data(data)
+        self._filters.clear_cache()
+        self._results.clear()
+
+        server_url = data.attrs.get("search_server_url")
+        if self._client is not None:
+            # Remote searches open their connection on the background thread, so close it there too.
+            self._client.close()
+            self._background.start(_EngineTask(self._client.close))
+        self._client = SearchClient(server_url, timeout=settings.search_server_timeout_s) if server_url else None
+        logger.info(f"Search mode: {f'server {server_url}' if server_url else 'local'}")
+
+    def apply_settings(self) -> None:
+        workers = settings.fuzzy_workers
+        self._background.start(_EngineTask(lambda: self._fuzzy_engine.set_fuzzy_workers(workers)))
 
     def set_date_filters(self, from_date: Optional[date], to_date: Optional[date]):
         self._from_date = from_date
         self._to_date = to_date
         
         if not self._data.empty and self._column:
+            self._cancel_pending()
             self._timer.stop()
             self._timer.start(self._debounce_ms)
 
     def schedule_search(self, column: str, query: str):
         self._column = column
         self._query = query
+        self._cancel_pending()
         self._timer.stop()
-        self._timer.start(self._debounce_ms)
+
+        if not settings.adaptive_debounce:
+            self._timer.start(self._debounce_ms)
+            return
+
+        self._debounce.note_input(perf_counter())
+        cached = self._result_key() in self._results
+        self._timer.start(self._debounce.delay_for(query, cached=cached))
+
+    def date_counts(self) -> DateCounts:
+        return self._filters.date_index.counts()
+
+    def diagnostics(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "mode": f"server {self._client.base_url}" if self._client is not None else "local",
+            "debounce policy": "adaptive" if settings.adaptive_debounce else f"fixed {self._debounce_ms} ms",
+        }
+        stats.update(self._debounce.stats())
+        stats["result cache"] = f"{len(self._results)}/{settings.search_result_cache_size}"
+        stats["result cache hits"] = self._result_hits
+        stats["result cache misses"] = self._result_misses
+        stats["stale background searches discarded"] = self._discarded
+        stats.update({f"filter {k}": v for k, v in self._filters.stats().items()})
+        stats.update({f"fuzzy pool {k}": v for k, v in self._fuzzy_engine.pool_stats().items()})
+        return stats
+
+    def _result_key(self) -> Hashable:
+        return (self._column, self._query, self._from_date, self._to_date)
 
     def _execute_search(self):
         if self._data.empty or not self._column:
@@ -57,22 +170,122 @@ class SearchService(QObject):
             
         self.search_started.emit()
         start = perf_counter()
-        
-        search_data = self._data
-        if self._from_date is not None or self._to_date is not None:
-            search_data = filter_by_date_range(
-                self._data,
-                from_date=self._from_date,
-                to_date=self._to_date,
+
+        key = self._result_key()
+        cached = self._results.get(key)
+        if cached is not None:
+            self._results.move_to_end(key)
+            self._result_hits += 1
+            lookup = perf_counter() - start
+            self.search_complete.emit(replace(cached, duration=lookup, timings={"cache": lookup}))
+            return
+        self._result_misses += 1
+
+        if self._client is not None:
+            self._start_background(partial(
+                self._remote_phase, key, start, self._client, self._data, self._column, self._query,
+                self._from_date, self._to_date,
+            ))
+            return
+
+        result, rows = self._local_exact_search()
+        if result.success and self._engine.wants_fuzzy(
+            len(result.exact_positions),
+            self._query,
+            settings.min_query_length_for_fuzzy,
+            settings.max_exact_matches_before_fuzzy,
+        ):
+            result.duration = perf_counter() - start
+            self.search_partial.emit(result)
+            string_column = self._engine.string_column(self._data, self._column)
+            self._start_background(partial(
+                self._fuzzy_phase, key, start, self._data, string_column, self._query, rows, result
+            ))
+            return
+        self._finish_search(key, start, self._query, result)
+
+    def _start_background(self, work: Callable[[], Any]) -> None:
+        self._generation += 1
+        self._background.start(_SearchTask(self._generation, lambda: self._generation, work, self._background_signals))
+
+    def _fuzzy_phase(self, key, start, data, string_column, query, rows, exact) -> Tuple[Hashable, float, str, SearchResult]:
+        # Runs on the background thread; the exact phase already published its matches.
+        self._fuzzy_engine.adopt_string_column(data, string_column)
+        column = string_column.name
+        result = self._fuzzy_engine.search(
+            data,
+            column,
+            query,
+            min_query_length=settings.min_query_length_for_fuzzy,
+            max_exact_before_fuzzy=settings.max_exact_matches_before_fuzzy,
+            rows=rows,
+            exact_positions=exact.exact_positions,
+        )
+        result.timings = {**exact.timings, **result.timings}
+        return key, start, query, result
+
+    def _on_background_done(self, generation: int, outcome) -> None:
+        if generation != self._generation:
+            self._discarded += 1
+            return
+        self._finish_search(*outcome)
+
+    def _cancel_pending(self):
+        self._generation += 1
+
+    def _finish_search(self, key: Hashable, start: float, query: str, result: SearchResult):
+        result.duration = perf_counter() - start
+        logger.debug(
+            f"Search '{query}' on {self._column} took {result.duration:.4f}s; "
+            f"phases: {', '.join(f'{k}={v:.4f}s' for k, v in result.timings.items())}; "
+            f"counts: {result.counts}"
+        )
+        if result.success:
+            self._debounce.record(
+                query,
+                result.duration,
+                fuzzy_ran="fuzzy_score" in result.timings,
+                exact_count=len(result.exact_positions),
             )
-            logger.info(f"Date filtering: {len(self._data)} → {len(search_data)} rows")
+            self._results[key] = result
+            if len(self._results) > settings.search_result_cache_size:
+                self._results.popitem(last=False)
+        self.search_complete.emit(result)
+
+    def _remote_phase(self, key, start, client, data, column, query, from_date, to_date) -> Tuple[Hashable, float, str, SearchResult]:
+        # Runs on the background thread so a slow server never blocks typing.
+        request_start = perf_counter()
+        try:
+            result = client.search(
+                column,
+                query,
+                from_date=from_date,
+                to_date=to_date,
+                min_query_length=settings.min_query_length_for_fuzzy,
+                max_exact_before_fuzzy=settings.max_exact_matches_before_fuzzy,
+                source=data,
+            )
+        except SearchServerError as e:
+            logger.error(f"Remote search failed: {e}")
+            return key, start, query, SearchResult(success=False, message=str(e))
+        result.timings = {**result.timings, "round_trip": perf_counter() - request_start}
+        return key, start, query, result
+
+    def _local_exact_search(self) -> Tuple[SearchResult, Optional[RowBitset]]:
+        start = perf_counter()
+        
+        rows = self._filters.date_window(self._from_date, self._to_date)
+        filter_duration = perf_counter() - start
+        if rows is not None:
+            logger.info(f"Row filtering: {len(self._data)} → {rows.count()} rows")
         
         result = self._engine.search(
-            search_data,
+            self._data,
             self._column,
             self._query,
             min_query_length=settings.min_query_length_for_fuzzy,
-            max_exact_before_fuzzy=settings.max_exact_matches_before_fuzzy,
+            max_exact_before_fuzzy=0,
+            rows=rows,
         )
-        result.duration = perf_counter() - start
-        self.search_complete.emit(result)
\ No newline at end of file
+        result.timings = {"filter": filter_duration, **result.timings}
+        return result, rows
\ No newline at end of file
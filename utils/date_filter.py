@@ -1,4 +1,4 @@
-from datetime import timedelta
+import numpy as np
 import pandas as pd
 from datetime import date
 from typing import Optional, Tuple
@@ -19,89 +19,185 @@ def filter_by_date_range(
     if data.empty:
         return data
 
-    required_cols = {'year', 'month', 'day'}
-    if not required_cols.issubset(data.columns):
-        logger.warning(f"Missing date columns: {required_cols - set(data.columns)}")
-        return data
-
-    case_ranges = data.apply(
-        lambda row: _compute_case_date_range(row['year'], row['month'], row['day']),
-        axis=1,
-        result_type='expand'
-    )
-    case_ranges.columns = ['case_min', 'case_max', 'is_unknown']
-
-    filter_min = from_date if from_date is not None else MIN_DATE
-    filter_max = to_date if to_date is not None else MAX_DATE
-
-    mask = case_ranges.apply(
-        lambda row: _ranges_overlap(
-            case_min=row['case_min'],
-            case_max=row['case_max'],
-            is_unknown=row['is_unknown'],
-            filter_min=filter_min,
-            filter_max=filter_max,
-        ),
-        axis=1
-    )
-
-    filtered = data[mask]
+    filtered = data[date_range_mask(data, from_date=from_date, to_date=to_date)]
     logger.info(f"Date filtering: {len(data)} → {len(filtered)} rows")
     return filtered
 
 
-def _compute_case_date_range(
-    year: pd.Int64Dtype,
-    month: pd.Int64Dtype,
-    day: pd.Int64Dtype,
-) -> Tuple[Optional[date], Optional[date], bool]:
-    try:
-        if pd.isna(year):
-            return (None, None, True)
+def date_range_mask(
+    data: pd.DataFrame,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+) -> np.ndarray:
+
+    if data.empty:
+        return np.zeros(0, dtype=bool)
+
+    return DateIntervalIndex.from_data(data).mask(from_date, to_date)
+
+
+class DateIntervalIndex:
+    def __init__(self, case_min: np.ndarray, case_max: np.ndarray, unknown: np.ndarray):
+        self._size = len(unknown)
+        known = np.flatnonzero(~unknown)
+        self._order = known[np.argsort(case_min[known], kind="stable")]
+        self._starts = case_min[self._order]
+        self._ends = case_max[self._order]
+        self._max_end = np.maximum.accumulate(self._ends) if len(self._ends) else self._ends
+        self._unknown = np.flatnonzero(unknown)
+        self._counts: Optional[DateCounts] = None
+
+    @classmethod
+    def from_data(cls, data: pd.DataFrame) -> "DateIntervalIndex":
+        return cls(*case_date_ranges(data))
+
+    def counts(self) -> "DateCounts":
+        if self._counts is None:
+            # Cases that end before MIN_DATE can never match a filter, so they stay out of the histogram.
+            in_range = self._ends >= _day_number(MIN_DATE)
+            self._counts = DateCounts(self._starts[in_range], self._ends[in_range], len(self._unknown), self._size)
+        return self._counts
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def unknown_positions(self) -> np.ndarray:
+        return self._unknown
+
+    def positions(self, from_date: Optional[date] = None, to_date: Optional[date] = None) -> np.ndarray:
+        return np.sort(np.concatenate([self._overlapping(from_date, to_date), self._unknown]))
+
+    def mask(self, from_date: Optional[date] = None, to_date: Optional[date] = None) -> np.ndarray:
+        mask = np.zeros(self._size, dtype=bool)
+        mask[self._unknown] = True
+        mask[self._overlapping(from_date, to_date)] = True
+        return mask
+
+    def _overlapping(self, from_date: Optional[date], to_date: Optional[date]) -> np.ndarray:
+        lo = _day_number(from_date if from_date is not None else MIN_DATE)
+        hi = _day_number(to_date if to_date is not None else MAX_DATE)
+        stop = int(np.searchsorted(self._starts, hi, side="right"))
+        start = int(np.searchsorted(self._max_end, lo, side="left"))
+        if start >= stop:
+            return np.zeros(0, dtype=np.intp)
+        return self._order[start:stop][self._ends[start:stop] >= lo]
+
+
+class DateCounts:
+    def __init__(self, case_min: np.ndarray, case_max: np.ndarray, unknown_count: int, total_count: Optional[int] = None):
+        self.known_count = len(case_min)
+        self.unknown_count = unknown_count
+        self.total_count = self.known_count + unknown_count if total_count is None else total_count
+        if self.known_count:
+            self._first = int(min(case_min.min(), case_max.min()))
+            span = int(max(case_min.max(), case_max.max())) - self._first + 1
+        else:
+            self._first, span = 0, 0
+        self._started = np.cumsum(np.bincount(case_min - self._first, minlength=span), dtype=np.int64)
+        self._ended = np.cumsum(np.bincount(case_max - self._first, minlength=span), dtype=np.int64)
+
+    @property
+    def first_date(self) -> Optional[date]:
+        return _from_day_number(self._first) if self.known_count else None
+
+    @property
+    def last_date(self) -> Optional[date]:
+        return _from_day_number(self._first + len(self._started) - 1) if self.known_count else None
+
+    def count(self, from_date: Optional[date] = None, to_date: Optional[date] = None) -> int:
+        lo = _day_number(from_date) if from_date is not None else self._first
+        hi = _day_number(to_date) if to_date is not None else self._first + len(self._started) - 1
+        if lo > hi:
+            return 0
+        return self.known_count - self._cases_after(hi) - self._cases_ended_before(lo)
+
+    def matching(self, from_date: Optional[date] = None, to_date: Optional[date] = None) -> int:
+        # Rows the applied filter keeps: no window keeps every row, and a window also keeps undated ones.
+        if from_date is None and to_date is None:
+            return self.total_count
+        return self.count(from_date, to_date) + self.unknown_count
+
+    def year_bins(self) -> Tuple[np.ndarray, np.ndarray]:
+        if not self.known_count:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        first, last = self.first_date.year, self.last_date.year
+        years = np.arange(first, last + 1)
+        edges = _month_day_number((np.arange(first, last + 2) - 1970) * 12)
+        return years, self._bin_counts(edges)
+
+    def month_bins(self, first_year: int, last_year: int) -> Tuple[np.ndarray, np.ndarray]:
+        months = np.arange((first_year - 1970) * 12, (last_year - 1969) * 12)
+        edges = _month_day_number(np.append(months, months[-1] + 1))
+        return months.astype('datetime64[M]'), self._bin_counts(edges)
+
+    def _bin_counts(self, edges: np.ndarray) -> np.ndarray:
+        offsets = np.clip(edges - 1 - self._first, -1, len(self._started) - 1)
+        cumulative = np.where(offsets < 0, 0, self._started[np.maximum(offsets, 0)])
+        return np.diff(cumulative)
+
+    def _cases_after(self, day: int) -> int:
+        return self.known_count - self._cumulative(self._started, day)
+
+    def _cases_ended_before(self, day: int) -> int:
+        return self._cumulative(self._ended, day - 1)
+
+    def _cumulative(self, prefix: np.ndarray, day: int) -> int:
+        offset = day - self._first
+        if offset < 0 or not len(prefix):
+            return 0
+        return int(prefix[min(offset, len(prefix) - 1)])
+
+
+def case_date_ranges(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    n = len(data)
+    required_cols = {'year', 'month', 'day'}
+    if not required_cols.issubset(data.columns):
+        logger.warning(f"Missing date columns: {required_cols - set(data.columns)}")
+        empty = np.zeros(n, dtype=np.int64)
+        return empty, empty, np.ones(n, dtype=bool)
+
+    year, bad_year = _numeric(data['year'])
+    month, bad_month = _numeric(data['month'])
+    day, bad_day = _numeric(data['day'])
 
-        year = int(year)
+    # Years that datetime.date cannot hold are unknown; years before MIN_DATE are known but never match.
+    unknown = np.isnan(year) | bad_year | bad_month | (year < date.min.year) | (year > date.max.year)
+    has_month = ~unknown & (month >= 1) & (month <= 12)
+    has_day = has_month & ~np.isnan(day)
+    unknown |= has_month & bad_day
 
-        if pd.isna(month):
-            return (date(year, 1, 1), date(year, 12, 31), False)
+    y = np.where(unknown, 1970, year).astype(np.int64)
+    m = np.where(has_month, month, 1).astype(np.int64)
+    d = np.where(has_day, day, 1).astype(np.int64)
 
-        month = int(month)
-        if not 1 <= month <= 12:
-            return (date(year, 1, 1), date(year, 12, 31), False)
+    month_index = (y - 1970) * 12 + (m - 1)
+    month_start = _month_day_number(month_index)
+    month_days = _month_day_number(month_index + 1) - month_start
+    year_start = _month_day_number((y - 1970) * 12)
+    year_end = _month_day_number((y - 1969) * 12) - 1
 
-        if pd.isna(day):
-            first_day = date(year, month, 1)
-            last_day = _last_day_of_month(year, month)
-            return (first_day, last_day, False)
+    unknown |= has_day & ((d < 1) | (d > month_days))
+    exact = month_start + d - 1
+    case_min = np.where(has_day, exact, np.where(has_month, month_start, year_start))
+    case_max = np.where(has_day, exact, np.where(has_month, month_start + month_days - 1, year_end))
+    return case_min, case_max, unknown
 
-        day = int(day)
-        complete_date = date(year, month, day)
-        return (complete_date, complete_date, False)
-    except (ValueError, OverflowError):
-        return (None, None, True)
 
+def _numeric(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    numeric = pd.to_numeric(values, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    return numeric, values.notna().to_numpy() & np.isnan(numeric)
 
-def _last_day_of_month(year: int, month: int) -> date:
-    if month == 12:
-        return date(year, 12, 31)
-    else:
-        return date(year, month + 1, 1) - timedelta(days=1)
 
+def _month_day_number(month_index: np.ndarray) -> np.ndarray:
+    return month_index.astype('datetime64[M]').astype('datetime64[D]').astype(np.int64)
 
-def _ranges_overlap(
-    case_min: Optional[date],
-    case_max: Optional[date],
-    is_unknown: bool,
-    filter_min: date,
-    filter_max: date,
-) -> bool:
 
-    if is_unknown:
-        return True
+def _day_number(value: date) -> int:
+    return int(np.datetime64(value, 'D').astype(np.int64))
 
-    if case_max < filter_min:
-        return False
 
-    if case_min > filter_max:
-        return False
+def _from_day_number(value: int) -> date:
+    return np.datetime64(value, 'D').item()
 
-    return True
\ No newline at end of file
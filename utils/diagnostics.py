@@ -0,0 +1,25 @@
+from typing import Any, Callable, Dict
+import logging
+
+logger = logging.getLogger(__name__)
+
+_PROVIDERS: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+
+def register_provider(name: str, provider: Callable[[], Dict[str, Any]]) -> None:
+    _PROVIDERS[name] = provider
+
+
+def unregister_provider(name: str) -> None:
+    _PROVIDERS.pop(name, None)
+
+
+def collect() -> Dict[str, Dict[str, Any]]:
+    sections: Dict[str, Dict[str, Any]] = {}
+    for name, provider in list(_PROVIDERS.items()):
+        try:
+            sections[name] = provider()
+        except Exception as e:
+            logger.error(f"Diagnostics provider '{name}' failed: {e}", exc_info=True)
+            sections[name] = {"error": str(e)}
+    return sections
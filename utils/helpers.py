@@ -1,11 +1,13 @@
 import urllib.parse
 import re
 import os
+import tempfile
 from pathlib import Path
 import yaml
 import logging
 from typing import Literal, List, Dict
 import pandas as pd
+from utils.path_index import path_index
 
 logger = logging.getLogger(__name__)
 
@@ -34,15 +36,17 @@ def convert_file_url_to_windows_path(file_url: str) -> str:
     return f"\\\\{rest.replace('/', '\\')}"
 
 def validate_and_resolve_path(file_path: str, fallback_subdir: str = "") -> Path:
+    base_dir = Path(__file__).resolve().parent.parent
+    fallback_dir = base_dir / fallback_subdir if fallback_subdir else base_dir
+    indexed = path_index.resolve(file_path, fallback_dir)
+    if indexed is not None:
+        return indexed
+
     path = Path(file_path)
     if path.exists():
         return path
     
-    base_dir = Path(__file__).resolve().parent.parent
-    if fallback_subdir:
-        fallback = base_dir / fallback_subdir / path.name
-    else:
-        fallback = base_dir / path.name
+    fallback = fallback_dir / path.name
     
     if fallback.exists():
         return fallback
@@ -64,8 +68,14 @@ def load_yaml(path: Path, default=None):
 def save_yaml(path: Path, data: dict):
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
     except (yaml.YAMLError, IOError, OSError) as e:
         logger.error(f"Failed saving YAML '{path}': {e}", exc_info=True)
         raise
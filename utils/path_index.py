@@ -0,0 +1,136 @@
+from __future__ import annotations
+import logging
+import os
+import threading
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CASELAW_DIR = Path(__file__).resolve().parent.parent / "Caselaw"
+
+
+def _norm_dir(directory: str) -> str:
+    return os.path.normcase(os.path.normpath(directory))
+
+
+def _norm_name(name: str) -> str:
+    return os.path.normcase(name)
+
+
+def _is_local(file_path: str) -> bool:
+    return bool(file_path) and "://" not in file_path
+
+
+def case_directories(file_paths: Iterable[str], fallback_dir: Path) -> List[str]:
+    dirs = {str(fallback_dir)}
+    for file_path in file_paths:
+        parent = os.path.dirname(file_path.strip())
+        if parent and "://" not in parent:
+            dirs.add(parent)
+    return sorted(dirs)
+
+
+class PathIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dirs: Dict[str, Set[str]] = {}
+        self._unreachable: Set[str] = set()
+        self._hits = 0
+        self._misses = 0
+        self._scan_s = 0.0
+
+    def build(self, directories: Iterable[str]) -> None:
+        start = perf_counter()
+        dirs: Dict[str, Set[str]] = {}
+        unreachable: Set[str] = set()
+        for directory in directories:
+            names = self._scan(directory)
+            if names is None:
+                unreachable.add(_norm_dir(directory))
+            else:
+                dirs[_norm_dir(directory)] = names
+        with self._lock:
+            self._dirs = dirs
+            self._unreachable = unreachable
+            self._scan_s = perf_counter() - start
+        logger.info(
+            f"Indexed {sum(len(n) for n in dirs.values())} files in {len(dirs)} directories "
+            f"({len(unreachable)} unreachable) in {self._scan_s:.2f}s"
+        )
+
+    def refresh(self, directories: Iterable[str]) -> None:
+        for directory in directories:
+            names = self._scan(directory)
+            key = _norm_dir(directory)
+            with self._lock:
+                if names is None:
+                    self._dirs.pop(key, None)
+                    self._unreachable.add(key)
+                else:
+                    self._dirs[key] = names
+                    self._unreachable.discard(key)
+
+    def directories(self) -> List[str]:
+        with self._lock:
+            return list(self._dirs)
+
+    def resolve(self, file_path: str, fallback_dir: Path) -> Optional[Path]:
+        found = self._lookup(file_path, fallback_dir)
+        with self._lock:
+            if not found:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return found or None
+
+    def missing_mask(self, file_paths: Sequence[str], fallback_dir: Path) -> np.ndarray:
+        return np.fromiter(
+            (_is_local(p) and self._lookup(p, fallback_dir) is False for p in (p.strip() for p in file_paths)),
+            dtype=bool,
+            count=len(file_paths),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "directories": len(self._dirs),
+                "unreachable directories": len(self._unreachable),
+                "files": sum(len(n) for n in self._dirs.values()),
+                "last full scan": f"{self._scan_s:.2f}s",
+                "lookups answered": f"{self._hits}/{lookups}" if lookups else "n/a",
+            }
+
+    def _lookup(self, file_path: str, fallback_dir: Path):
+        # Path when the index knows where the file is, False when it knows the
+        # file is in neither place, None when it cannot tell.
+        parent, name = os.path.split(file_path)
+        name = _norm_name(name)
+        parent = _norm_dir(parent) if parent else ""
+        with self._lock:
+            primary = self._dirs.get(parent)
+            primary_known = primary is not None or parent in self._unreachable
+            fallback_key = _norm_dir(str(fallback_dir))
+            fallback = self._dirs.get(fallback_key)
+            fallback_known = fallback is not None or fallback_key in self._unreachable
+        if primary is not None and name in primary:
+            return Path(file_path)
+        if not primary_known or not fallback_known:
+            return None
+        if fallback is not None and name in fallback:
+            return fallback_dir / os.path.basename(file_path)
+        return False
+
+    @staticmethod
+    def _scan(directory: str) -> Optional[Set[str]]:
+        try:
+            with os.scandir(directory) as entries:
+                return {_norm_name(e.name) for e in entries if e.is_file()}
+        except OSError:
+            return None
+
+
+path_index = PathIndex()